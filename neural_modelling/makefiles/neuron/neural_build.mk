@@ -36,7 +36,8 @@ ifndef PLASTIC_DEBUG
 endif
 
 #POPULATION_TABLE_IMPL := fixed
-POPULATION_TABLE_IMPL := binary_search
+#POPULATION_TABLE_IMPL := hash_table
+POPULATION_TABLE_IMPL ?= binary_search
 
 # Add source directory
 
@@ -222,6 +223,11 @@ $(BUILD_DIR)neuron/population_table/population_table_binary_search_impl.o: $(MOD
 	-mkdir -p $(dir $@)
 	$(SYNAPSE_TYPE_COMPILE) -o $@ $<
 
+$(BUILD_DIR)neuron/population_table/population_table_hash_table_impl.o: $(MODIFIED_DIR)neuron/population_table/population_table_hash_table_impl.c
+	#population_table/population_table_hash_table_impl
+	-mkdir -p $(dir $@)
+	$(SYNAPSE_TYPE_COMPILE) -o $@ $<
+
 #STDP Build rules If and only if STDP used
 ifeq ($(STDP_ENABLED), 1)
     STDP_INCLUDES:= -include $(SYNAPSE_TYPE_H) -include $(WEIGHT_DEPENDENCE_H) -include $(TIMING_DEPENDENCE_H)
@@ -14,7 +14,16 @@ typedef struct timed_out_spikes{
     uint32_t out_spikes[];
 } timed_out_spikes;
 
+// The spikes of a timestep as the index of each spike source that spiked,
+// padded to a whole number of words
+typedef struct sparse_out_spikes{
+    uint32_t time;
+    uint32_t n_spikes;
+    uint8_t indices[];
+} sparse_out_spikes;
+
 static timed_out_spikes *spikes;
+static sparse_out_spikes *sparse_spikes;
 bit_field_t out_spikes;
 static size_t out_spikes_size;
 
@@ -39,6 +48,15 @@ bool out_spikes_initialize(size_t max_spike_sources) {
     }
     out_spikes = &(spikes->out_spikes[0]);
     out_spikes_reset();
+
+    // There is a byte for the index of every bit of the bit field, which
+    // keeps the indices a whole number of words
+    sparse_spikes = (sparse_out_spikes *) spin1_malloc(
+        sizeof(sparse_out_spikes) + (out_spikes_size * 32 * sizeof(uint8_t)));
+    if (sparse_spikes == NULL) {
+        log_error("Out of DTCM when allocating sparse out_spikes");
+        return false;
+    }
     return true;
 }
 
@@ -56,6 +74,32 @@ bool out_spikes_record(
     }
 }
 
+bool out_spikes_record_sparse(
+        uint8_t channel, uint32_t time, uint32_t n_sources,
+        recording_complete_callback_t callback) {
+    uint32_t n_spikes = 0;
+    uint32_t n_words = get_bit_field_size(n_sources);
+    for (index_t i = 0; i < n_words; i++) {
+        uint32_t bits = out_spikes[i];
+        for (index_t index = i << 5; bits != 0; index++, bits >>= 1) {
+            if ((bits & 1) && (index < n_sources)) {
+                sparse_spikes->indices[n_spikes++] = index;
+            }
+        }
+    }
+    if (n_spikes == 0) {
+        return false;
+    }
+    sparse_spikes->time = time;
+    sparse_spikes->n_spikes = n_spikes;
+    uint32_t n_index_words = (n_spikes + 3) >> 2;
+    recording_record_and_notify(
+        channel, sparse_spikes,
+        sizeof(sparse_out_spikes) + (n_index_words * sizeof(uint32_t)),
+        callback);
+    return true;
+}
+
 //! \brief Check if any spikes have been recorded
 //! \return True if no spikes have been recorded, false otherwise
 bool out_spikes_is_empty() {
@@ -17,6 +17,9 @@
  *           active are handed to this method due to recording not containing
  *           them itself). TODO change the recording.h and recording.c to
  *           contain the channels itself.
+ *     - out_spikes_record_sparse
+ *          records the indices of the spike sources that have spiked, rather
+ *          than the flags of all of them, which is smaller when few spike
  *     - out_spikes_is_empty
  *          helper method which checks if the current spikes flags have any
  *          recorded for use.
@@ -62,6 +65,21 @@ bool out_spikes_record(
     uint8_t channel, uint32_t time, uint32_t n_words,
     recording_complete_callback_t callback);
 
+//! \brief flush the recorded spikes as the time, the number of spikes and
+//!        the index of each spike source that has spiked, as a byte each,
+//!        padded to a whole number of words; this is smaller than the bit
+//!        field when few of the spike sources spike
+//! \param[in] channel The channel to record to
+//! \param[in] time The time at which the recording is being made
+//! \param[in] n_sources The number of spike sources being recorded; any
+//!                      spikes of higher indices are not recorded
+//! \param[in] callback Callback to call when the recording is done
+//                      (can be NULL)
+//! \return True if there were spikes to record, false otherwise
+bool out_spikes_record_sparse(
+    uint8_t channel, uint32_t time, uint32_t n_sources,
+    recording_complete_callback_t callback);
+
 //! \brief Check if any spikes have been recorded
 //! \return True if no spikes have been recorded, false otherwise
 bool out_spikes_is_empty();
@@ -28,9 +28,16 @@ static uint32_t n_neurons;
 //! Number of timesteps between spike recordings
 static uint32_t spike_recording_rate;
 
-//! Number of neurons recording spikes
+//! Number of words in the bit field of the neurons recording spikes
 static uint32_t n_spike_recording_words;
 
+//! Number of neurons recording spikes
+static uint32_t n_spike_recording_neurons;
+
+//! Whether spikes are recorded as a list of the neurons that spiked, rather
+//! than as a bit field of all the neurons recording spikes
+static bool spike_recording_sparse;
+
 //! Count of timesteps until next spike recording
 static uint32_t spike_recording_count;
 
@@ -125,9 +132,10 @@ static bool _neuron_load_neuron_parameters(address_t address) {
     uint32_t n_words_for_n_neurons = (n_neurons + 3) >> 2;
 
     // Load spike recording details
+    spike_recording_sparse = address[next++];
     spike_recording_rate = address[next++];
-    uint32_t n_neurons_recording_spikes = address[next++];
-    n_spike_recording_words = get_bit_field_size(n_neurons_recording_spikes);
+    n_spike_recording_neurons = address[next++];
+    n_spike_recording_words = get_bit_field_size(n_spike_recording_neurons);
     spin1_memcpy(
         spike_recording_indexes, &address[next], n_neurons * sizeof(uint8_t));
     next += n_words_for_n_neurons;
@@ -275,7 +283,7 @@ void neuron_store_neuron_parameters(address_t address){
     uint32_t next = START_OF_GLOBAL_PARAMETERS;
 
     uint32_t n_words_for_n_neurons = (n_neurons + 3) >> 2;
-    next += (n_words_for_n_neurons + 2) * (n_recorded_vars + 1);
+    next += 1 + ((n_words_for_n_neurons + 2) * (n_recorded_vars + 1));
 
     // call neuron implementation function to do the work
     neuron_impl_store_neuron_parameters(address, next, n_neurons);
@@ -381,9 +389,17 @@ void neuron_do_timestep_update(timer_t time) {
     // Record any spikes this timestep
     if (spike_recording_count == spike_recording_rate) {
         spike_recording_count = 1;
-        if (out_spikes_record(
+        bool recorded;
+        if (spike_recording_sparse) {
+            recorded = out_spikes_record_sparse(
+                SPIKE_RECORDING_CHANNEL, time, n_spike_recording_neurons,
+                recording_done_callback);
+        } else {
+            recorded = out_spikes_record(
                 SPIKE_RECORDING_CHANNEL, time, n_spike_recording_words,
-                recording_done_callback)) {
+                recording_done_callback);
+        }
+        if (recorded) {
             n_recordings_outstanding += 1;
         }
     } else {
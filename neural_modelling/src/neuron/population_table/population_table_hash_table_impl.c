@@ -0,0 +1,250 @@
+#include "population_table.h"
+#include <neuron/synapse_row.h>
+#include <debug.h>
+
+//! The multiplier of the Fibonacci hash of a key (2^32 / golden ratio)
+#define HASH_MULTIPLIER 0x9E3779B1
+
+typedef struct master_population_table_entry {
+    uint32_t key;
+    uint32_t mask;
+    uint16_t start;
+    uint16_t count;
+} master_population_table_entry;
+
+typedef uint32_t address_and_row_length;
+
+typedef struct hash_table_header {
+    uint32_t n_entries;
+    uint32_t n_addresses;
+    uint32_t n_bucket_bits;
+    uint32_t hash_mask;
+    uint32_t data[];
+} hash_table_header;
+
+static master_population_table_entry *master_population_table;
+static uint32_t master_population_table_length;
+static uint32_t *bucket_starts;
+static uint32_t bucket_shift;
+static uint32_t hash_mask;
+static address_and_row_length *address_list;
+static address_t synaptic_rows_base_address;
+static address_t direct_rows_base_address;
+
+static uint32_t last_neuron_id = 0;
+static uint16_t next_item = 0;
+static uint16_t items_to_go = 0;
+
+static inline uint32_t _get_direct_address(address_and_row_length entry) {
+
+    // Direct row address is just the direct address bit
+    return (entry & 0x7FFFFF00) >> 8;
+}
+
+static inline uint32_t _get_address(address_and_row_length entry) {
+
+    // The address is in units of 16 bytes in the top 23-bits but 1, so down
+    // shift by 8 and then up shift by 4 to get the address in bytes
+    return (entry & 0x7FFFFF00) >> 4;
+}
+
+static inline uint32_t _get_row_length(address_and_row_length entry) {
+    return entry & 0xFF;
+}
+
+static inline uint32_t _is_single(address_and_row_length entry) {
+    return entry & 0x80000000;
+}
+
+static inline uint32_t _get_neuron_id(
+        master_population_table_entry entry, spike_t spike) {
+    return spike & ~entry.mask;
+}
+
+static inline uint32_t _get_bucket(spike_t spike) {
+    return ((spike & hash_mask) * HASH_MULTIPLIER) >> bucket_shift;
+}
+
+static inline void _print_master_population_table() {
+    log_info("master_population\n");
+    log_info("------------------------------------------\n");
+    log_info(
+        "hash mask: 0x%.8x, n buckets: %u\n", hash_mask,
+        1 << (32 - bucket_shift));
+    for (uint32_t i = 0; i < master_population_table_length; i++) {
+        master_population_table_entry entry = master_population_table[i];
+        for (uint16_t j = entry.start; j < (entry.start + entry.count); j++) {
+            if (!_is_single(address_list[j])) {
+                log_info(
+                    "index (%d, %d), key: 0x%.8x, mask: 0x%.8x,"
+                    " bucket: %u, offset: 0x%.8x, address: 0x%.8x,"
+                    " row_length: %u\n",
+                    i, j, entry.key, entry.mask, _get_bucket(entry.key),
+                    _get_address(address_list[j]),
+                    _get_address(address_list[j]) +
+                        (uint32_t) synaptic_rows_base_address,
+                    _get_row_length(address_list[j]));
+            } else {
+                log_info(
+                    "index (%d, %d), key: 0x%.8x, mask: 0x%.8x,"
+                    " bucket: %u, offset: 0x%.8x, address: 0x%.8x, single",
+                    i, j, entry.key, entry.mask, _get_bucket(entry.key),
+                    _get_direct_address(address_list[j]),
+                    _get_direct_address(address_list[j]) +
+                        (uint32_t) direct_rows_base_address);
+            }
+        }
+    }
+    log_info("------------------------------------------\n");
+}
+
+static inline void *_copy_to_dtcm(void *source, uint32_t n_bytes) {
+    if (n_bytes == 0) {
+        return NULL;
+    }
+    void *target = spin1_malloc(n_bytes);
+    if (target != NULL) {
+        spin1_memcpy(target, source, n_bytes);
+    }
+    return target;
+}
+
+bool population_table_initialise(
+        address_t table_address, address_t synapse_rows_address,
+        address_t direct_rows_address, uint32_t *row_max_n_words) {
+    log_debug("population_table_initialise: starting");
+
+    hash_table_header *header = (hash_table_header *) table_address;
+    master_population_table_length = header->n_entries;
+    hash_mask = header->hash_mask;
+    bucket_shift = 32 - header->n_bucket_bits;
+
+    uint32_t n_bucket_bytes =
+        ((1 << header->n_bucket_bits) + 1) * sizeof(uint32_t);
+    uint32_t n_master_pop_bytes =
+        master_population_table_length * sizeof(master_population_table_entry);
+    uint32_t n_address_list_bytes =
+        header->n_addresses * sizeof(address_and_row_length);
+    log_debug(
+        "buckets: %u bytes, pop table size: %u (%u bytes),"
+        " address list size: %u (%u bytes)", n_bucket_bytes,
+        master_population_table_length, n_master_pop_bytes,
+        header->n_addresses, n_address_list_bytes);
+
+    // Copy the buckets, the master population table and the address list
+    uint8_t *data = (uint8_t *) header->data;
+    bucket_starts = _copy_to_dtcm(data, n_bucket_bytes);
+    if (bucket_starts == NULL) {
+        log_error("Could not allocate master population table buckets");
+        return false;
+    }
+    data += n_bucket_bytes;
+    master_population_table = _copy_to_dtcm(data, n_master_pop_bytes);
+    if (n_master_pop_bytes != 0 && master_population_table == NULL) {
+        log_error("Could not allocate master population table");
+        return false;
+    }
+    data += n_master_pop_bytes;
+    address_list = _copy_to_dtcm(data, n_address_list_bytes);
+    if (n_address_list_bytes != 0 && address_list == NULL) {
+        log_error("Could not allocate master population address list");
+        return false;
+    }
+
+    // Store the base address
+    log_info(
+        "the stored synaptic matrix base address is located at: 0x%08x",
+        synapse_rows_address);
+    log_info(
+        "the direct synaptic matrix base address is located at: 0x%08x",
+        direct_rows_address);
+    synaptic_rows_base_address = synapse_rows_address;
+    direct_rows_base_address = direct_rows_address;
+
+    *row_max_n_words = 0xFF + N_SYNAPSE_ROW_HEADER_WORDS;
+
+    _print_master_population_table();
+    return true;
+}
+
+bool population_table_get_first_address(
+        spike_t spike, address_t* row_address, size_t* n_bytes_to_transfer) {
+    uint32_t bucket = _get_bucket(spike);
+    uint32_t end = bucket_starts[bucket + 1];
+
+    for (uint32_t i = bucket_starts[bucket]; i < end; i++) {
+        master_population_table_entry entry = master_population_table[i];
+        if ((spike & entry.mask) == entry.key) {
+            if (entry.count == 0) {
+                log_debug(
+                    "spike %u (= %x): population found in master population"
+                    "table but count is 0");
+            }
+
+            last_neuron_id = _get_neuron_id(entry, spike);
+            next_item = entry.start;
+            items_to_go = entry.count;
+
+            log_debug(
+                "spike = %08x, bucket = %u, entry_index = %u, start = %u,"
+                " count = %u", spike, bucket, i, next_item, items_to_go);
+
+            return population_table_get_next_address(
+                row_address, n_bytes_to_transfer);
+        }
+    }
+    log_debug(
+        "spike %u (= %x): population not found in master population table",
+        spike, spike);
+    return false;
+}
+
+bool population_table_get_next_address(
+        address_t* row_address, size_t* n_bytes_to_transfer) {
+
+    // If there are no more items in the list, return false
+    if (items_to_go <= 0) {
+        return false;
+    }
+
+    bool is_valid = false;
+    do {
+        address_and_row_length item = address_list[next_item];
+
+        // If the row is a direct row, indicate this by specifying the
+        // n_bytes_to_transfer is 0
+        if (_is_single(item)) {
+            *row_address = (address_t) (
+                _get_direct_address(item) +
+                (uint32_t) direct_rows_base_address +
+                (last_neuron_id * sizeof(uint32_t)));
+            *n_bytes_to_transfer = 0;
+            is_valid = true;
+        } else {
+
+            uint32_t row_length = _get_row_length(item);
+            if (row_length > 0) {
+
+                uint32_t block_address =
+                    _get_address(item) + (uint32_t) synaptic_rows_base_address;
+                uint32_t stride = (row_length + N_SYNAPSE_ROW_HEADER_WORDS);
+                uint32_t neuron_offset =
+                    last_neuron_id * stride * sizeof(uint32_t);
+
+                *row_address = (address_t) (block_address + neuron_offset);
+                *n_bytes_to_transfer = stride * sizeof(uint32_t);
+                log_debug(
+                    "neuron_id = %u, block_address = 0x%.8x,"
+                    "row_length = %u, row_address = 0x%.8x, n_bytes = %u",
+                    last_neuron_id, block_address, row_length, *row_address,
+                    *n_bytes_to_transfer);
+                is_valid = true;
+            }
+        }
+
+        next_item += 1;
+        items_to_go -= 1;
+    } while (!is_valid && (items_to_go > 0));
+
+    return is_valid;
+}
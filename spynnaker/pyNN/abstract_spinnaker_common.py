@@ -103,6 +103,8 @@ class AbstractSpiNNakerCommon(AbstractSpinnakerBase,
         extra_mapping_inputs['CreateAtomToEventIdMapping'] = \
             self.config.getboolean(
                 "Database", "create_routing_info_to_neuron_id_mapping")
+        extra_mapping_inputs['NDataSpecificationProcesses'] = \
+            self.config.getint("Mapping", "n_data_specification_processes")
         if user_extra_mapping_inputs is not None:
             extra_mapping_inputs.update(user_extra_mapping_inputs)
 
@@ -124,6 +126,10 @@ class AbstractSpiNNakerCommon(AbstractSpinnakerBase,
                 extra_algorithms_pre_run.append("SynapticMatrixReport")
         if user_extra_algorithms_pre_run is not None:
             extra_algorithms_pre_run.extend(user_extra_algorithms_pre_run)
+        if self.config.getboolean("Recording", "measure_recording_usage"):
+            if extra_post_run_algorithms is None:
+                extra_post_run_algorithms = []
+            extra_post_run_algorithms.append("RecordingUsageGatherer")
 
         self.update_extra_mapping_inputs(extra_mapping_inputs)
         self.extend_extra_mapping_algorithms(extra_mapping_algorithms)
@@ -1,6 +1,7 @@
 from .abstract_accepts_incoming_synapses import AbstractAcceptsIncomingSynapses
 from .abstract_contains_units import AbstractContainsUnits
 from .abstract_filterable_edge import AbstractFilterableEdge
+from .abstract_measures_recording_usage import AbstractMeasuresRecordingUsage
 from .abstract_population_initializable import AbstractPopulationInitializable
 from .abstract_population_settable import AbstractPopulationSettable
 from .abstract_read_parameters_before_set \
@@ -9,6 +10,7 @@ from .abstract_settable import AbstractSettable
 from .abstract_weight_updatable import AbstractWeightUpdatable
 
 __all__ = ["AbstractAcceptsIncomingSynapses", "AbstractContainsUnits",
-           "AbstractFilterableEdge", "AbstractPopulationInitializable",
+           "AbstractFilterableEdge", "AbstractMeasuresRecordingUsage",
+           "AbstractPopulationInitializable",
            "AbstractPopulationSettable", "AbstractReadParametersBeforeSet",
            "AbstractSettable", "AbstractWeightUpdatable"]
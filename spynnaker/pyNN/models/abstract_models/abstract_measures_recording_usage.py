@@ -0,0 +1,40 @@
+from six import add_metaclass
+from spinn_utilities.abstract_base import AbstractBase, abstractmethod
+
+
+@add_metaclass(AbstractBase)
+class AbstractMeasuresRecordingUsage(object):
+    """ A vertex whose recording regions can be measured after a run against\
+        the space reserved for them
+    """
+
+    __slots__ = ()
+
+    @abstractmethod
+    def get_recording_sdram_per_timestep(
+            self, vertex_slice, n_machine_time_steps, machine_time_step):
+        """ Get the space reserved per timestep for each recording region of\
+            a machine vertex
+
+        :param vertex_slice: the slice of atoms of the machine vertex
+        :param n_machine_time_steps: the number of timesteps of the run
+        :param machine_time_step: the machine time step in microseconds
+        :return: the bytes reserved per timestep, indexed by region ID
+        :rtype: list(int)
+        """
+
+    @abstractmethod
+    def get_recording_usage_key(
+            self, vertex_slice, n_machine_time_steps, machine_time_step):
+        """ Get a key that identifies the recording of a machine vertex\
+            between runs and scripts, so that the space it is measured to use\
+            can be kept and used to size its recording regions later.  As\
+            the space is measured per timestep over the whole run, the key\
+            includes the number of timesteps.
+
+        :param vertex_slice: the slice of atoms of the machine vertex
+        :param n_machine_time_steps: the number of timesteps of the run
+        :param machine_time_step: the machine time step in microseconds
+        :return: the key, or None if the measurements are not to be kept
+        :rtype: str or None
+        """
@@ -1,5 +1,6 @@
 from .abstract_neuron_recordable import AbstractNeuronRecordable
 from .abstract_spike_recordable import AbstractSpikeRecordable
+from .abstract_windowed_recordable import AbstractWindowedRecordable
 from .eieio_spike_recorder import EIEIOSpikeRecorder
 from .neuron_recorder import NeuronRecorder
 from .multi_spike_recorder import MultiSpikeRecorder
@@ -8,7 +9,8 @@ from .recording_utils import get_buffer_sizes, get_data, \
 from .simple_population_settable import SimplePopulationSettable
 
 __all__ = ["AbstractNeuronRecordable", "AbstractSpikeRecordable",
-           "EIEIOSpikeRecorder", "NeuronRecorder", "MultiSpikeRecorder",
+           "AbstractWindowedRecordable", "EIEIOSpikeRecorder",
+           "NeuronRecorder", "MultiSpikeRecorder",
            "SimplePopulationSettable", "get_buffer_sizes", "get_data",
            "needs_buffering", "get_recording_region_size_in_bytes",
            "pull_off_cached_lists", ]
@@ -0,0 +1,122 @@
+from six import add_metaclass
+
+from spinn_utilities.abstract_base import AbstractBase, abstractmethod
+
+
+@add_metaclass(AbstractBase)
+class AbstractWindowedRecordable(object):
+    """ Indicates that the recorded spikes and variables of this object can\
+        be read for a range of neurons in a window of time, a core at a\
+        time, and reduced as they are read, without building the whole\
+        recording in memory
+    """
+
+    __slots__ = ()
+
+    @abstractmethod
+    def get_spikes_in_window(
+            self, placements, graph_mapper, buffer_manager, machine_time_step,
+            neuron_range=None, time_range=None):
+        """ Get the spikes of the neurons in a range of IDs in a window of\
+            time, reading only the cores of those neurons
+
+        :param neuron_range:\
+            The (start, stop) IDs of the neurons, with stop excluded, or None\
+            for all the neurons
+        :param time_range:\
+            The (start, stop) times in milliseconds, with stop excluded, or\
+            None for the whole run
+        """
+
+    @abstractmethod
+    def get_spike_counts(
+            self, placements, graph_mapper, buffer_manager, machine_time_step,
+            neuron_range=None, time_range=None):
+        """ Count the spikes of each neuron, a core at a time, without\
+            building the list of all the spikes
+
+        :param neuron_range:\
+            The (start, stop) IDs of the neurons, with stop excluded, or None\
+            for all the neurons
+        :param time_range:\
+            The (start, stop) times in milliseconds, with stop excluded, or\
+            None for the whole run
+        :return: the number of spikes of each neuron of the population
+        """
+
+    @abstractmethod
+    def get_spike_histogram(
+            self, bin_width, n_machine_time_steps, placements, graph_mapper,
+            buffer_manager, machine_time_step, neuron_range=None,
+            time_range=None):
+        """ Count the spikes of the neurons in each of a number of bins of\
+            time, a core at a time, without building the list of all the\
+            spikes
+
+        :param bin_width: the width of each bin in milliseconds
+        :param neuron_range:\
+            The (start, stop) IDs of the neurons, with stop excluded, or None\
+            for all the neurons
+        :param time_range:\
+            The (start, stop) times in milliseconds of the bins, with stop\
+            excluded, or None for the whole run
+        :return: the number of spikes in each bin, and the start time of\
+            each bin
+        """
+
+    @abstractmethod
+    def get_data_in_window(
+            self, variable, n_machine_time_steps, placements, graph_mapper,
+            buffer_manager, machine_time_step, neuron_range=None,
+            time_range=None):
+        """ Get the data of a variable of the neurons in a range of IDs in a\
+            window of time, reading only the cores of those neurons
+
+        :param neuron_range:\
+            The (start, stop) IDs of the neurons, with stop excluded, or None\
+            for all the neurons
+        :param time_range:\
+            The (start, stop) times in milliseconds, with stop excluded, or\
+            None for the whole run
+        """
+
+    @abstractmethod
+    def export_data(
+            self, variable, filename, n_machine_time_steps, placements,
+            graph_mapper, buffer_manager, machine_time_step,
+            neuron_range=None, time_range=None):
+        """ Write the data of a variable, or the spikes, of the neurons in a\
+            range of IDs in a window of time straight to files, a core at a\
+            time, so that the data does not have to fit in memory
+
+        :param filename: the base name of the files to write; see\
+            :py:mod:`spynnaker.pyNN.models.common.recording_export`
+        :param neuron_range:\
+            The (start, stop) IDs of the neurons, with stop excluded, or None\
+            for all the neurons
+        :param time_range:\
+            The (start, stop) times in milliseconds, with stop excluded, or\
+            None for the whole run
+        """
+
+    @abstractmethod
+    def get_data_statistics(
+            self, variable, window, n_machine_time_steps, placements,
+            graph_mapper, buffer_manager, machine_time_step,
+            neuron_range=None, time_range=None):
+        """ Get the mean and variance of a variable of each neuron in each\
+            of a number of windows of time, a core at a time, without\
+            building the matrix of all the data
+
+        :param window: the length of each window in milliseconds, or None\
+            for one window of the whole time range
+        :param neuron_range:\
+            The (start, stop) IDs of the neurons, with stop excluded, or None\
+            for all the neurons
+        :param time_range:\
+            The (start, stop) times in milliseconds, with stop excluded, or\
+            None for the whole run
+        :return: the mean and variance of each window (rows) and neuron\
+            (columns), the neuron IDs of the columns, and the start time of\
+            each window
+        """
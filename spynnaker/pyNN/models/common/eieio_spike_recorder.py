@@ -8,7 +8,8 @@ import struct
 import logging
 
 logger = FormatAdapter(logging.getLogger(__name__))
-_ONE_WORD = struct.Struct("<I")
+# The length and time of a packet, and the count and flags of its header
+_PACKET_HEADER = struct.Struct("<IIBB")
 
 
 class EIEIOSpikeRecorder(object):
@@ -47,7 +48,12 @@ class EIEIOSpikeRecorder(object):
 
     def get_spikes(self, label, buffer_manager, region,
                    placements, graph_mapper, application_vertex,
-                   base_key_function, machine_time_step):
+                   base_key_function, machine_time_step, n_threads=1):
+        """ Read the spikes recorded from the SpiNNaker machine
+
+        :param n_threads: the number of threads to decode the spikes of the\
+            machine vertices with
+        """
         # pylint: disable=too-many-arguments
         results = list()
         missing = []
@@ -55,7 +61,8 @@ class EIEIOSpikeRecorder(object):
         vertices = graph_mapper.get_machine_vertices(application_vertex)
         progress = ProgressBar(vertices,
                                "Getting spikes for {}".format(label))
-        for vertex in progress.over(vertices):
+
+        def read(vertex):
             placement = placements.get_placement_of_vertex(vertex)
             vertex_slice = graph_mapper.get_slice(vertex)
 
@@ -64,9 +71,19 @@ class EIEIOSpikeRecorder(object):
                 buffer_manager.get_data_for_vertex(placement, region)
             if data_missing:
                 missing.append(placement)
+            return (vertex_slice, raw_spike_data.read_all(),
+                    base_key_function(vertex))
+
+        def decode(vertex_slice, spike_data, base_key):
+            vertex_results = list()
             self._process_spike_data(
-                vertex_slice, raw_spike_data.read_all(), ms_per_tick,
-                base_key_function(vertex), results)
+                vertex_slice, spike_data, ms_per_tick, base_key,
+                vertex_results)
+            return vertex_results
+
+        for vertex_results in recording_utils.decode_in_threads(
+                progress.over(vertices), read, decode, n_threads):
+            results.extend(vertex_results)
 
         if missing:
             missing_str = recording_utils.make_missing_string(missing)
@@ -82,25 +99,47 @@ class EIEIOSpikeRecorder(object):
     def _process_spike_data(
             vertex_slice, spike_data, ms_per_tick, base_key, results):
         number_of_bytes_written = len(spike_data)
+
+        # Locate the keys of each packet; the size of the header of a packet
+        # depends only on its flags, so each distinct header is only decoded
+        # once
+        header_sizes = dict()
+        data_offsets = list()
+        counts = list()
+        times = list()
+        key_bytes = list()
         offset = 0
         while offset < number_of_bytes_written:
-            length = _ONE_WORD.unpack_from(spike_data, offset)[0]
-            time = _ONE_WORD.unpack_from(spike_data, offset + 4)[0]
-            time *= ms_per_tick
+            length, time, count, flags = _PACKET_HEADER.unpack_from(
+                spike_data, offset)
             data_offset = offset + 8
-
-            eieio_header = EIEIODataHeader.from_bytestring(
-                spike_data, data_offset)
-            if eieio_header.eieio_type.payload_bytes > 0:
-                raise Exception("Can only read spikes as keys")
-
-            data_offset += eieio_header.size
-            timestamps = numpy.repeat([time], eieio_header.count)
-            key_bytes = eieio_header.eieio_type.key_bytes
-            keys = numpy.frombuffer(
-                spike_data, dtype="<u{}".format(key_bytes),
-                count=eieio_header.count, offset=data_offset)
-
-            neuron_ids = (keys - base_key) + vertex_slice.lo_atom
+            if flags not in header_sizes:
+                eieio_header = EIEIODataHeader.from_bytestring(
+                    spike_data, data_offset)
+                if eieio_header.eieio_type.payload_bytes > 0:
+                    raise Exception("Can only read spikes as keys")
+                header_sizes[flags] = (
+                    eieio_header.size, eieio_header.eieio_type.key_bytes)
+            header_size, n_key_bytes = header_sizes[flags]
+            data_offsets.append(data_offset + header_size)
+            counts.append(count)
+            times.append(time)
+            key_bytes.append(n_key_bytes)
             offset += length + 8
+        if not data_offsets:
+            return
+
+        # Gather the keys of all the packets with each size of key together
+        data = numpy.frombuffer(spike_data, dtype="uint8")
+        data_offsets = numpy.array(data_offsets)
+        counts = numpy.array(counts, dtype="int64")
+        times = numpy.array(times) * ms_per_tick
+        key_bytes = numpy.array(key_bytes)
+        for n_key_bytes in numpy.unique(key_bytes):
+            packets = key_bytes == n_key_bytes
+            keys = data[recording_utils.get_ragged_indices(
+                data_offsets[packets], counts[packets] * n_key_bytes)].view(
+                    "<u{}".format(n_key_bytes))
+            timestamps = numpy.repeat(times[packets], counts[packets])
+            neuron_ids = (keys - base_key) + vertex_slice.lo_atom
             results.append(numpy.dstack((neuron_ids, timestamps))[0])
@@ -48,7 +48,13 @@ class MultiSpikeRecorder(object):
 
     def get_spikes(
             self, label, buffer_manager, region,
-            placements, graph_mapper, application_vertex, machine_time_step):
+            placements, graph_mapper, application_vertex, machine_time_step,
+            n_threads=1):
+        """ Read the spikes recorded from the SpiNNaker machine
+
+        :param n_threads: the number of threads to decode the spikes of the\
+            machine vertices with
+        """
         # pylint: disable=too-many-arguments
         spike_times = list()
         spike_ids = list()
@@ -58,7 +64,8 @@ class MultiSpikeRecorder(object):
         missing = []
         progress = ProgressBar(
             vertices, "Getting spikes for {}".format(label))
-        for vertex in progress.over(vertices):
+
+        def read(vertex):
             placement = placements.get_placement_of_vertex(vertex)
             vertex_slice = graph_mapper.get_slice(vertex)
 
@@ -67,10 +74,21 @@ class MultiSpikeRecorder(object):
                 buffer_manager.get_data_for_vertex(placement, region)
             if data_missing:
                 missing.append(placement)
+            return (vertex_slice, neuron_param_region.read_all())
+
+        def decode(vertex_slice, raw_data):
+            vertex_ids = list()
+            vertex_times = list()
             self._process_spike_data(
                 vertex_slice, ms_per_tick,
-                int(math.ceil(vertex_slice.n_atoms / 32.0)),
-                neuron_param_region.read_all(), spike_ids, spike_times)
+                int(math.ceil(vertex_slice.n_atoms / 32.0)), raw_data,
+                vertex_ids, vertex_times)
+            return vertex_ids, vertex_times
+
+        for vertex_ids, vertex_times in recording_utils.decode_in_threads(
+                progress.over(vertices), read, decode, n_threads):
+            spike_ids.extend(vertex_ids)
+            spike_times.extend(vertex_times)
 
         if missing:
             logger.warning(
@@ -92,20 +110,34 @@ class MultiSpikeRecorder(object):
             spike_times):
         # pylint: disable=too-many-arguments
         n_bytes_per_block = n_words * 4
+
+        # Locate the (time, number of blocks) header of each timestep; the
+        # headers must be found in order as the blocks vary in number
+        data_offsets = list()
+        block_times = list()
+        block_counts = list()
         offset = 0
         while offset < len(raw_data):
             time, n_blocks = _TWO_WORDS.unpack_from(raw_data, offset)
             offset += _TWO_WORDS.size
-            spike_data = numpy.frombuffer(
-                raw_data, dtype="uint8",
-                count=n_bytes_per_block * n_blocks, offset=offset)
+            data_offsets.append(offset)
+            block_times.append(time)
+            block_counts.append(n_blocks)
             offset += n_bytes_per_block * n_blocks
-
-            spikes = spike_data.view("<i4").byteswap().view("uint8")
-            bits = numpy.fliplr(numpy.unpackbits(spikes).reshape(
-                (-1, 32))).reshape((-1, n_bytes_per_block * 8))
-            indices = numpy.nonzero(bits)[1]
-            times = numpy.repeat([time * ms_per_tick], len(indices))
-            indices = indices + vertex_slice.lo_atom
-            spike_ids.append(indices)
-            spike_times.append(times)
+        if not data_offsets:
+            return
+
+        # Gather the words of all the blocks, and unpack them together
+        words = numpy.frombuffer(
+            raw_data, dtype="<i4", count=len(raw_data) // 4)
+        block_counts = numpy.array(block_counts, dtype="int64")
+        spike_data = words[recording_utils.get_ragged_indices(
+            numpy.array(data_offsets) // 4, block_counts * n_words)]
+        spikes = spike_data.byteswap().view("uint8")
+        bits = numpy.fliplr(numpy.unpackbits(spikes).reshape(
+            (-1, 32))).reshape((-1, n_bytes_per_block * 8))
+        blocks, indices = numpy.nonzero(bits)
+        times = numpy.repeat(
+            numpy.array(block_times) * ms_per_tick, block_counts)[blocks]
+        spike_ids.append(indices + vertex_slice.lo_atom)
+        spike_times.append(times)
@@ -2,6 +2,7 @@ from __future__ import division
 from collections import OrderedDict
 import logging
 import math
+import struct
 import numpy
 from six import iteritems, raise_from
 from six.moves import range, xrange
@@ -12,11 +13,18 @@ from spinn_front_end_common.utilities import globals_variables
 from spinn_utilities.index_is_value import IndexIsValue
 from spinn_utilities.progress_bar import ProgressBar
 from spynnaker.pyNN.models.neural_properties import NeuronParameter
+from spynnaker.pyNN.models.common import recording_export
+from spynnaker.pyNN.models.common import recording_statistics
+from spynnaker.pyNN.models.common import recording_utils
 
 logger = logging.getLogger(__name__)
 
 SPIKES = "spikes"
 
+_TWO_WORDS = struct.Struct("<II")
+
+MICROSECONDS_PER_SECOND = 1000000.0
+
 
 class NeuronRecorder(object):
     N_BYTES_FOR_TIMESTAMP = 4
@@ -29,33 +37,61 @@ class NeuronRecorder(object):
     N_BYTES_PER_POINTER = 4
     MAX_RATE = 2 ** 32 - 1  # To allow a unit32_t to be used to store the rate
 
-    def __init__(self, allowed_variables, n_neurons):
+    # The number of standard deviations above the expected number of spikes
+    # of each record of spikes recorded sparsely to reserve space for
+    SPARSE_SPIKES_N_SIGMA = 3
+
+    def __init__(self, allowed_variables, n_neurons, sparse_spike_rate=None):
+        """
+        :param allowed_variables: the variables that can be recorded
+        :param n_neurons: the number of neurons
+        :param sparse_spike_rate:\
+            the rate in spikes per second expected of each neuron, to record\
+            spikes as a list of the neurons that spike in each timestep and\
+            reserve space for them at that rate, or None to record spikes\
+            as a bit per neuron recording spikes
+        """
         self._sampling_rates = OrderedDict()
         self._indexes = dict()
         self._n_neurons = n_neurons
+        self._sparse_spike_rate = sparse_spike_rate
         for variable in allowed_variables:
             self._sampling_rates[variable] = 0
             self._indexes[variable] = None
 
+    def _sorted_indexes(self, variable):
+        """ Get the indexes of the neurons recording a variable as a sorted\
+            numpy array, or None if all the neurons are recording it
+        """
+        if self._indexes[variable] is None:
+            return None
+        return numpy.sort(numpy.asarray(self._indexes[variable], "int64"))
+
+    @staticmethod
+    def _slice_indexes(sorted_indexes, vertex_slice):
+        """ Get the sorted indexes that are in a slice
+        """
+        start, end = numpy.searchsorted(
+            sorted_indexes, [vertex_slice.lo_atom, vertex_slice.hi_atom + 1])
+        return sorted_indexes[start:end]
+
     def _count_recording_per_slice(self, variable, vertex_slice):
         if self._sampling_rates[variable] == 0:
             return 0
         if self._indexes[variable] is None:
             return vertex_slice.n_atoms
-        return sum(vertex_slice.lo_atom <= index <= vertex_slice.hi_atom
-                   for index in self._indexes[variable])
+        return len(self._slice_indexes(
+            self._sorted_indexes(variable), vertex_slice))
 
     def _neurons_recording(self, variable, vertex_slice):
         if self._sampling_rates[variable] == 0:
             return []
         if self._indexes[variable] is None:
-            return range(vertex_slice.lo_atom, vertex_slice.hi_atom+1)
-        recording = []
-        indexes = self._indexes[variable]
-        for index in xrange(vertex_slice.lo_atom, vertex_slice.hi_atom+1):
-            if index in indexes:
-                recording.append(index)
-        return recording
+            # A list rather than a range, as the neurons are sliced, which
+            # the range of Python 2 doesn't support
+            return list(range(vertex_slice.lo_atom, vertex_slice.hi_atom+1))
+        return numpy.unique(self._slice_indexes(
+            self._sorted_indexes(variable), vertex_slice)).tolist()
 
     def get_neuron_sampling_interval(self, variable):
         """ Return the current sampling interval for this variable
@@ -66,12 +102,46 @@ class NeuronRecorder(object):
         step = globals_variables.get_simulator().machine_time_step / 1000
         return self._sampling_rates[variable] * step
 
+    @staticmethod
+    def _overlaps(vertex_slice, neuron_range):
+        """ Determine if a slice has any neurons in a range of neuron IDs
+        """
+        if neuron_range is None:
+            return True
+        start, stop = neuron_range
+        return vertex_slice.lo_atom < stop and vertex_slice.hi_atom >= start
+
+    @staticmethod
+    def _get_window(values, value_range):
+        """ Get the range of indices of the sorted values that are in a\
+            half-open range of values
+
+        :return: the first index in the range and one more than the last
+        """
+        if value_range is None:
+            return 0, len(values)
+        start, stop = numpy.searchsorted(values, value_range)
+        return int(start), int(max(start, stop))
+
+    @staticmethod
+    def _get_first_sample(time, sampling_interval, n_samples):
+        """ Get the index of the first sample taken at or after a time
+        """
+        # Allow for rounding in the division of times that are multiples
+        # of the interval
+        sample = int(math.ceil((time / sampling_interval) - 1e-9))
+        return min(max(sample, 0), n_samples)
+
     def get_matrix_data(
             self, label, buffer_manager, region, placements, graph_mapper,
-            application_vertex, variable, n_machine_time_steps):
+            application_vertex, variable, n_machine_time_steps,
+            neuron_range=None, time_range=None, n_threads=1):
         """ Read a uint32 mapped to time and neuron IDs from the SpiNNaker\
             machine.
 
+        Only the machine vertices with neurons in the neuron range are\
+        read, and only the rows in the time range are decoded.
+
         :param label: vertex label
         :param buffer_manager: the manager for buffered data
         :param region: the DSG region ID used for this data
@@ -82,33 +152,144 @@ class NeuronRecorder(object):
         :param variable: PyNN name for the variable (V, gsy_inh etc.)
         :type variable: str
         :param n_machine_time_steps:
+        :param neuron_range:\
+            The (start, stop) neuron IDs of the neurons to get the data of,\
+            with stop excluded, or None to get the data of all the neurons
+        :param time_range:\
+            The (start, stop) times in milliseconds to get the data of, with\
+            stop excluded, or None to get the data of the whole run.  The\
+            first row of the data is that of the first sample at or after\
+            start.
+        :param n_threads:\
+            The number of threads to decode the data of the machine vertices\
+            with
         :return:
         """
+        # pylint: disable=too-many-arguments
+        data, indexes, sampling_interval, _, _, _ = self._read_matrix_data(
+            label, buffer_manager, region, placements, graph_mapper,
+            application_vertex, variable, n_machine_time_steps,
+            neuron_range, time_range, numpy.empty, n_threads)
+        return (data, indexes, sampling_interval)
+
+    def write_matrix_data(
+            self, filename, label, buffer_manager, region, placements,
+            graph_mapper, application_vertex, variable, n_machine_time_steps,
+            neuron_range=None, time_range=None, n_threads=1):
+        """ Read the data of a variable from the SpiNNaker machine straight\
+            into a memory-mapped file, a machine vertex at a time, so that\
+            the data does not have to fit in memory
+
+        :param filename: the base name of the files to write the data to;\
+            see :py:mod:`spynnaker.pyNN.models.common.recording_export`
+        :return: the number of rows and of columns written
+        """
+        # pylint: disable=too-many-arguments
+        data, indexes, sampling_interval, first_time, vertex_columns, _ = \
+            self._read_matrix_data(
+                label, buffer_manager, region, placements, graph_mapper,
+                application_vertex, variable, n_machine_time_steps,
+                neuron_range, time_range,
+                lambda shape: recording_export.create_matrix_file(
+                    filename, shape), n_threads)
+        if data is None:
+            data = recording_export.create_matrix_file(filename, (0, 0))
+        data.flush()
+        recording_export.write_matrix_index(
+            filename, variable, indexes, sampling_interval, first_time,
+            vertex_columns)
+        return data.shape
+
+    def _read_matrix_data(
+            self, label, buffer_manager, region, placements, graph_mapper,
+            application_vertex, variable, n_machine_time_steps,
+            neuron_range, time_range, allocate, n_threads,
+            reduce_fragment=None):
+        """ Read the data of a variable into a matrix
+
+        :param allocate: a function to allocate the matrix of a given shape,\
+            or None to decode the data of each machine vertex into a matrix\
+            of its own, which is dropped once reduced
+        :param n_threads: the number of threads to decode the data with
+        :param reduce_fragment: a function to reduce the matrix of the\
+            columns of each machine vertex once decoded, which is called in\
+            the decoding threads, or None
+        :return: the matrix, or None if not allocated, the neuron IDs of its\
+            columns, the sampling interval, the time of its first row, the\
+            slice, first column and number of columns of each machine\
+            vertex, and the result of reducing the matrix of each machine\
+            vertex
+        """
+        # pylint: disable=too-many-arguments, too-many-locals
         if variable == SPIKES:
             msg = "Variable {} is not supported use get_spikes".format(SPIKES)
             raise ConfigurationException(msg)
         vertices = graph_mapper.get_machine_vertices(application_vertex)
-        progress = ProgressBar(
-            vertices, "Getting {} for {}".format(variable, label))
         sampling_rate = self._sampling_rates[variable]
         expected_rows = int(math.ceil(
             n_machine_time_steps / sampling_rate))
         missing_str = ""
-        data = None
+        sampling_interval = self.get_neuron_sampling_interval(variable)
+
+        # Work out the rows in the time range, as the sample of each row
+        # is taken at a multiple of the sampling interval
+        first_row, end_row = 0, expected_rows
+        if time_range is not None:
+            first_row = self._get_first_sample(
+                time_range[0], sampling_interval, expected_rows)
+            end_row = max(first_row, self._get_first_sample(
+                time_range[1], sampling_interval, expected_rows))
+        expected_times = numpy.arange(first_row, end_row) * sampling_rate
+
+        # Work out the columns of the neurons of each vertex in the neuron
+        # range, so that the data can be allocated once and each fragment
+        # written into place
+        vertex_neurons = list()
+        vertex_columns = list()
         indexes = []
-        for vertex in progress.over(vertices):
-            placement = placements.get_placement_of_vertex(vertex)
+        for vertex in vertices:
             vertex_slice = graph_mapper.get_slice(vertex)
+            if not self._overlaps(vertex_slice, neuron_range):
+                continue
             neurons = self._neurons_recording(variable, vertex_slice)
-            n_neurons = len(neurons)
-            if n_neurons == 0:
+            first_neuron, end_neuron = self._get_window(
+                neurons, neuron_range)
+            if first_neuron == end_neuron:
                 continue
-            indexes.extend(neurons)
+            vertex_neurons.append((
+                vertex, len(indexes), len(neurons), first_neuron,
+                end_neuron))
+            vertex_columns.append((
+                vertex_slice, len(indexes), end_neuron - first_neuron))
+            indexes.extend(neurons[first_neuron:end_neuron])
+        data = None
+        if indexes and allocate is not None:
+            data = allocate((len(expected_times), len(indexes)))
+
+        progress = ProgressBar(
+            len(vertex_neurons), "Getting {} for {}".format(variable, label))
+
+        def read(vertex_neuron):
+            vertex, first_column, n_neurons, first_neuron, end_neuron = \
+                vertex_neuron
+            placement = placements.get_placement_of_vertex(vertex)
             # for buffering output info is taken form the buffer manager
             neuron_param_region_data_pointer, missing_data = \
                 buffer_manager.get_data_for_vertex(
                     placement, region)
-            record_raw = neuron_param_region_data_pointer.read_all()
+            return (placement, neuron_param_region_data_pointer.read_all(),
+                    missing_data, first_column, n_neurons, first_neuron,
+                    end_neuron)
+
+        def decode(placement, record_raw, missing_data, first_column,
+                   n_neurons, first_neuron, end_neuron):
+            # pylint: disable=too-many-arguments
+            n_columns = end_neuron - first_neuron
+            if data is None:
+                fragment = numpy.empty((len(expected_times), n_columns))
+            else:
+                fragment = data[:, first_column:first_column + n_columns]
+            columns = slice(1 + first_neuron, 1 + end_neuron)
             record_length = len(record_raw)
 
             row_length = self.N_BYTES_FOR_TIMESTAMP + \
@@ -122,105 +303,336 @@ class NeuronRecorder(object):
             # Check if you have the expected data
             if not missing_data and n_rows == expected_rows:
                 # Just cut the timestamps off to get the fragment
-                fragment = (record[:, 1:] / float(DataType.S1615.scale))
+                numpy.divide(
+                    record[first_row:end_row, columns],
+                    float(DataType.S1615.scale), out=fragment)
+                placement = None
             else:
+                # Find the row of each expected timestep in the record, if
+                # there is one, and set the rows without data to nan
+                fragment.fill(numpy.nan)
+                if n_rows:
+                    times = record[:, 0]
+                    order = numpy.argsort(times, kind="mergesort")
+                    rows = order[numpy.minimum(numpy.searchsorted(
+                        times, expected_times, sorter=order), n_rows - 1)]
+                    found = times[rows] == expected_times
+                    fragment[found] = (
+                        record[rows[found], columns] /
+                        float(DataType.S1615.scale))
+            if reduce_fragment is None:
+                return placement, None
+            return placement, reduce_fragment(fragment)
+
+        # Each vertex writes to its own columns of the data, so the vertices
+        # can be decoded in any order
+        reduced = list()
+        for placement, vertex_reduced in recording_utils.decode_in_threads(
+                vertex_neurons, read, decode, n_threads):
+            if placement is not None:
                 missing_str += "({}, {}, {}); ".format(
                     placement.x, placement.y, placement.p)
-                # Start the fragment for this slice empty
-                fragment = numpy.empty((expected_rows, n_neurons))
-                for i in xrange(0, expected_rows):
-                    time = i * sampling_rate
-                    # Check if there is data for this timestep
-                    local_indexes = numpy.where(record[:, 0] == time)
-                    if len(local_indexes[0]) > 0:
-                        # Set row to data for that timestep
-                        fragment[i] = (record[local_indexes[0], 1:] /
-                                       float(DataType.S1615.scale))
-                    else:
-                        # Set row to nan
-                        fragment[i] = numpy.full(n_neurons, numpy.nan)
-            if data is None:
-                data = fragment
-            else:
-                # Add the slice fragment on axis 1 which is IDs/channel_index
-                data = numpy.append(data, fragment, axis=1)
+            reduced.append(vertex_reduced)
+            progress.update()
+        progress.end()
         if len(missing_str) > 0:
             logger.warn(
                 "Population {} is missing recorded data in region {} from the"
                 " following cores: {}".format(label, region, missing_str))
-        sampling_interval = self.get_neuron_sampling_interval(variable)
-        return (data, indexes, sampling_interval)
+        return (data, indexes, sampling_interval,
+                first_row * sampling_interval, vertex_columns, reduced)
 
-    def get_spikes(
+    def get_matrix_statistics(
             self, label, buffer_manager, region, placements, graph_mapper,
-            application_vertex, machine_time_step):
+            application_vertex, variable, n_machine_time_steps, window=None,
+            neuron_range=None, time_range=None, n_threads=1):
+        """ Get the mean and variance of a variable of each neuron in each\
+            of a number of windows of time, reducing the data of each\
+            machine vertex as it is decoded, without building the matrix of\
+            all the data
+
+        :param window: the length of each window in milliseconds, which is\
+            rounded to a whole number of samples, or None for one window of\
+            the whole time range
+        :return: the mean and variance of each window (rows) and neuron\
+            (columns), the neuron IDs of the columns, and the start time of\
+            each window in milliseconds
+        """
+        # pylint: disable=too-many-arguments
+        rows_per_window = None
+        if window is not None:
+            rows_per_window = max(1, int(round(
+                window / self.get_neuron_sampling_interval(variable))))
+        _, indexes, sampling_interval, first_time, _, statistics = \
+            self._read_matrix_data(
+                label, buffer_manager, region, placements, graph_mapper,
+                application_vertex, variable, n_machine_time_steps,
+                neuron_range, time_range, None, n_threads,
+                lambda fragment: recording_statistics.get_window_statistics(
+                    fragment, rows_per_window))
+        if not statistics:
+            return (numpy.zeros((0, 0)), numpy.zeros((0, 0)), indexes,
+                    numpy.zeros(0))
+        means = numpy.hstack([vertex_means for vertex_means, _ in statistics])
+        variances = numpy.hstack(
+            [vertex_variances for _, vertex_variances in statistics])
+        if rows_per_window is None:
+            window = 0.0
+        else:
+            window = rows_per_window * sampling_interval
+        return (means, variances, indexes,
+                first_time + numpy.arange(len(means)) * window)
 
+    def get_spikes(
+            self, label, buffer_manager, region, placements, graph_mapper,
+            application_vertex, machine_time_step, neuron_range=None,
+            time_range=None, n_threads=1):
+        """ Read the spikes recorded from the SpiNNaker machine
+
+        Only the machine vertices with neurons in the neuron range are\
+        read, and only the timesteps in the time range are decoded.
+
+        :param neuron_range:\
+            The (start, stop) neuron IDs of the neurons to get the spikes of,\
+            with stop excluded, or None to get the spikes of all the neurons
+        :param time_range:\
+            The (start, stop) times in milliseconds to get the spikes in,\
+            with stop excluded, or None to get the spikes of the whole run
+        :param n_threads:\
+            The number of threads to decode the spikes of the machine\
+            vertices with
+        :return: an array of the neuron ID and time of each spike
+        """
+        # pylint: disable=too-many-arguments
         spike_times = list()
         spike_ids = list()
+        for _, vertex_ids, vertex_times in self._iter_spikes(
+                label, buffer_manager, region, placements, graph_mapper,
+                application_vertex, machine_time_step, neuron_range,
+                time_range, n_threads):
+            spike_ids.append(vertex_ids)
+            spike_times.append(vertex_times)
+
+        if len(spike_ids) == 0:
+            return numpy.zeros((0, 2), dtype="float")
+        spike_ids = numpy.concatenate(spike_ids)
+        spike_times = numpy.concatenate(spike_times)
+
+        result = numpy.column_stack((spike_ids, spike_times))
+        return result[numpy.lexsort((spike_times, spike_ids))]
+
+    def get_spike_counts(
+            self, label, buffer_manager, region, placements, graph_mapper,
+            application_vertex, machine_time_step, neuron_range=None,
+            time_range=None, n_threads=1):
+        """ Count the spikes of each neuron, a machine vertex at a time as\
+            the spikes of each are decoded, without building the list of all\
+            the spikes
+
+        :return: the number of spikes of each neuron of the population
+        """
+        # pylint: disable=too-many-arguments
+        counts = numpy.zeros(self._n_neurons, dtype="int64")
+        for vertex_slice, vertex_ids, _ in self._iter_spikes(
+                label, buffer_manager, region, placements, graph_mapper,
+                application_vertex, machine_time_step, neuron_range,
+                time_range, n_threads):
+            recording_statistics.add_spike_counts(
+                counts[vertex_slice.as_slice], vertex_ids,
+                vertex_slice.lo_atom)
+        return counts
+
+    def get_spike_histogram(
+            self, label, buffer_manager, region, placements, graph_mapper,
+            application_vertex, machine_time_step, n_machine_time_steps,
+            bin_width, neuron_range=None, time_range=None, n_threads=1):
+        """ Count the spikes of all the neurons in each of a number of bins\
+            of time, a machine vertex at a time as the spikes of each are\
+            decoded, without building the list of all the spikes
+
+        :param bin_width: the width of each bin in milliseconds
+        :return: the number of spikes in each bin, and the start time of\
+            each bin in milliseconds
+        """
+        # pylint: disable=too-many-arguments
+        if time_range is None:
+            time_range = (
+                0.0, n_machine_time_steps * machine_time_step / 1000.0)
+        start_time, end_time = time_range
+        histogram = numpy.zeros(
+            recording_statistics.get_n_bins(start_time, end_time, bin_width),
+            dtype="int64")
+        for _, _, vertex_times in self._iter_spikes(
+                label, buffer_manager, region, placements, graph_mapper,
+                application_vertex, machine_time_step, neuron_range,
+                time_range, n_threads):
+            recording_statistics.add_spike_histogram(
+                histogram, vertex_times, start_time, bin_width)
+        return (histogram,
+                start_time + numpy.arange(len(histogram)) * bin_width)
+
+    def write_spikes(
+            self, filename, label, buffer_manager, region, placements,
+            graph_mapper, application_vertex, machine_time_step,
+            neuron_range=None, time_range=None, n_threads=1):
+        """ Read the spikes recorded from the SpiNNaker machine straight\
+            into files, a machine vertex at a time, so that the spikes do\
+            not have to fit in memory
+
+        :param filename: the base name of the files to write the spikes to;\
+            see :py:mod:`spynnaker.pyNN.models.common.recording_export`
+        :return: the number of spikes written
+        """
+        # pylint: disable=too-many-arguments
+        return recording_export.write_spikes(filename, self._iter_spikes(
+            label, buffer_manager, region, placements, graph_mapper,
+            application_vertex, machine_time_step, neuron_range, time_range,
+            n_threads))
+
+    def _iter_spikes(
+            self, label, buffer_manager, region, placements, graph_mapper,
+            application_vertex, machine_time_step, neuron_range, time_range,
+            n_threads):
+        """ Read the spikes of each machine vertex in turn, decoding them in\
+            a number of threads
+
+        :return: iterable of the slice of each vertex, and the neuron IDs\
+            and times of its spikes
+        """
+        # pylint: disable=too-many-arguments, too-many-locals
         ms_per_tick = machine_time_step / 1000.0
+        indexes = self._sorted_indexes(SPIKES)
 
         vertices = graph_mapper.get_machine_vertices(application_vertex)
-        missing_str = ""
+        missing = list()
         progress = ProgressBar(vertices,
                                "Getting spikes for {}".format(label))
-        for vertex in progress.over(vertices):
+
+        def read(vertex):
             placement = placements.get_placement_of_vertex(vertex)
             vertex_slice = graph_mapper.get_slice(vertex)
+            if not self._overlaps(vertex_slice, neuron_range):
+                return None
 
-            if self._indexes[SPIKES] is None:
+            if indexes is None:
+                neurons = None
                 neurons_recording = vertex_slice.n_atoms
             else:
-                neurons_recording = sum(
-                    (index >= vertex_slice.lo_atom and
-                     index <= vertex_slice.hi_atom)
-                    for index in self._indexes[SPIKES])
+                neurons = numpy.unique(
+                    self._slice_indexes(indexes, vertex_slice))
+                neurons_recording = len(neurons)
                 if neurons_recording == 0:
-                    continue
-            # Read the spikes
-            n_words = int(math.ceil(neurons_recording / 32.0))
-            n_bytes = n_words * self.N_BYTES_PER_WORD
-            n_words_with_timestamp = n_words + 1
+                    return None
 
             # for buffering output info is taken form the buffer manager
             neuron_param_region_data_pointer, data_missing = \
                 buffer_manager.get_data_for_vertex(
                     placement, region)
             if data_missing:
-                missing_str += "({}, {}, {}); ".format(
-                    placement.x, placement.y, placement.p)
-            record_raw = neuron_param_region_data_pointer.read_all()
-            raw_data = (numpy.asarray(record_raw, dtype="uint8").
-                        view(dtype="<i4")).reshape(
-                [-1, n_words_with_timestamp])
-            if len(raw_data) > 0:
-                record_time = raw_data[:, 0] * float(ms_per_tick)
-                spikes = raw_data[:, 1:].byteswap().view("uint8")
-                bits = numpy.fliplr(numpy.unpackbits(spikes).reshape(
-                    (-1, 32))).reshape((-1, n_bytes * 8))
-                time_indices, local_indices = numpy.where(bits == 1)
-                if self._indexes[SPIKES] is None:
-                    indices = local_indices + vertex_slice.lo_atom
-                    times = record_time[time_indices].reshape((-1))
-                    spike_ids.extend(indices)
-                    spike_times.extend(times)
-                else:
-                    neurons = self._neurons_recording(SPIKES, vertex_slice)
-                    n_neurons = len(neurons)
-                    for time_indice, local in zip(time_indices, local_indices):
-                        if local < n_neurons:
-                            spike_ids.append(neurons[local])
-                            spike_times.append(record_time[time_indice])
-
+                missing.append(placement)
+            return (vertex_slice, neurons, neurons_recording,
+                    neuron_param_region_data_pointer.read_all())
+
+        def decode(vertex_slice, neurons, neurons_recording, record_raw):
+            if self._sparse_spike_rate is None:
+                spikes = self._decode_spike_bits(
+                    record_raw, neurons_recording, ms_per_tick, time_range)
+            else:
+                spikes = self._decode_sparse_spikes(
+                    record_raw, ms_per_tick, time_range)
+            if spikes is None:
+                return None
+            spike_times, local_indices = spikes
+            if neurons is None:
+                spike_ids = local_indices + vertex_slice.lo_atom
+            else:
+                # Map the local index of each spike to the neuron recording
+                # at that index, ignoring the padding bits
+                valid = local_indices < len(neurons)
+                spike_times = spike_times[valid]
+                spike_ids = neurons[local_indices[valid]]
+            if neuron_range is not None:
+                in_range = ((spike_ids >= neuron_range[0]) &
+                            (spike_ids < neuron_range[1]))
+                spike_ids = spike_ids[in_range]
+                spike_times = spike_times[in_range]
+            return vertex_slice, spike_ids, spike_times
+
+        for result in recording_utils.decode_in_threads(
+                progress.over(vertices), read, decode, n_threads):
+            if result is not None:
+                yield result
+
+        missing_str = "".join(
+            "({}, {}, {}); ".format(placement.x, placement.y, placement.p)
+            for placement in missing)
         if len(missing_str) > 0:
             logger.warn(
                 "Population {} is missing spike data in region {} from the"
                 " following cores: {}".format(label, region, missing_str))
 
-        if len(spike_ids) == 0:
-            return numpy.zeros((0, 2), dtype="float")
+    @classmethod
+    def _decode_spike_bits(
+            cls, record_raw, neurons_recording, ms_per_tick, time_range):
+        """ Decode spikes recorded as a timestamp and a bit per neuron\
+            recording spikes in each timestep that any neuron spiked
 
-        result = numpy.column_stack((spike_ids, spike_times))
-        return result[numpy.lexsort((spike_times, spike_ids))]
+        :return: the time and local index of each spike, or None if no\
+            timesteps were recorded in the time range
+        """
+        n_words = int(math.ceil(neurons_recording / 32.0))
+        n_bytes = n_words * cls.N_BYTES_PER_WORD
+        n_words_with_timestamp = n_words + 1
+        raw_data = (numpy.asarray(record_raw, dtype="uint8").
+                    view(dtype="<i4")).reshape(
+            [-1, n_words_with_timestamp])
+        # The timesteps are recorded in order, so the times are an index
+        # of the rows
+        record_time = raw_data[:, 0] * float(ms_per_tick)
+        first_row, end_row = cls._get_window(record_time, time_range)
+        raw_data = raw_data[first_row:end_row]
+        record_time = record_time[first_row:end_row]
+        if len(raw_data) == 0:
+            return None
+        spikes = raw_data[:, 1:].byteswap().view("uint8")
+        bits = numpy.fliplr(numpy.unpackbits(spikes).reshape(
+            (-1, 32))).reshape((-1, n_bytes * 8))
+        time_indices, local_indices = numpy.where(bits == 1)
+        return record_time[time_indices], local_indices
+
+    @classmethod
+    def _decode_sparse_spikes(cls, record_raw, ms_per_tick, time_range):
+        """ Decode spikes recorded sparsely, as a timestamp, a count and\
+            the local index of each neuron that spiked, as a byte each and\
+            padded to a whole word, in each timestep that any neuron spiked
+
+        :return: the time and local index of each spike, or None if no\
+            timesteps were recorded in the time range
+        """
+        # Locate the (time, count) header of each timestep; the headers must
+        # be found in order as the counts vary
+        offsets = list()
+        times = list()
+        counts = list()
+        offset = 0
+        while offset < len(record_raw):
+            time, count = _TWO_WORDS.unpack_from(record_raw, offset)
+            offset += _TWO_WORDS.size
+            offsets.append(offset)
+            times.append(time)
+            counts.append(count)
+            offset += int(math.ceil(count / 4.0)) * cls.N_BYTES_PER_WORD
+        record_time = numpy.array(times, dtype="float64") * ms_per_tick
+        first, end = cls._get_window(record_time, time_range)
+        if first == end:
+            return None
+
+        # Gather the indices of all the timesteps together
+        counts = numpy.array(counts[first:end], dtype="int64")
+        indices = numpy.frombuffer(record_raw, dtype="uint8")[
+            recording_utils.get_ragged_indices(offsets[first:end], counts)]
+        return (numpy.repeat(record_time[first:end], counts),
+                indices.astype("int64"))
 
     def get_recordable_variables(self):
         return self._sampling_rates.keys()
@@ -388,6 +800,8 @@ class NeuronRecorder(object):
         if n_neurons == 0:
             return 0
         if variable == SPIKES:
+            if self._sparse_spike_rate is not None:
+                return self._get_sparse_spike_sdram_per_record(n_neurons)
             # Overflow can be ignored as it is not save if in an extra word
             out_spike_words = int(math.ceil(n_neurons / 32.0))
             out_spike_bytes = out_spike_words * self.N_BYTES_PER_WORD
@@ -396,6 +810,26 @@ class NeuronRecorder(object):
             return self.N_BYTES_FOR_TIMESTAMP + \
                         n_neurons * self.N_BYTES_PER_VALUE
 
+    def _get_sparse_spike_sdram_per_record(self, n_neurons):
+        """ Get the SDRAM to reserve for each record of spikes recorded\
+            sparsely, from the rate of spikes expected of each neuron
+
+        The number of neurons that spike in each record is taken to be\
+        Poisson distributed, and space is reserved for a few standard\
+        deviations above the expected number; if the neurons spike much\
+        faster than expected, the recording can run out of space.
+
+        :param n_neurons: the number of neurons recording spikes
+        """
+        machine_time_step = globals_variables.get_simulator().machine_time_step
+        expected = (
+            n_neurons * self._sparse_spike_rate * machine_time_step *
+            self._sampling_rates[SPIKES] / MICROSECONDS_PER_SECOND)
+        n_spikes = min(n_neurons, int(math.ceil(
+            expected + self.SPARSE_SPIKES_N_SIGMA * math.sqrt(expected))))
+        return (self.N_BYTES_FOR_TIMESTAMP + self.N_BYTES_PER_SIZE +
+                int(math.ceil(n_spikes / 4.0)) * self.N_BYTES_PER_WORD)
+
     def get_buffered_sdram_per_timestep(self, variable, vertex_slice):
         """ Return the SDRAM used per timestep.
 
@@ -462,10 +896,13 @@ class NeuronRecorder(object):
     def get_sdram_usage_in_bytes(self, vertex_slice):
         n_words_for_n_neurons = (vertex_slice.n_atoms + 3) // 4
         n_bytes_for_n_neurons = n_words_for_n_neurons * 4
-        return (8 + n_bytes_for_n_neurons) * len(self._sampling_rates)
+        # whether spikes are recorded sparsely, then *_rate,
+        # n_neurons_recording_* and *_indexes of each variable
+        return self.N_BYTES_PER_WORD + (
+            (8 + n_bytes_for_n_neurons) * len(self._sampling_rates))
 
     def get_dtcm_usage_in_bytes(self, vertex_slice):
-        # *_rate + n_neurons_recording_* + *_indexes
+        # spike_recording_sparse + *_rate + n_neurons_recording_* + *_indexes
         usage = self.get_sdram_usage_in_bytes(vertex_slice)
         # *_count + *_increment
         usage += len(self._sampling_rates) * self.N_BYTES_PER_POINTER * 2
@@ -475,6 +912,9 @@ class NeuronRecorder(object):
                 out_spike_words = int(math.ceil(vertex_slice.n_atoms / 32.0))
                 out_spike_bytes = out_spike_words * self.N_BYTES_PER_WORD
                 usage += self.N_BYTES_FOR_TIMESTAMP + out_spike_bytes
+                # The sparse spikes, with a byte for each bit of out_spikes
+                usage += (self.N_BYTES_FOR_TIMESTAMP + self.N_BYTES_PER_SIZE +
+                          out_spike_bytes * 8)
             else:
                 usage += (self.N_BYTES_FOR_TIMESTAMP +
                           vertex_slice.n_atoms * self.N_BYTES_PER_VALUE)
@@ -489,9 +929,10 @@ class NeuronRecorder(object):
                 len(self.recording_variables)
 
     def get_data(self, vertex_slice):
-        data = list()
         n_words_for_n_neurons = (vertex_slice.n_atoms + 3) // 4
         n_bytes_for_n_neurons = n_words_for_n_neurons * 4
+        data = [numpy.array(
+            [self._sparse_spike_rate is not None], dtype="uint32")]
         for variable in self._sampling_rates:
             rate = self._sampling_rates[variable]
             n_recording = self._count_recording_per_slice(
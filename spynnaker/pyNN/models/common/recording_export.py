@@ -0,0 +1,189 @@
+""" Export of recorded data to columnar files that can be memory-mapped.
+
+Each export is a set of files with a common base name:
+
+* ``<base>.json``, the index of the export, which records the variable,\
+  and the range of rows or columns of the data of each machine vertex
+* for spikes, ``<base>.ids.npy`` and ``<base>.times.npy``, the neuron ID and\
+  time of each spike, in the order of the vertices
+* for other variables, ``<base>.data.npy``, the matrix of samples with a row\
+  per sample time and a column per neuron, and ``<base>.ids.npy``, the\
+  neuron ID of each column
+"""
+import json
+import numpy
+from numpy.lib.format import open_memmap
+
+_INDEX_SUFFIX = ".json"
+_IDS_SUFFIX = ".ids.npy"
+_TIMES_SUFFIX = ".times.npy"
+_DATA_SUFFIX = ".data.npy"
+
+# The size of the header written to a .npy file, which is large enough for
+# the header of any one-dimensional array and a multiple of 64 bytes, as the
+# format requires
+_NPY_HEADER_SIZE = 128
+
+
+class NpyColumnWriter(object):
+    """ Writes a one-dimensional .npy file an array at a time, without\
+        knowing the length of the whole array in advance
+    """
+
+    __slots__ = [
+        # The file being written
+        "_file",
+
+        # The numpy type of the items of the array
+        "_dtype",
+
+        # The number of items written so far
+        "_n_items"]
+
+    def __init__(self, filename, dtype):
+        """
+        :param filename: the name of the .npy file to write
+        :param dtype: the numpy type of the items of the array
+        """
+        self._dtype = numpy.dtype(dtype)
+        self._n_items = 0
+        self._file = open(filename, "wb")
+        self._write_header()
+
+    def _write_header(self):
+        header = "{{'descr': {!r}, 'fortran_order': False, 'shape': ({},), }}"\
+            .format(numpy.lib.format.dtype_to_descr(self._dtype),
+                    self._n_items)
+        # The header is padded with spaces and ends with a newline
+        header = header.ljust(_NPY_HEADER_SIZE - 11) + "\n"
+        self._file.seek(0)
+        self._file.write(b"\x93NUMPY\x01\x00")
+        self._file.write(numpy.array(len(header), dtype="<u2").tobytes())
+        self._file.write(header.encode("latin1"))
+
+    def append(self, values):
+        """ Write some items to the end of the array
+
+        :param values: the items to write
+        """
+        values = numpy.ascontiguousarray(values, dtype=self._dtype)
+        self._file.write(values.tobytes())
+        self._n_items += len(values)
+
+    @property
+    def n_items(self):
+        """ The number of items written so far
+        """
+        return self._n_items
+
+    def close(self):
+        """ Write the length of the array to the header, and close the file
+        """
+        self._write_header()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+
+def _write_index(filename, index):
+    with open(filename + _INDEX_SUFFIX, "w") as index_file:
+        json.dump(index, index_file, indent=1)
+
+
+def _read_index(filename):
+    with open(filename + _INDEX_SUFFIX) as index_file:
+        return json.load(index_file)
+
+
+def create_matrix_file(filename, shape):
+    """ Create the memory-mapped file of the matrix of samples of an export
+
+    :param filename: the base name of the files of the export
+    :param shape: the number of rows and of columns of the matrix
+    :rtype: numpy.memmap
+    """
+    return open_memmap(
+        filename + _DATA_SUFFIX, mode="w+", dtype="float64", shape=shape)
+
+
+def write_matrix_index(
+        filename, variable, indexes, sampling_interval, first_time,
+        vertex_columns):
+    """ Write the neuron IDs and the index of an exported matrix of samples
+
+    :param filename: the base name of the files of the export
+    :param variable: the name of the variable exported
+    :param indexes: the neuron ID of each column
+    :param sampling_interval: the time between samples in milliseconds
+    :param first_time: the time of the first row in milliseconds
+    :param vertex_columns:\
+        the slice, first column and number of columns of each vertex
+    """
+    # pylint: disable=too-many-arguments
+    numpy.save(filename + _IDS_SUFFIX, numpy.asarray(indexes, dtype="int64"))
+    _write_index(filename, {
+        "variable": variable,
+        "sampling_interval": sampling_interval,
+        "first_time": first_time,
+        "vertices": [
+            {"lo_atom": vertex_slice.lo_atom,
+             "hi_atom": vertex_slice.hi_atom,
+             "first_column": first_column, "n_columns": n_columns}
+            for vertex_slice, first_column, n_columns in vertex_columns]})
+
+
+def write_spikes(filename, vertex_spikes):
+    """ Write spikes to an export a vertex at a time, holding only the\
+        spikes of one vertex in memory
+
+    :param filename: the base name of the files of the export
+    :param vertex_spikes:\
+        iterable of the slice, neuron IDs and times of the spikes of each\
+        vertex
+    :return: the number of spikes written
+    """
+    vertices = list()
+    with NpyColumnWriter(filename + _IDS_SUFFIX, "int64") as ids, \
+            NpyColumnWriter(filename + _TIMES_SUFFIX, "float64") as times:
+        for vertex_slice, spike_ids, spike_times in vertex_spikes:
+            vertices.append({
+                "lo_atom": vertex_slice.lo_atom,
+                "hi_atom": vertex_slice.hi_atom,
+                "first_row": ids.n_items, "n_rows": len(spike_ids)})
+            ids.append(spike_ids)
+            times.append(spike_times)
+        n_spikes = ids.n_items
+    _write_index(filename, {"variable": "spikes", "vertices": vertices})
+    return n_spikes
+
+
+def read_exported_matrix(filename):
+    """ Open an exported matrix of samples, without reading it into memory
+
+    :param filename: the base name of the files of the export
+    :return: the memory-mapped matrix, the neuron ID of each column, the\
+        sampling interval, the time of the first row and the index
+    """
+    index = _read_index(filename)
+    data = numpy.load(filename + _DATA_SUFFIX, mmap_mode="r")
+    ids = numpy.load(filename + _IDS_SUFFIX, mmap_mode="r")
+    return (data, ids, index["sampling_interval"], index["first_time"],
+            index)
+
+
+def read_exported_spikes(filename):
+    """ Open exported spikes, without reading them into memory
+
+    :param filename: the base name of the files of the export
+    :return: the memory-mapped neuron ID and time of each spike, and the\
+        index, in which the spikes of each vertex are listed
+    """
+    index = _read_index(filename)
+    ids = numpy.load(filename + _IDS_SUFFIX, mmap_mode="r")
+    times = numpy.load(filename + _TIMES_SUFFIX, mmap_mode="r")
+    return ids, times, index
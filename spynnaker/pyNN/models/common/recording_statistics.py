@@ -0,0 +1,82 @@
+""" Reductions of recorded data that can be computed a machine vertex at a\
+    time, as the data of each is decoded, so that the whole recording never\
+    has to be held in memory
+"""
+from __future__ import division
+import math
+import numpy
+
+
+def add_spike_counts(counts, spike_ids, first_id):
+    """ Add spikes to the number of spikes of each of a range of neurons
+
+    :param counts: the number of spikes of each neuron, to add to
+    :type counts: numpy.ndarray
+    :param spike_ids: the neuron ID of each spike, all in the range
+    :param first_id: the neuron ID of the first neuron of the range
+    """
+    counts += numpy.bincount(
+        numpy.asarray(spike_ids, dtype="int64") - first_id,
+        minlength=len(counts))
+
+
+def get_n_bins(start_time, end_time, bin_width):
+    """ Get the number of bins of a width needed to cover a time range
+
+    :param start_time: the start of the range in milliseconds
+    :param end_time: the end of the range in milliseconds
+    :param bin_width: the width of each bin in milliseconds
+    """
+    # Allow for rounding of ranges that are multiples of the width
+    return max(0, int(math.ceil(((end_time - start_time) / bin_width) - 1e-9)))
+
+
+def add_spike_histogram(histogram, spike_times, start_time, bin_width):
+    """ Add spikes to a histogram of the number of spikes in each of a\
+        number of bins of time; spikes outside the bins are ignored
+
+    :param histogram: the number of spikes in each bin, to add to
+    :type histogram: numpy.ndarray
+    :param spike_times: the time of each spike in milliseconds
+    :param start_time: the start of the first bin in milliseconds
+    :param bin_width: the width of each bin in milliseconds
+    """
+    bins = numpy.floor(
+        ((numpy.asarray(spike_times, dtype="float64") - start_time) /
+         bin_width) + 1e-9).astype("int64")
+    bins = bins[(bins >= 0) & (bins < len(histogram))]
+    histogram += numpy.bincount(bins, minlength=len(histogram))
+
+
+def get_window_statistics(data, rows_per_window=None):
+    """ Get the mean and variance of each column of a matrix of samples in\
+        windows of a number of rows, ignoring missing samples
+
+    :param data: the samples, with a row per sample time and a column per\
+        neuron, with NaN where a sample is missing
+    :param rows_per_window:\
+        the number of rows in each window, or None for one window of all\
+        the rows
+    :return: the mean and variance of each window (rows) and column\
+        (columns), which are NaN where a window of a column has no samples
+    """
+    data = numpy.asarray(data, dtype="float64")
+    n_rows = len(data)
+    if n_rows == 0:
+        empty = numpy.zeros((0,) + data.shape[1:])
+        return empty, empty.copy()
+    if rows_per_window is None:
+        rows_per_window = n_rows
+    starts = numpy.arange(0, n_rows, rows_per_window)
+    lengths = numpy.diff(numpy.append(starts, n_rows))
+
+    present = ~numpy.isnan(data)
+    values = numpy.where(present, data, 0.0)
+    counts = numpy.add.reduceat(present.astype("int64"), starts, axis=0)
+    with numpy.errstate(invalid="ignore", divide="ignore"):
+        means = numpy.add.reduceat(values, starts, axis=0) / counts
+        deviations = numpy.where(
+            present, values - numpy.repeat(means, lengths, axis=0), 0.0)
+        variances = numpy.add.reduceat(
+            deviations * deviations, starts, axis=0) / counts
+    return means, variances
@@ -0,0 +1,118 @@
+import json
+import logging
+import math
+import os
+
+from spinn_front_end_common.utilities.helpful_functions import read_config
+
+logger = logging.getLogger(__name__)
+
+
+class RecordingUsage(object):
+    """ The space measured to be used per timestep by recording regions,\
+        kept in a file so that later runs and scripts can size the regions\
+        from it rather than from an estimate of the worst case
+    """
+
+    __slots__ = [
+        # The file holding the measurements
+        "_filename",
+
+        # A dict of "key:region" to the most bytes per timestep measured
+        "_usage"]
+
+    # The measurements open, by file name, so that every vertex of a script
+    # sees the measurements made by earlier runs of the script
+    _open = dict()
+
+    def __init__(self, filename):
+        """
+        :param filename: the JSON file holding the measurements, which is\
+            created when they are first saved
+        """
+        self._filename = filename
+        self._usage = dict()
+        if os.path.isfile(filename):
+            try:
+                with open(filename) as usage_file:
+                    self._usage = json.load(usage_file)
+            except ValueError:
+                logger.warning(
+                    "Ignoring unreadable recording usage file %s", filename)
+
+    @classmethod
+    def open(cls, filename):
+        """ Get the measurements kept in a file
+
+        :param filename: the JSON file holding the measurements
+        :rtype: :py:class:`RecordingUsage`
+        """
+        filename = os.path.abspath(filename)
+        if filename not in cls._open:
+            cls._open[filename] = cls(filename)
+        return cls._open[filename]
+
+    @classmethod
+    def from_config(cls, config):
+        """ Get the measurements kept in the file set in the configuration
+
+        :return: the measurements, or None if they are not kept
+        :rtype: :py:class:`RecordingUsage` or None
+        """
+        filename = read_config(config, "Recording", "recording_usage_file")
+        if filename is None:
+            return None
+        return cls.open(filename)
+
+    @property
+    def filename(self):
+        return self._filename
+
+    @staticmethod
+    def _get_item_key(key, region):
+        return "{}:{}".format(key, region)
+
+    def get_bytes_per_timestep(self, key, region):
+        """ Get the most bytes per timestep measured to be used by a region
+
+        :param key: the key of the recording of the machine vertex
+        :param region: the ID of the recording region
+        :return: the bytes per timestep, or None if not measured
+        """
+        return self._usage.get(self._get_item_key(key, region))
+
+    def add_measurement(self, key, region, bytes_per_timestep):
+        """ Add the bytes per timestep measured to be used by a region
+
+        :param key: the key of the recording of the machine vertex
+        :param region: the ID of the recording region
+        :param bytes_per_timestep: the bytes per timestep used
+        """
+        item_key = self._get_item_key(key, region)
+        self._usage[item_key] = max(
+            bytes_per_timestep, self._usage.get(item_key, 0))
+
+    def save(self):
+        """ Write the measurements to the file
+        """
+        directory = os.path.dirname(self._filename)
+        if directory and not os.path.isdir(directory):
+            os.makedirs(directory)
+        with open(self._filename, "w") as usage_file:
+            json.dump(self._usage, usage_file, indent=1, sort_keys=True)
+
+    @staticmethod
+    def get_size(estimate, measured, margin):
+        """ Get the bytes per timestep to reserve for a region
+
+        :param estimate: the bytes per timestep estimated for the worst case
+        :param measured:\
+            the bytes per timestep measured to be used, or None if not measured
+        :param margin: the fraction of the measurement to add to it
+        :return: the measurement with the margin added, which is never less\
+            than the measurement, even if the estimate is, or the estimate if\
+            there is no measurement
+        """
+        if measured is None:
+            return estimate
+        return int(math.ceil(measured * (1.0 + max(margin, 0.0))))
@@ -1,8 +1,11 @@
 from __future__ import division
+from collections import deque
+from multiprocessing.pool import ThreadPool
 import struct
 import logging
 import numpy
 
+from spinn_front_end_common.utilities import globals_variables
 from spinn_front_end_common.utilities.helpful_functions \
     import locate_memory_region_for_placement
 from spynnaker.pyNN.exceptions import MemReadException
@@ -91,6 +94,22 @@ def get_buffer_sizes(buffer_max, space_needed, enable_buffered_recording):
     return space_needed
 
 
+def get_ragged_indices(starts, lengths):
+    """ Get the indices of the items of a number of ranges of an array,\
+        concatenated, so that the ranges can be gathered in one operation
+
+    :param starts: the index of the first item of each range
+    :param lengths: the number of items in each range
+    :rtype: numpy.ndarray
+    """
+    lengths = numpy.asarray(lengths, dtype="int64")
+    ends = numpy.cumsum(lengths)
+    if not len(ends):
+        return numpy.zeros(0, dtype="int64")
+    offsets = numpy.asarray(starts, dtype="int64") - (ends - lengths)
+    return numpy.arange(ends[-1]) + numpy.repeat(offsets, lengths)
+
+
 def make_missing_string(missing):
     missing_str = ""
     separator = ""
@@ -99,3 +118,55 @@ def make_missing_string(missing):
             separator, placement.x, placement.y, placement.p)
         separator = "; "
     return missing_str
+
+
+def get_n_decode_threads():
+    """ Get the number of threads with which to decode recorded data, from\
+        the configuration
+    """
+    return globals_variables.get_simulator().config.getint(
+        "Recording", "n_decode_threads")
+
+
+def decode_in_threads(items, read, decode, n_threads):
+    """ Read the data of each of a number of items in turn, and decode the\
+        data of the items concurrently in a pool of threads
+
+    The data is read in the calling thread, as the buffer manager cannot be\
+    used from several threads at once; only the decoding, which is mostly\
+    done by numpy, is done in the pool.
+
+    :param items: the items, such as machine vertices, to read the data of
+    :param read: a function to read the data of an item, which returns the\
+        arguments with which to decode it, or None to skip the item
+    :param decode: a function to decode the data of an item, which must only\
+        use its arguments
+    :param n_threads: the number of threads to decode with; if not more\
+        than 1, the data is decoded in the calling thread
+    :return: iterable of the result of decoding each item not skipped, in\
+        the order of the items
+    """
+    if n_threads <= 1:
+        for item in items:
+            args = read(item)
+            if args is not None:
+                yield decode(*args)
+        return
+
+    # The results are kept in the order of the items, with a limited number
+    # waiting, so that the data read is not held much longer than needed
+    pool = ThreadPool(n_threads)
+    try:
+        pending = deque()
+        for item in items:
+            args = read(item)
+            if args is not None:
+                pending.append(pool.apply_async(decode, args))
+            while pending and (
+                    pending[0].ready() or len(pending) > 2 * n_threads):
+                yield pending.popleft().get()
+        while pending:
+            yield pending.popleft().get()
+    finally:
+        pool.close()
+        pool.join()
@@ -5,6 +5,8 @@ from spinn_front_end_common.utilities.utility_objs import ProvenanceDataItem
 from spinn_utilities.abstract_base import AbstractBase, abstractmethod
 from spinn_front_end_common.utilities.globals_variables import get_simulator
 from spynnaker.pyNN.utilities import utility_calls
+from scipy.spatial import cKDTree  # @UnresolvedImport
+import itertools
 import logging
 import numpy
 import math
@@ -12,6 +14,9 @@ import re
 
 # global objects
 logger = logging.getLogger(__name__)
+
+# The maximum number of random keys to sort at once when choosing neurons
+_MAX_RANDOM_KEYS = 1 << 22
 _expr_context = SafeEval(
     math, numpy, numpy.arccos, numpy.arcsin, numpy.arctan, numpy.arctan2,
     numpy.ceil, numpy.cos, numpy.cosh, numpy.exp, numpy.fabs, numpy.floor,
@@ -30,6 +35,7 @@ class AbstractConnector(object):
                             ("synapse_type", "uint8")]
 
     __slots__ = [
+        "_block_cache_digest",
         "_delays",
         "_min_delay",
         "_pre_population",
@@ -59,6 +65,9 @@ class AbstractConnector(object):
         self._weights = None
         self._delays = None
 
+        # The digest of the block cache parameters, once it is computed
+        self._block_cache_digest = None
+
     def set_space(self, space):
         """ Set the space object (allowed after instantiation).
 
@@ -92,6 +101,7 @@ class AbstractConnector(object):
                 'in the previous projection. For now, set up a new connector.')
         self._weights = weights
         self._delays = delays
+        self._block_cache_digest = None
         self._check_parameters(weights, delays, allow_lists)
 
     def set_weights_and_delays(self, weights, delays):
@@ -107,6 +117,7 @@ class AbstractConnector(object):
         if self._rng is None:
             self._rng = get_simulator().get_pynn_NumpyRNG()
         self._min_delay = machine_time_step / 1000.0
+        self._block_cache_digest = None
 
     def _check_parameter(self, values, name, allow_lists):
         """ Check that the types of the values is supported.
@@ -274,6 +285,164 @@ class AbstractConnector(object):
         regexpr = re.compile(r'.*d\[\d*\].*')
         return regexpr.match(d_expression)
 
+    @staticmethod
+    def _choose_random_neurons(
+            n_rows, n_choices, n_neurons, with_replacement, exclude_self):
+        """ Choose a number of neurons at random for each of a number of\
+            neurons, e.g. the pre-neurons of each post-neuron
+
+        :param n_rows: The number of neurons to choose for
+        :param n_choices: The number of neurons to choose for each
+        :param n_neurons: The number of neurons to choose from
+        :param with_replacement: Whether a neuron can be chosen more than\
+            once for the same row
+        :param exclude_self: Whether the neuron with the same index as the\
+            row is excluded from the choices of that row
+        :return: The neurons chosen, sorted within each row
+        :rtype: 2D array of uint32
+        """
+        rows = numpy.arange(n_rows, dtype="uint32")[:, None]
+        if with_replacement:
+            if not exclude_self:
+                choices = numpy.random.randint(
+                    0, n_neurons, (n_rows, n_choices))
+            else:
+                # Choose from the other neurons, then skip over the row
+                choices = numpy.random.randint(
+                    0, n_neurons - 1, (n_rows, n_choices))
+                choices += choices >= rows
+            choices = choices.astype("uint32")
+            choices.sort(axis=1)
+            return choices
+
+        if n_choices * 4 > n_neurons:
+            # Most neurons are chosen, so take those with the smallest random
+            # keys, a number of rows at a time; a neuron excluded from a row
+            # is given a key that is never chosen
+            choices = numpy.zeros((n_rows, n_choices), dtype="uint32")
+            chunk_rows = max(1, _MAX_RANDOM_KEYS // max(1, n_neurons))
+            for start in range(0, n_rows, chunk_rows):
+                end = min(n_rows, start + chunk_rows)
+                keys = numpy.random.random_sample((end - start, n_neurons))
+                if exclude_self:
+                    chunk_ids = numpy.arange(start, min(end, n_neurons))
+                    keys[chunk_ids - start, chunk_ids] = 2.0
+                choices[start:end] = numpy.argpartition(
+                    keys, n_choices - 1, axis=1)[:, :n_choices]
+            choices.sort(axis=1)
+            return choices
+
+        # Few neurons are chosen, so choose with replacement and then choose
+        # again in place of any repeated (or excluded) neurons until there
+        # are none; only the rows that had repeats are checked again
+        choices = numpy.random.randint(
+            0, n_neurons, (n_rows, n_choices)).astype("uint32")
+        to_check = numpy.arange(n_rows)
+        while len(to_check):
+            checking = choices[to_check]
+            checking.sort(axis=1)
+            invalid = numpy.zeros(checking.shape, dtype="bool")
+            invalid[:, 1:] = checking[:, 1:] == checking[:, :-1]
+            if exclude_self:
+                invalid |= checking == rows[to_check]
+            checking[invalid] = numpy.random.randint(
+                0, n_neurons, numpy.count_nonzero(invalid))
+            choices[to_check] = checking
+            to_check = to_check[numpy.any(invalid, axis=1)]
+        return choices
+
+    @staticmethod
+    def _get_choices_in_slices(choices, row_slice, choice_slice):
+        """ Get the choices of a slice of rows that are in a slice of the\
+            neurons chosen from
+
+        :param choices: The neurons chosen, as from _choose_random_neurons
+        :param row_slice: The slice of rows
+        :param choice_slice: The slice of neurons chosen from
+        :return: The row and neuron of each choice, in row order
+        :rtype: (array of uint32, array of uint32)
+        """
+        row_choices = choices[row_slice.as_slice]
+        row_ids = numpy.arange(
+            row_slice.lo_atom, row_slice.hi_atom + 1, dtype="uint32")
+        row_offsets = row_ids.astype("uint64") << numpy.uint64(32)
+
+        # Offset each row so that all the choices are sorted together, and
+        # find where the slice starts and ends in each row
+        keys = (row_choices + row_offsets[:, None]).ravel()
+        starts = numpy.searchsorted(
+            keys, row_offsets + numpy.uint64(choice_slice.lo_atom))
+        ends = numpy.searchsorted(
+            keys, row_offsets + numpy.uint64(choice_slice.hi_atom + 1))
+        counts = ends - starts
+        indices = numpy.arange(numpy.sum(counts)) + numpy.repeat(
+            starts - (numpy.cumsum(counts) - counts), counts)
+        return numpy.repeat(row_ids, counts), row_choices.ravel()[indices]
+
+    def _get_pre_position_index(self):
+        """ Get a spatial index of the pre-population positions, in the\
+            axes of the space
+        """
+        # PyNN gives the positions with a row per axis and a column per
+        # neuron, but the index needs a row per neuron
+        pre_positions = numpy.asarray(self._pre_population.positions)
+        return cKDTree(pre_positions[self._space.axes].T)
+
+    def _get_post_index_positions(self, post_ids):
+        """ Get the positions of post-population neurons in the space of the\
+            pre-population index, with their images across any periodic\
+            boundaries of the space
+        """
+        positions = numpy.asarray(
+            self._post_population.positions)[:, post_ids]
+        positions = (self._space.scale_factor *
+                     (positions + self._space.offset))[self._space.axes].T
+        shifts = [[0.0] for _ in self._space.axes]
+        if self._space.periodic_boundaries is not None:
+            for i, axis in enumerate(self._space.axes):
+                boundaries = self._space.periodic_boundaries[axis]
+                if boundaries is not None:
+                    size = boundaries[1] - boundaries[0]
+                    shifts[i] = [0.0, -size, size]
+        return [positions + numpy.array(shift)
+                for shift in itertools.product(*shifts)]
+
+    def _iter_neighbours(
+            self, pre_index, post_lo_atom, post_hi_atom, max_distance,
+            expand_distances):
+        """ Find the pre-synaptic neurons that are within a distance of each\
+            post-synaptic neuron in a range, using a spatial index of the\
+            pre-population
+
+        :param pre_index: The index from _get_pre_position_index
+        :param max_distance: The (inclusive) distance to search within
+        :param expand_distances: Whether to give the distance in each axis
+        :return: An iterable of (post-synaptic id, sorted pre-synaptic ids,\
+            distances of the pre-synaptic neurons as given by the space)
+        """
+        # pylint: disable=too-many-arguments
+        post_ids = numpy.arange(post_lo_atom, post_hi_atom + 1)
+        neighbours = [
+            pre_index.query_ball_point(positions, max_distance)
+            for positions in self._get_post_index_positions(post_ids)]
+        pre_positions = numpy.asarray(self._pre_population.positions)
+        post_positions = numpy.asarray(self._post_population.positions)
+        for i, post_id in enumerate(post_ids):
+            pre_ids = numpy.unique(numpy.concatenate([
+                numpy.asarray(found[i], dtype="uint32")
+                for found in neighbours]))
+            if not len(pre_ids):
+                yield post_id, pre_ids, numpy.zeros(0)
+                continue
+            d = self._space.distances(
+                pre_positions[:, pre_ids],
+                post_positions[:, post_id:post_id + 1], expand_distances)
+            if expand_distances:
+                d = numpy.reshape(d, (-1, len(pre_ids)))
+            else:
+                d = numpy.reshape(d, len(pre_ids))
+            yield post_id, pre_ids, d
+
     def _generate_values(self, values, n_connections, connection_slices):
         if get_simulator().is_a_pynn_random(values):
             if n_connections == 1:
@@ -349,6 +518,86 @@ class AbstractConnector(object):
 
         return self._clip_delays(delays)
 
+    def _are_weights_and_delays_deterministic(self):
+        """ Determine if the weights and delays can be generated without\
+            drawing from a random number generator.
+        """
+        return (not get_simulator().is_a_pynn_random(self._weights) and
+                not get_simulator().is_a_pynn_random(self._delays))
+
+    @property
+    def is_deterministic(self):
+        """ True if the synaptic blocks created by this connector do not\
+            depend on the state of any random number generator, and so can\
+            be created in any order (including in another process).
+        """
+        return False
+
+    def get_block_cache_parameters(self):
+        """ Get the parameters that determine the synaptic blocks created by\
+            this connector, to identify the blocks when they are reused\
+            between runs.
+
+        :return: a list of values (numbers, strings or numpy arrays), or\
+            None if the blocks can't be identified by parameters, e.g. as\
+            they depend on the state of a random number generator
+        :rtype: list or None
+        """
+        return None
+
+    def get_block_cache_digest(self):
+        """ Get a digest of the block cache parameters of this connector,\
+            which is computed once rather than for each block, as the\
+            parameters can be large.
+
+        :return: the digest, or None if the blocks can't be identified by\
+            parameters
+        :rtype: str or None
+        """
+        if self._block_cache_digest is None:
+            parameters = self.get_block_cache_parameters()
+            if parameters is None:
+                return None
+            self._block_cache_digest = utility_calls.get_digest(parameters)
+        return self._block_cache_digest
+
+    def _get_block_cache_parameters(self, *parameters):
+        """ Get the block cache parameters of a deterministic connector,\
+            including those common to all connectors
+
+        :param parameters: The parameters specific to the connector
+        """
+        if (not self.is_deterministic or
+                isinstance(self._weights, string_types) or
+                isinstance(self._delays, string_types)):
+            return None
+        return [self.__class__.__name__, self._n_pre_neurons,
+                self._n_post_neurons,
+                self._pre_population is self._post_population,
+                self._weights, self._delays] + list(parameters)
+
+    @property
+    def can_create_blocks_for_all_pre_neurons(self):
+        """ True if a synaptic block can be created for all the pre-synaptic\
+            neurons at once and then divided by pre-synaptic slice, i.e. the\
+            connections do not depend on how the pre- and post-synaptic\
+            populations are divided into slices.
+        """
+        return True
+
+    def could_connect(self, pre_vertex_slice, post_vertex_slice):
+        """ Determine if there could be any connections between a slice of\
+            the pre-population and a slice of the post-population; a\
+            connector that can't tell cheaply should assume there could be.
+
+        :param pre_vertex_slice: The slice of the pre-population
+        :param post_vertex_slice: The slice of the post-population
+        :return: False only if there are definitely no connections
+        :rtype: bool
+        """
+        # pylint: disable=unused-argument
+        return True
+
     @abstractmethod
     def create_synaptic_block(
             self, pre_slices, pre_slice_index, post_slices,
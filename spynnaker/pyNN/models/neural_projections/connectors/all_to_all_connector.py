@@ -76,6 +76,15 @@ class AllToAllConnector(AbstractGenerateConnectorOnMachine):
         n_connections = self._n_pre_neurons * self._n_post_neurons
         return self._get_weight_maximum(n_connections)
 
+    @property
+    @overrides(AbstractConnector.is_deterministic)
+    def is_deterministic(self):
+        return self._are_weights_and_delays_deterministic()
+
+    @overrides(AbstractConnector.get_block_cache_parameters)
+    def get_block_cache_parameters(self):
+        return self._get_block_cache_parameters(self._allow_self_connections)
+
     @overrides(AbstractConnector.create_synaptic_block)
     def create_synaptic_block(
             self, pre_slices, pre_slice_index, post_slices,
@@ -67,6 +67,15 @@ class ArrayConnector(AbstractConnector):
     def get_weight_maximum(self):
         return self._get_weight_maximum(self._n_total_connections)
 
+    @property
+    @overrides(AbstractConnector.is_deterministic)
+    def is_deterministic(self):
+        return self._are_weights_and_delays_deterministic()
+
+    @overrides(AbstractConnector.get_block_cache_parameters)
+    def get_block_cache_parameters(self):
+        return self._get_block_cache_parameters(numpy.asarray(self._array))
+
     @overrides(AbstractConnector.create_synaptic_block)
     def create_synaptic_block(
             self, pre_slices, pre_slice_index, post_slices,
@@ -13,6 +13,11 @@ from numpy import log, log10, modf, power, sin, sinh, sqrt
 from numpy import tan, tanh, maximum, minimum, e, pi
 
 logger = logging.getLogger(__name__)
+
+# The number of post-synaptic neurons for which candidate connections are
+# found at a time when working out statistics of the whole projection
+_STATISTICS_N_POST_NEURONS = 256
+
 _d_expr_context = SafeEval(math, numpy, arccos, arcsin, arctan, arctan2, ceil,
                            cos, cosh, exp, fabs, floor, fmod, hypot, ldexp,
                            log, log10, modf, power, sin, sinh, sqrt, tan, tanh,
@@ -26,11 +31,16 @@ class DistanceDependentProbabilityConnector(AbstractConnector):
     __slots__ = [
         "_allow_self_connections",
         "_d_expression",
-        "_probs"]
+        "_probs",
+        "_cutoff_distance",
+        "_pre_tree",
+        "_candidates",
+        "_candidate_sources",
+        "_candidate_statistics"]
 
     def __init__(
             self, d_expression, allow_self_connections=True, safe=True,
-            verbose=False, n_connections=None):
+            verbose=False, n_connections=None, cutoff_distance=None):
         """
         :param d_expression:\
             the right-hand side of a valid python expression for\
@@ -50,12 +60,34 @@ class DistanceDependentProbabilityConnector(AbstractConnector):
         :param n_connections:\
             The number of efferent synaptic connections per neuron.
         :type n_connections: int or None
+        :param cutoff_distance:\
+            The distance beyond which the probability of connection is zero.\
+            If given, only the pairs of neurons closer than this are\
+            considered, found using a spatial index of the positions, rather\
+            than computing the probability of every pair of neurons.
+        :type cutoff_distance: float or None
         """
         # pylint: disable=too-many-arguments
         super(DistanceDependentProbabilityConnector, self).__init__(
             safe, verbose)
         self._d_expression = d_expression
         self._allow_self_connections = allow_self_connections
+        self._cutoff_distance = cutoff_distance
+        self._probs = None
+
+        # The spatial index of the pre-population, when using a cutoff
+        self._pre_tree = None
+
+        # The candidate connections to the last post slice used, when using
+        # a cutoff
+        self._candidates = None
+
+        # The sorted sources of the candidate connections by post slice, when
+        # using a cutoff
+        self._candidate_sources = dict()
+
+        # The statistics of all candidate connections, when using a cutoff
+        self._candidate_statistics = None
 
         if n_connections is not None:
             raise NotImplementedError(
@@ -70,6 +102,10 @@ class DistanceDependentProbabilityConnector(AbstractConnector):
         self._set_probabilities()
 
     def _set_probabilities(self):
+        if self._cutoff_distance is not None:
+            self._set_pre_tree()
+            return
+
         # Set the probabilities up-front for now
         # TODO: Work out how this can be done statistically
         expand_distances = self._expand_distances(self._d_expression)
@@ -83,30 +119,117 @@ class DistanceDependentProbabilityConnector(AbstractConnector):
         # so the easiest thing to do here is to reshape back to the "expected"
         # PyNN 0.7 shape; otherwise later code gets confusing and difficult
         if (len(d1.shape) == 1):
-            d = numpy.reshape(d1, (pre_positions.shape[0],
-                                   post_positions.shape[0]))
+            d = numpy.reshape(d1, (pre_positions.shape[1],
+                                   post_positions.shape[1]))
         else:
             d = d1
 
         self._probs = _d_expr_context.eval(self._d_expression, d=d)
 
+    def _set_pre_tree(self):
+        self._pre_tree = self._get_pre_position_index()
+        self._candidates = None
+        self._candidate_sources = dict()
+        self._candidate_statistics = None
+
+    def _find_candidates(self, post_lo_atom, post_hi_atom):
+        """ Find the pairs of neurons closer than the cutoff distance, with\
+            a post-synaptic neuron in the given range, and their probability\
+            of connection
+
+        :return: pre-synaptic ids, post-synaptic ids and probabilities,\
+            sorted by post-synaptic id
+        """
+        all_pre_ids = list()
+        all_post_ids = list()
+        all_probs = list()
+        for post_id, pre_ids, d in self._iter_neighbours(
+                self._pre_tree, post_lo_atom, post_hi_atom,
+                self._cutoff_distance,
+                self._expand_distances(self._d_expression)):
+            if not len(pre_ids):
+                continue
+            probs = _d_expr_context.eval(self._d_expression, d=d)
+            all_pre_ids.append(pre_ids)
+            all_post_ids.append(numpy.repeat(post_id, len(pre_ids)))
+            all_probs.append(numpy.broadcast_to(probs, len(pre_ids)))
+        if not all_pre_ids:
+            return (numpy.zeros(0, dtype="uint32"),
+                    numpy.zeros(0, dtype="uint32"), numpy.zeros(0))
+        return (numpy.concatenate(all_pre_ids),
+                numpy.concatenate(all_post_ids).astype("uint32"),
+                numpy.concatenate(all_probs).astype("float64"))
+
+    def _get_candidates(self, post_vertex_slice):
+        """ Get the candidate connections to a post slice; these are kept\
+            for the last post slice used, as the blocks of a post slice are\
+            created together
+        """
+        slice_id = (post_vertex_slice.lo_atom, post_vertex_slice.hi_atom)
+        if self._candidates is None or self._candidates[0] != slice_id:
+            self._candidates = (slice_id, self._find_candidates(
+                post_vertex_slice.lo_atom, post_vertex_slice.hi_atom))
+        return self._candidates[1]
+
+    def _get_candidate_statistics(self):
+        """ Get the total number of candidate connections, the maximum\
+            number of candidate connections to any post-synaptic neuron and\
+            the maximum probability of any candidate connection
+        """
+        if self._candidate_statistics is None:
+            n_total = 0
+            max_n_to_post = 0
+            max_prob = 0.0
+            for lo_atom in range(
+                    0, self._n_post_neurons, _STATISTICS_N_POST_NEURONS):
+                hi_atom = min(lo_atom + _STATISTICS_N_POST_NEURONS,
+                              self._n_post_neurons) - 1
+                _, post_ids, probs = self._find_candidates(lo_atom, hi_atom)
+                if not len(post_ids):
+                    continue
+                n_total += len(post_ids)
+                max_n_to_post = max(
+                    max_n_to_post, numpy.max(numpy.bincount(post_ids)))
+                max_prob = max(max_prob, numpy.amax(probs))
+            self._candidate_statistics = (n_total, max_n_to_post, max_prob)
+        return self._candidate_statistics
+
+    def _get_n_connections_maximum(self):
+        """ Get the likely maximum number of connections in the projection
+        """
+        if self._cutoff_distance is not None:
+            n_total, _, max_prob = self._get_candidate_statistics()
+            if n_total == 0:
+                return 0
+            return utility_calls.get_probable_maximum_selected(
+                n_total, n_total, max_prob)
+        return utility_calls.get_probable_maximum_selected(
+            self._n_pre_neurons * self._n_post_neurons,
+            self._n_pre_neurons * self._n_post_neurons,
+            numpy.amax(self._probs))
+
     @overrides(AbstractConnector.get_delay_maximum)
     def get_delay_maximum(self):
-        return self._get_delay_maximum(
-            utility_calls.get_probable_maximum_selected(
-                self._n_pre_neurons * self._n_post_neurons,
-                self._n_pre_neurons * self._n_post_neurons,
-                numpy.amax(self._probs)))
+        return self._get_delay_maximum(self._get_n_connections_maximum())
 
     @overrides(AbstractConnector.get_n_connections_from_pre_vertex_maximum)
     def get_n_connections_from_pre_vertex_maximum(
             self, post_vertex_slice, min_delay=None, max_delay=None):
         # pylint: disable=too-many-arguments
-        max_prob = numpy.amax(
-            self._probs[0:self._n_pre_neurons, post_vertex_slice.as_slice])
-        n_connections = utility_calls.get_probable_maximum_selected(
-            self._n_pre_neurons * self._n_post_neurons,
-            post_vertex_slice.n_atoms, max_prob)
+        if self._cutoff_distance is not None:
+            pre_ids, _, probs = self._get_candidates(post_vertex_slice)
+            if not len(pre_ids):
+                return 0
+            n_connections = utility_calls.get_probable_maximum_selected(
+                self._n_pre_neurons * self._n_post_neurons,
+                numpy.max(numpy.bincount(pre_ids)), numpy.amax(probs))
+        else:
+            max_prob = numpy.amax(
+                self._probs[0:self._n_pre_neurons,
+                            post_vertex_slice.as_slice])
+            n_connections = utility_calls.get_probable_maximum_selected(
+                self._n_pre_neurons * self._n_post_neurons,
+                post_vertex_slice.n_atoms, max_prob)
 
         if min_delay is None or max_delay is None:
             return int(math.ceil(n_connections))
@@ -118,6 +241,13 @@ class DistanceDependentProbabilityConnector(AbstractConnector):
     @overrides(AbstractConnector.get_n_connections_to_post_vertex_maximum)
     def get_n_connections_to_post_vertex_maximum(self):
         # pylint: disable=too-many-arguments
+        if self._cutoff_distance is not None:
+            _, max_n_to_post, max_prob = self._get_candidate_statistics()
+            if max_n_to_post == 0:
+                return 0
+            return utility_calls.get_probable_maximum_selected(
+                self._n_pre_neurons * self._n_post_neurons, max_n_to_post,
+                max_prob)
         return utility_calls.get_probable_maximum_selected(
             self._n_pre_neurons * self._n_post_neurons, self._n_post_neurons,
             numpy.amax(self._probs))
@@ -125,17 +255,35 @@ class DistanceDependentProbabilityConnector(AbstractConnector):
     @overrides(AbstractConnector.get_weight_maximum)
     def get_weight_maximum(self):
         # pylint: disable=too-many-arguments
-        return self._get_weight_maximum(
-            utility_calls.get_probable_maximum_selected(
-                self._n_pre_neurons * self._n_post_neurons,
-                self._n_pre_neurons * self._n_post_neurons,
-                numpy.amax(self._probs)))
+        return self._get_weight_maximum(self._get_n_connections_maximum())
+
+    @overrides(AbstractConnector.could_connect)
+    def could_connect(self, pre_vertex_slice, post_vertex_slice):
+        if self._cutoff_distance is None:
+            return bool(numpy.any(self._probs[
+                pre_vertex_slice.as_slice, post_vertex_slice.as_slice] > 0))
+
+        # Keep the possible sources of each post slice, as the candidates
+        # are only kept for the last post slice
+        slice_id = (post_vertex_slice.lo_atom, post_vertex_slice.hi_atom)
+        sources = self._candidate_sources.get(slice_id)
+        if sources is None:
+            pre_ids, _, probs = self._get_candidates(post_vertex_slice)
+            sources = numpy.unique(pre_ids[probs > 0])
+            self._candidate_sources[slice_id] = sources
+        start, end = numpy.searchsorted(sources, numpy.array(
+            [pre_vertex_slice.lo_atom, pre_vertex_slice.hi_atom + 1],
+            dtype=sources.dtype))
+        return end > start
 
     @overrides(AbstractConnector.create_synaptic_block)
     def create_synaptic_block(
             self, pre_slices, pre_slice_index, post_slices,
             post_slice_index, pre_vertex_slice, post_vertex_slice,
             synapse_type):
+        if self._cutoff_distance is not None:
+            return self._create_synaptic_block_from_candidates(
+                pre_vertex_slice, post_vertex_slice, synapse_type)
 
         probs = self._probs[
             pre_vertex_slice.as_slice, post_vertex_slice.as_slice].reshape(-1)
@@ -164,6 +312,32 @@ class DistanceDependentProbabilityConnector(AbstractConnector):
         block["synapse_type"] = synapse_type
         return block
 
+    def _create_synaptic_block_from_candidates(
+            self, pre_vertex_slice, post_vertex_slice, synapse_type):
+        pre_ids, post_ids, probs = self._get_candidates(post_vertex_slice)
+        in_pre_slice = ((pre_ids >= pre_vertex_slice.lo_atom) &
+                        (pre_ids <= pre_vertex_slice.hi_atom))
+        if not self._allow_self_connections:
+            in_pre_slice &= pre_ids != post_ids
+        pre_ids = pre_ids[in_pre_slice]
+        post_ids = post_ids[in_pre_slice]
+        present = numpy.zeros(len(pre_ids), dtype="bool")
+        if len(pre_ids):
+            items = numpy.atleast_1d(self._rng.next(len(pre_ids)))
+            present = items < probs[in_pre_slice]
+        n_connections = numpy.sum(present)
+
+        block = numpy.zeros(
+            n_connections, dtype=self.NUMPY_SYNAPSES_DTYPE)
+        block["source"] = pre_ids[present]
+        block["target"] = post_ids[present]
+        block["weight"] = self._generate_weights(
+            self._weights, n_connections, None)
+        block["delay"] = self._generate_delays(
+            self._delays, n_connections, None)
+        block["synapse_type"] = synapse_type
+        return block
+
     def __repr__(self):
         return "DistanceDependentProbabilityConnector({})".format(
             self._d_expression)
@@ -183,3 +357,10 @@ class DistanceDependentProbabilityConnector(AbstractConnector):
     @d_expression.setter
     def d_expression(self, new_value):
         self._d_expression = new_value
+        self._candidates = None
+        self._candidate_sources = dict()
+        self._candidate_statistics = None
+
+    @property
+    def cutoff_distance(self):
+        return self._cutoff_distance
@@ -75,10 +75,16 @@ class FixedNumberPostConnector(AbstractConnector):
     def _get_post_neurons(self):
         # If we haven't set the array up yet, do it now
         if not self._post_neurons_set:
-            self._post_neurons = [None] * self._n_pre_neurons
+            # Choose the post-neurons of all the pre-neurons at once, sorted
+            # for each pre-neuron
+            self._post_neurons = self._choose_random_neurons(
+                self._n_pre_neurons, self._n_post, self._n_post_neurons,
+                self._with_replacement,
+                self._pre_population is self._post_population and
+                not self._allow_self_connections)
             self._post_neurons_set = True
 
-            # if verbose open a file to output the connectivity
+            # if verbose output the list connected to each pre-neuron
             if self._verbose:
                 filename = self._pre_population.label + '_to_' + \
                     self._post_population.label + '_fixednumberpost-conn.csv'
@@ -88,50 +94,11 @@ class FixedNumberPostConnector(AbstractConnector):
                                   [(self._n_pre_neurons, self._n_post_neurons,
                                     self._n_post)],
                                   fmt="%u,%u,%u")
-
-            # Loop over all the pre neurons
-            for m in range(0, self._n_pre_neurons):
-                if self._post_neurons[m] is None:
-
-                    # If the pre and post populations are the same
-                    # then deal with allow_self_connections=False
-                    if (self._pre_population is self._post_population and
-                            not self._allow_self_connections):
-
-                        # Create a list without the pre_neuron in it
-                        no_self_post_neurons = numpy.concatenate(
-                            [numpy.arange(0, m),
-                             numpy.arange(m + 1, self._n_post_neurons)])
-
-                        # Now use this list in the random choice
-                        self._post_neurons[m] = numpy.random.choice(
-                            no_self_post_neurons, self._n_post,
-                            self._with_replacement)
-                    else:
-                        self._post_neurons[m] = numpy.random.choice(
-                            self._n_post_neurons, self._n_post,
-                            self._with_replacement)
-
-                    # If verbose then output the list connected to this
-                    # pre-neuron
-                    if self._verbose:
-                        numpy.savetxt(file_handle,
-                                      self._post_neurons[m][None, :],
-                                      fmt=("%u,"*(self._n_post-1)+"%u"))
+                    numpy.savetxt(file_handle, self._post_neurons,
+                                  fmt=("%u,"*(self._n_post-1)+"%u"))
 
         return self._post_neurons
 
-    def _post_neurons_in_slice(self, post_vertex_slice, n):
-        post_neurons = self._get_post_neurons()
-
-        # Get the nth array and get the bits we need for
-        # this post-vertex slice
-        this_post_neuron_array = post_neurons[n]
-
-        return this_post_neuron_array[
-            (this_post_neuron_array >= post_vertex_slice.lo_atom) &
-            (this_post_neuron_array <= post_vertex_slice.hi_atom)]
-
     @overrides(AbstractConnector.get_n_connections_from_pre_vertex_maximum)
     def get_n_connections_from_pre_vertex_maximum(
             self, post_vertex_slice, min_delay=None, max_delay=None):
@@ -164,39 +131,29 @@ class FixedNumberPostConnector(AbstractConnector):
         n_connections = self._n_pre_neurons * self._n_post
         return self._get_weight_maximum(n_connections)
 
+    @overrides(AbstractConnector.could_connect)
+    def could_connect(self, pre_vertex_slice, post_vertex_slice):
+        _, targets = self._get_choices_in_slices(
+            self._get_post_neurons(), pre_vertex_slice, post_vertex_slice)
+        return len(targets) > 0
+
     @overrides(AbstractConnector.create_synaptic_block)
     def create_synaptic_block(
             self, pre_slices, pre_slice_index, post_slices,
             post_slice_index, pre_vertex_slice, post_vertex_slice,
             synapse_type):
         # pylint: disable=too-many-arguments
-        # Get lo and hi for the pre vertex
-        lo = pre_vertex_slice.lo_atom
-        hi = pre_vertex_slice.hi_atom
-
-        # Get number of connections
-        n_connections = 0
-        for n in range(lo, hi + 1):
-            n_connections += len(
-                self._post_neurons_in_slice(post_vertex_slice, n))
+        # Get the post-neurons in the post slice of each pre-neuron in the
+        # pre slice
+        sources, targets = self._get_choices_in_slices(
+            self._get_post_neurons(), pre_vertex_slice, post_vertex_slice)
+        n_connections = len(sources)
 
         # Set up the block
         block = numpy.zeros(
             n_connections, dtype=AbstractConnector.NUMPY_SYNAPSES_DTYPE)
-
-        # Set up source and target
-        pre_neurons_in_slice = []
-        post_neurons_in_slice = []
-        pre_vertex_array = numpy.arange(lo, hi + 1)
-        for n in range(lo, hi + 1):
-            post_neurons = self._post_neurons_in_slice(
-                post_vertex_slice, n)
-            for m in range(0, len(post_neurons)):
-                post_neurons_in_slice.append(post_neurons[m])
-                pre_neurons_in_slice.append(pre_vertex_array[n-lo])
-
-        block["source"] = pre_neurons_in_slice
-        block["target"] = post_neurons_in_slice
+        block["source"] = sources
+        block["target"] = targets
 
         block["weight"] = self._generate_weights(
             self._weights, n_connections, None)
@@ -77,10 +77,16 @@ class FixedNumberPreConnector(AbstractConnector):
     def _get_pre_neurons(self):
         # If we haven't set the array up yet, do it now
         if not self._pre_neurons_set:
-            self._pre_neurons = [None] * self._n_post_neurons
+            # Choose the pre-neurons of all the post-neurons at once, sorted
+            # for each post-neuron
+            self._pre_neurons = self._choose_random_neurons(
+                self._n_post_neurons, self._n_pre, self._n_pre_neurons,
+                self._with_replacement,
+                self._pre_population is self._post_population and
+                not self._allow_self_connections)
             self._pre_neurons_set = True
 
-            # if verbose open a file to output the connectivity
+            # if verbose output the list connected to each post-neuron
             if self._verbose:
                 filename = self._pre_population.label + '_to_' + \
                     self._post_population.label + '_fixednumberpre-conn.csv'
@@ -89,50 +95,11 @@ class FixedNumberPreConnector(AbstractConnector):
                                   [(self._n_pre_neurons, self._n_post_neurons,
                                     self._n_pre)],
                                   fmt="%u,%u,%u")
-
-            # Loop over all the post neurons
-            for m in range(0, self._n_post_neurons):
-
-                # If the pre and post populations are the same
-                # then deal with allow_self_connections=False
-                if (self._pre_population is self._post_population and
-                        not self._allow_self_connections):
-                    # Exclude the current pre-neuron from the post-neuron
-                    # list
-                    no_self_pre_neurons = [
-                        n for n in range(self._n_pre_neurons) if n != m]
-
-                    # Now use this list in the random choice
-                    self._pre_neurons[m] = numpy.random.choice(
-                        no_self_pre_neurons, self._n_pre,
-                        self._with_replacement)
-                else:
-                    self._pre_neurons[m] = numpy.random.choice(
-                        self._n_pre_neurons, self._n_pre,
-                        self._with_replacement)
-
-                # Sort the neurons now that we have them
-                self._pre_neurons[m].sort()
-
-                # If verbose then output the list connected to this
-                # post-neuron
-                if self._verbose:
-                    numpy.savetxt(file_handle,
-                                  self._pre_neurons[m][None, :],
+                    numpy.savetxt(file_handle, self._pre_neurons,
                                   fmt=("%u,"*(self._n_pre-1)+"%u"))
 
         return self._pre_neurons
 
-    def _pre_neurons_in_slice(self, pre_vertex_slice, n):
-        pre_neurons = self._get_pre_neurons()
-
-        # Take the nth array and get the bits from it we need
-        # for this pre-vertex slice
-        this_pre_neuron_array = pre_neurons[n]
-        return this_pre_neuron_array[
-            (this_pre_neuron_array >= pre_vertex_slice.lo_atom) &
-            (this_pre_neuron_array <= pre_vertex_slice.hi_atom)]
-
     @overrides(AbstractConnector.get_n_connections_from_pre_vertex_maximum)
     def get_n_connections_from_pre_vertex_maximum(
             self, post_vertex_slice, min_delay=None, max_delay=None):
@@ -165,6 +132,12 @@ class FixedNumberPreConnector(AbstractConnector):
         # pylint: disable=too-many-arguments
         return self._get_weight_maximum(self._n_pre * self._n_post_neurons)
 
+    @overrides(AbstractConnector.could_connect)
+    def could_connect(self, pre_vertex_slice, post_vertex_slice):
+        _, sources = self._get_choices_in_slices(
+            self._get_pre_neurons(), post_vertex_slice, pre_vertex_slice)
+        return len(sources) > 0
+
     @overrides(AbstractConnector.create_synaptic_block)
     def create_synaptic_block(
             self, pre_slices, pre_slice_index, post_slices,
@@ -172,33 +145,17 @@ class FixedNumberPreConnector(AbstractConnector):
             synapse_type):
         # pylint: disable=too-many-arguments
 
-        # Get lo and hi for the post vertex
-        lo = post_vertex_slice.lo_atom
-        hi = post_vertex_slice.hi_atom
-
-        # Get number of connections
-        n_connections = 0
-        for n in range(lo, hi + 1):
-            n_connections += len(self._pre_neurons_in_slice(
-                pre_vertex_slice, n))
+        # Get the pre-neurons in the pre slice of each post-neuron in the
+        # post slice
+        targets, sources = self._get_choices_in_slices(
+            self._get_pre_neurons(), post_vertex_slice, pre_vertex_slice)
+        n_connections = len(sources)
 
         # Set up the block
         block = numpy.zeros(
             n_connections, dtype=AbstractConnector.NUMPY_SYNAPSES_DTYPE)
-
-        # Set up source and target
-        pre_neurons_in_slice = []
-        post_neurons_in_slice = []
-        post_vertex_array = numpy.arange(lo, hi + 1)
-        for n in range(lo, hi + 1):
-            pre_neurons = self._pre_neurons_in_slice(
-                pre_vertex_slice, n)
-            for m in range(0, len(pre_neurons)):
-                pre_neurons_in_slice.append(pre_neurons[m])
-                post_neurons_in_slice.append(post_vertex_array[n-lo])
-
-        block["source"] = pre_neurons_in_slice
-        block["target"] = post_neurons_in_slice
+        block["source"] = sources
+        block["target"] = targets
 
         block["weight"] = self._generate_weights(
             self._weights, n_connections, None)
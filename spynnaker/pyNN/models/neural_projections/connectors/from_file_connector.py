@@ -1,20 +1,42 @@
 from spinn_utilities.abstract_base import AbstractBase, abstractmethod
+from spinn_utilities.overrides import overrides
+from spynnaker.pyNN.utilities.connection_file import (
+    is_binary_connection_file, read_binary_connection_file)
 from .from_list_connector import FromListConnector
 import os
 import numpy
 from six import add_metaclass, string_types
 
+# The number of connections to process at a time when computing statistics
+# of memory-mapped connections
+_CHUNK_SIZE = 1 << 20
+
 
 @add_metaclass(AbstractBase)
 class FromFileConnector(FromListConnector):
+    """ Make connections according to a file.  The file can be a binary\
+        connection file (see\
+        :py:mod:`spynnaker.pyNN.utilities.connection_file`), in which case\
+        the connections are memory-mapped rather than read into memory.
+    """
     # pylint: disable=redefined-builtin
-    __slots__ = ["_file"]
+    __slots__ = [
+        "_file",
+        "_is_mapped",
+        "_post_slice_connections",
+        "_statistics"]
 
     def __init__(
             self, file,  # @ReservedAssignment
             distributed=False, safe=True, verbose=False):
         self._file = file
-        if isinstance(file, string_types):
+        self._is_mapped = False
+        n_sources = None
+        if (isinstance(file, string_types) and not distributed and
+                is_binary_connection_file(file)):
+            conn_list, n_sources = read_binary_connection_file(file)
+            self._is_mapped = True
+        elif isinstance(file, string_types):
             real_file = self.get_reader(file)
             try:
                 conn_list = self._read_conn_list(real_file, distributed)
@@ -24,6 +46,17 @@ class FromFileConnector(FromListConnector):
             conn_list = self._read_conn_list(file, distributed)
         super(FromFileConnector, self).__init__(conn_list, safe, verbose)
 
+        # The connections to the last post slice used, with their sort keys
+        self._post_slice_connections = None
+
+        # Cached statistics of the memory-mapped connections by field
+        self._statistics = dict()
+
+        if self._is_mapped:
+            # The file holds weights and delays, and is already sorted
+            self._converted_weights_and_delays = True
+            self._n_sources = n_sources
+
     def _read_conn_list(self, the_file, distributed):
         if not distributed:
             return the_file.read()
@@ -39,6 +72,118 @@ class FromFileConnector(FromListConnector):
                     file_reader.close()
         return numpy.concatenate(conns)
 
+    def _get_post_slice_connections(self, post_vertex_slice):
+        if not self._is_mapped:
+            return super(FromFileConnector, self)._get_post_slice_connections(
+                post_vertex_slice)
+
+        # Only the sort keys of the connections to the current post slice are
+        # held in memory, as the blocks of a post slice are made together
+        slice_id = (post_vertex_slice.lo_atom, post_vertex_slice.hi_atom)
+        if (self._post_slice_connections is None or
+                self._post_slice_connections[0] != slice_id):
+            targets = self._conn_list["target"]
+            start, end = numpy.searchsorted(targets, numpy.array([
+                post_vertex_slice.lo_atom, post_vertex_slice.hi_atom + 1],
+                dtype=targets.dtype))
+            items = self._conn_list[start:end]
+            keys = ((items["target"].astype("uint64") * self._n_sources) +
+                    items["source"])
+            self._post_slice_connections = (slice_id, items, keys)
+        return self._post_slice_connections[1:]
+
+    def _get_statistics(self, field, absolute):
+        """ Get the mean, maximum and variance of a field of the\
+            memory-mapped connections, reading a chunk of them at a time
+        """
+        if (field, absolute) in self._statistics:
+            return self._statistics[field, absolute]
+        values = self._conn_list[field]
+        n_values = 0
+        mean = 0.0
+        sum_sq_diff = 0.0
+        maximum = None
+        for start in range(0, len(values), _CHUNK_SIZE):
+            chunk = numpy.array(values[start:start + _CHUNK_SIZE])
+            if absolute:
+                chunk = numpy.abs(chunk)
+            chunk_mean = numpy.mean(chunk)
+            n_total = n_values + len(chunk)
+            delta = chunk_mean - mean
+            sum_sq_diff += (numpy.sum((chunk - chunk_mean) ** 2) +
+                            (delta ** 2) * n_values * len(chunk) / n_total)
+            mean += delta * len(chunk) / n_total
+            n_values = n_total
+            chunk_max = numpy.amax(chunk)
+            if maximum is None or chunk_max > maximum:
+                maximum = chunk_max
+        statistics = (mean, maximum, sum_sq_diff / n_values)
+        self._statistics[field, absolute] = statistics
+        return statistics
+
+    @overrides(FromListConnector.get_block_cache_parameters)
+    def get_block_cache_parameters(self):
+        if not self._is_mapped:
+            return super(FromFileConnector, self).get_block_cache_parameters()
+
+        # Identify the file rather than reading all of it for each block
+        return self._get_block_cache_parameters(
+            os.path.abspath(self._file), os.path.getsize(self._file),
+            os.path.getmtime(self._file))
+
+    @overrides(FromListConnector.get_delay_maximum)
+    def get_delay_maximum(self):
+        if self._is_mapped:
+            return self._get_statistics("delay", False)[1]
+        return super(FromFileConnector, self).get_delay_maximum()
+
+    @overrides(FromListConnector.get_delay_variance)
+    def get_delay_variance(self):
+        if self._is_mapped:
+            return self._get_statistics("delay", False)[2]
+        return super(FromFileConnector, self).get_delay_variance()
+
+    @overrides(FromListConnector.get_weight_mean)
+    def get_weight_mean(self):
+        if self._is_mapped:
+            return self._get_statistics("weight", True)[0]
+        return super(FromFileConnector, self).get_weight_mean()
+
+    @overrides(FromListConnector.get_weight_maximum)
+    def get_weight_maximum(self):
+        if self._is_mapped:
+            return self._get_statistics("weight", True)[1]
+        return super(FromFileConnector, self).get_weight_maximum()
+
+    @overrides(FromListConnector.get_weight_variance)
+    def get_weight_variance(self):
+        if self._is_mapped:
+            return self._get_statistics("weight", True)[2]
+        return super(FromFileConnector, self).get_weight_variance()
+
+    @overrides(FromListConnector.get_n_connections_to_post_vertex_maximum)
+    def get_n_connections_to_post_vertex_maximum(self):
+        if not self._is_mapped:
+            return super(FromFileConnector, self)\
+                .get_n_connections_to_post_vertex_maximum()
+
+        # The connections are sorted by target, so count the run of each
+        targets = self._conn_list["target"]
+        run_starts = numpy.searchsorted(targets, numpy.arange(
+            int(targets[-1]) + 2, dtype=targets.dtype))
+        return numpy.max(numpy.diff(run_starts))
+
+    @property
+    def conn_list(self):
+        return self._conn_list
+
+    @conn_list.setter
+    def conn_list(self, new_value):
+        FromListConnector.conn_list.fset(self, new_value)
+        self._is_mapped = False
+        self._post_slice_connections = None
+        self._statistics = dict()
+
     def __repr__(self):
         return "FromFileConnector({})".format(self._file)
 
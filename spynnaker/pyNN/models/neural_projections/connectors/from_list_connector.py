@@ -13,7 +13,10 @@ class FromListConnector(AbstractConnector):
     """
     __slots__ = [
         "_conn_list",
-        "_converted_weights_and_delays"]
+        "_converted_weights_and_delays",
+        "_n_sources",
+        "_sort_key",
+        "_max_n_connections"]
 
     CONN_LIST_DTYPE = numpy.dtype([
         ("source", numpy.uint32), ("target", numpy.uint32),
@@ -39,6 +42,14 @@ class FromListConnector(AbstractConnector):
                 " (pre_idx, post_idx)")
         self._conn_list = conn_list
 
+        # The sort key of each connection, set when the list is sorted
+        self._n_sources = None
+        self._sort_key = None
+
+        # The maximum number of connections from each source, by post slice
+        # and delay range
+        self._max_n_connections = dict()
+
         # supports setting these at different times
         self._weights = None
         self._delays = None
@@ -46,6 +57,10 @@ class FromListConnector(AbstractConnector):
 
     @overrides(AbstractConnector.set_weights_and_delays)
     def set_weights_and_delays(self, weights, delays):
+        # Nothing to do if the list already has its weights and delays
+        if self._converted_weights_and_delays:
+            return
+
         # set the data if not already set (supports none overriding via
         # synapse data)
         if self._weights is None:
@@ -58,9 +73,11 @@ class FromListConnector(AbstractConnector):
         # if got data, build connlist with correct dtypes
         if (self._weights is not None and self._delays is not None and not
                 self._converted_weights_and_delays):
-            # add weights and delays to the conn list
+            # add weights and delays to the conn list, which might have
+            # been given as a list of tuples
+            conn_list = numpy.asarray(self._conn_list)
             temp_conn_list = numpy.dstack(
-                (self._conn_list[:, 0], self._conn_list[:, 1],
+                (conn_list[:, 0], conn_list[:, 1],
                  self._weights, self._delays))[0]
 
             self._conn_list = list()
@@ -72,6 +89,7 @@ class FromListConnector(AbstractConnector):
             self._conn_list = numpy.asarray(self._conn_list,
                                             dtype=self.CONN_LIST_DTYPE)
             self._converted_weights_and_delays = True
+            self._block_cache_digest = None
 
     @overrides(AbstractConnector.get_delay_maximum)
     def get_delay_maximum(self):
@@ -81,23 +99,51 @@ class FromListConnector(AbstractConnector):
     def get_delay_variance(self):
         return numpy.var(self._conn_list["delay"])
 
+    def _sort_conn_list(self):
+        """ Sort the connections by target and then by source, so that the\
+            connections of each slice can be found without searching the\
+            whole list
+        """
+        if self._sort_key is not None:
+            return
+        self._n_sources = int(numpy.max(self._conn_list["source"])) + 1
+        key = ((self._conn_list["target"].astype("uint64") *
+                self._n_sources) + self._conn_list["source"])
+        order = numpy.argsort(key, kind="mergesort")
+        self._conn_list = self._conn_list[order]
+        self._sort_key = key[order]
+
+    def _get_post_slice_connections(self, post_vertex_slice):
+        """ Get the connections to a post slice and their sort keys, as\
+            views of the sorted list
+        """
+        self._sort_conn_list()
+        start, end = numpy.searchsorted(self._sort_key, numpy.array([
+            post_vertex_slice.lo_atom * self._n_sources,
+            (post_vertex_slice.hi_atom + 1) * self._n_sources],
+            dtype="uint64"))
+        return self._conn_list[start:end], self._sort_key[start:end]
+
     @overrides(AbstractConnector.get_n_connections_from_pre_vertex_maximum)
     def get_n_connections_from_pre_vertex_maximum(
             self, post_vertex_slice, min_delay=None, max_delay=None):
         # pylint: disable=too-many-arguments
-        mask = None
-        if min_delay is None or max_delay is None:
-            mask = ((self._conn_list["target"] >= post_vertex_slice.lo_atom) &
-                    (self._conn_list["target"] <= post_vertex_slice.hi_atom))
-        else:
-            mask = ((self._conn_list["target"] >= post_vertex_slice.lo_atom) &
-                    (self._conn_list["target"] <= post_vertex_slice.hi_atom) &
-                    (self._conn_list["delay"] >= min_delay) &
-                    (self._conn_list["delay"] <= max_delay))
-        sources = self._conn_list["source"][mask]
-        if sources.size == 0:
-            return 0
-        return numpy.max(numpy.bincount(sources.view('int32')))
+        key = (post_vertex_slice.lo_atom, post_vertex_slice.hi_atom,
+               min_delay, max_delay)
+        if key in self._max_n_connections:
+            return self._max_n_connections[key]
+
+        items, _ = self._get_post_slice_connections(post_vertex_slice)
+        sources = items["source"]
+        if min_delay is not None and max_delay is not None:
+            sources = sources[(items["delay"] >= min_delay) &
+                              (items["delay"] <= max_delay)]
+        max_n_connections = 0
+        if sources.size:
+            max_n_connections = numpy.max(
+                numpy.bincount(sources.view('int32')))
+        self._max_n_connections[key] = max_n_connections
+        return max_n_connections
 
     @overrides(AbstractConnector.get_n_connections_to_post_vertex_maximum)
     def get_n_connections_to_post_vertex_maximum(self):
@@ -118,22 +164,60 @@ class FromListConnector(AbstractConnector):
         # pylint: disable=too-many-arguments
         return numpy.var(numpy.abs(self._conn_list["weight"]))
 
+    @property
+    @overrides(AbstractConnector.is_deterministic)
+    def is_deterministic(self):
+        return True
+
+    @overrides(AbstractConnector.get_block_cache_parameters)
+    def get_block_cache_parameters(self):
+        return self._get_block_cache_parameters(self._conn_list)
+
+    @overrides(AbstractConnector.could_connect)
+    def could_connect(self, pre_vertex_slice, post_vertex_slice):
+        _, keys = self._get_post_slice_connections(post_vertex_slice)
+        if not len(keys) or pre_vertex_slice.lo_atom >= self._n_sources:
+            return False
+
+        # Look for connections from the pre slice to each target
+        n_sources = numpy.uint64(self._n_sources)
+        target_keys = numpy.arange(
+            post_vertex_slice.lo_atom, post_vertex_slice.hi_atom + 1,
+            dtype="uint64") * n_sources
+        starts = numpy.searchsorted(
+            keys, target_keys + numpy.uint64(pre_vertex_slice.lo_atom))
+        ends = numpy.searchsorted(keys, target_keys + min(
+            numpy.uint64(pre_vertex_slice.hi_atom + 1), n_sources))
+        return bool(numpy.any(ends > starts))
+
     @overrides(AbstractConnector.create_synaptic_block)
     def create_synaptic_block(
             self, pre_slices, pre_slice_index, post_slices,
             post_slice_index, pre_vertex_slice, post_vertex_slice,
             synapse_type):
         # pylint: disable=too-many-arguments
-        mask = ((self._conn_list["source"] >= pre_vertex_slice.lo_atom) &
-                (self._conn_list["source"] <= pre_vertex_slice.hi_atom) &
-                (self._conn_list["target"] >= post_vertex_slice.lo_atom) &
-                (self._conn_list["target"] <= post_vertex_slice.hi_atom))
-        items = self._conn_list[mask]
+        items, keys = self._get_post_slice_connections(post_vertex_slice)
+        if (pre_vertex_slice.lo_atom > 0 or
+                pre_vertex_slice.hi_atom + 1 < self._n_sources):
+            # Find the run of sources in the pre slice for each target
+            targets = numpy.arange(
+                post_vertex_slice.lo_atom, post_vertex_slice.hi_atom + 1,
+                dtype="uint64") * self._n_sources
+            starts = numpy.searchsorted(keys, targets + numpy.uint64(
+                min(pre_vertex_slice.lo_atom, self._n_sources)))
+            ends = numpy.searchsorted(keys, targets + numpy.uint64(
+                min(pre_vertex_slice.hi_atom + 1, self._n_sources)))
+            n_items = ends - starts
+            run_offsets = numpy.cumsum(n_items) - n_items
+            items = items[
+                numpy.arange(numpy.sum(n_items)) +
+                numpy.repeat(starts - run_offsets, n_items)]
         block = numpy.zeros(items.size, dtype=self.NUMPY_SYNAPSES_DTYPE)
         block["source"] = items["source"]
         block["target"] = items["target"]
         block["weight"] = items["weight"]
-        block["delay"] = self._clip_delays(items["delay"])
+        block["delay"] = items["delay"]
+        block["delay"] = self._clip_delays(block["delay"])
         block["synapse_type"] = synapse_type
         return block
 
@@ -148,3 +232,6 @@ class FromListConnector(AbstractConnector):
     @conn_list.setter
     def conn_list(self, new_value):
         self._conn_list = new_value
+        self._n_sources = None
+        self._sort_key = None
+        self._max_n_connections = dict()
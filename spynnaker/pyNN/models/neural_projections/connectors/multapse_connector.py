@@ -111,6 +111,12 @@ class MultapseConnector(AbstractGenerateConnectorOnMachine):
     def get_weight_maximum(self):
         return self._get_weight_maximum(self._num_synapses)
 
+    @property
+    @overrides(AbstractConnector.can_create_blocks_for_all_pre_neurons)
+    def can_create_blocks_for_all_pre_neurons(self):
+        # The number of connections of each block depends on the slices
+        return False
+
     @overrides(AbstractConnector.create_synaptic_block)
     def create_synaptic_block(
             self, pre_slices, pre_slice_index, post_slices,
@@ -36,6 +36,7 @@ class OneToOneConnector(AbstractGenerateConnectorOnMachine):
                 'in the previous projection. For now, set up a new connector.')
         self._weights = weights
         self._delays = delays
+        self._block_cache_digest = None
         self._check_parameters(weights, delays, allow_lists=True)
 
     @overrides(AbstractConnector.get_delay_maximum)
@@ -72,6 +73,20 @@ class OneToOneConnector(AbstractGenerateConnectorOnMachine):
         return self._get_weight_maximum(
             max((self._n_pre_neurons, self._n_post_neurons)))
 
+    @property
+    @overrides(AbstractConnector.is_deterministic)
+    def is_deterministic(self):
+        return self._are_weights_and_delays_deterministic()
+
+    @overrides(AbstractConnector.get_block_cache_parameters)
+    def get_block_cache_parameters(self):
+        return self._get_block_cache_parameters()
+
+    @overrides(AbstractConnector.could_connect)
+    def could_connect(self, pre_vertex_slice, post_vertex_slice):
+        return not (pre_vertex_slice.hi_atom < post_vertex_slice.lo_atom or
+                    pre_vertex_slice.lo_atom > post_vertex_slice.hi_atom)
+
     @overrides(AbstractConnector.create_synaptic_block)
     def create_synaptic_block(
             self, pre_slices, pre_slice_index, post_slices,
@@ -6,8 +6,12 @@ import numpy
 class SmallWorldConnector(AbstractConnector):
     __slots__ = [
         "_degree",
-        "_mask",
         "_n_connections",
+        "_n_from_pre_maximum",
+        "_post_indptr",
+        "_post_sources",
+        "_pre_indptr",
+        "_pre_targets",
         "_rewiring"]
 
     def __init__(
@@ -18,6 +22,17 @@ class SmallWorldConnector(AbstractConnector):
         self._rewiring = rewiring
         self._degree = degree
 
+        # The connections within the degree, as the sources of each target
+        # (compressed by column) and the targets of each source (compressed by
+        # row); only these are held, rather than a dense mask of all pairs
+        self._post_indptr = None
+        self._post_sources = None
+        self._pre_indptr = None
+        self._pre_targets = None
+
+        # The maximum number of connections from a pre-neuron by post slice
+        self._n_from_pre_maximum = dict()
+
         if n_connections is not None:
             raise NotImplementedError(
                 "n_connections is not implemented for"
@@ -31,27 +46,34 @@ class SmallWorldConnector(AbstractConnector):
         self._set_n_connections()
 
     def _set_n_connections(self):
-        # Get the probabilities up-front for now
-        # TODO: Work out how this can be done statistically
-        # space.distances(...) expects N,3 array in PyNN0.7, but 3,N in PyNN0.8
-        pre_positions = self._pre_population.positions
-        post_positions = self._post_population.positions
-
-        distances = self._space.distances(
-            pre_positions, post_positions, False)
-
-        # PyNN 0.8 returns a flattened (C-style) array from space.distances,
-        # so the easiest thing to do here is to reshape back to the "expected"
-        # PyNN 0.7 shape; otherwise later code gets confusing and difficult
-        if (len(distances.shape) == 1):
-            d = numpy.reshape(distances, (pre_positions.shape[0],
-                                          post_positions.shape[0]))
-        else:
-            d = distances
-
-        self._mask = (d < self._degree).astype(float)
-
-        self._n_connections = numpy.sum(self._mask)
+        # Find the neurons within the degree of each post-neuron using a
+        # spatial index, rather than the distances between all pairs
+        n_sources = numpy.zeros(self._n_post_neurons + 1, dtype="uint32")
+        sources = list()
+        for post_id, pre_ids, d in self._iter_neighbours(
+                self._get_pre_position_index(), 0, self._n_post_neurons - 1,
+                self._degree, False):
+            pre_ids = pre_ids[d < self._degree]
+            n_sources[post_id + 1] = len(pre_ids)
+            sources.append(pre_ids)
+        self._post_indptr = numpy.cumsum(n_sources, dtype="uint32")
+        self._post_sources = numpy.concatenate(sources).astype("uint32")
+        targets = numpy.repeat(
+            numpy.arange(self._n_post_neurons, dtype="uint32"),
+            numpy.diff(self._post_indptr))
+
+        # Sort by source stably, so that the targets of each source remain
+        # in order, as they would be in a dense mask
+        order = numpy.argsort(self._post_sources, kind="mergesort")
+        self._pre_targets = targets[order]
+        self._pre_indptr = numpy.zeros(
+            self._n_pre_neurons + 1, dtype="uint32")
+        numpy.cumsum(
+            numpy.bincount(self._post_sources, minlength=self._n_pre_neurons),
+            out=self._pre_indptr[1:])
+        self._n_from_pre_maximum = dict()
+
+        self._n_connections = len(self._post_sources)
 
     @overrides(AbstractConnector.get_delay_maximum)
     def get_delay_maximum(self):
@@ -61,9 +83,16 @@ class SmallWorldConnector(AbstractConnector):
     def get_n_connections_from_pre_vertex_maximum(
             self, post_vertex_slice, min_delay=None, max_delay=None):
         # pylint: disable=too-many-arguments
-        n_connections = numpy.amax([
-            numpy.sum(self._mask[i, post_vertex_slice.as_slice])
-            for i in range(self._n_pre_neurons)])
+        slice_id = (post_vertex_slice.lo_atom, post_vertex_slice.hi_atom)
+        n_connections = self._n_from_pre_maximum.get(slice_id)
+        if n_connections is None:
+            sources = self._post_sources[
+                self._post_indptr[post_vertex_slice.lo_atom]:
+                self._post_indptr[post_vertex_slice.hi_atom + 1]]
+            n_connections = 0
+            if len(sources):
+                n_connections = int(numpy.amax(numpy.bincount(sources)))
+            self._n_from_pre_maximum[slice_id] = n_connections
 
         if min_delay is None or max_delay is None:
             return n_connections
@@ -74,29 +103,46 @@ class SmallWorldConnector(AbstractConnector):
     @overrides(AbstractConnector.get_n_connections_to_post_vertex_maximum)
     def get_n_connections_to_post_vertex_maximum(self):
         # pylint: disable=too-many-arguments
-        return numpy.amax([
-            numpy.sum(self._mask[:, i]) for i in range(self._n_post_neurons)])
+        return int(numpy.amax(numpy.diff(self._post_indptr)))
 
     @overrides(AbstractConnector.get_weight_maximum)
     def get_weight_maximum(self):
         # pylint: disable=too-many-arguments
         return self._get_weight_maximum(self._n_connections)
 
+    @overrides(AbstractConnector.could_connect)
+    def could_connect(self, pre_vertex_slice, post_vertex_slice):
+        # Rewiring only moves connections within the post slice, so this
+        # only depends on the sources of the post slice
+        sources = self._post_sources[
+            self._post_indptr[post_vertex_slice.lo_atom]:
+            self._post_indptr[post_vertex_slice.hi_atom + 1]]
+        return bool(numpy.any(
+            (sources >= pre_vertex_slice.lo_atom) &
+            (sources <= pre_vertex_slice.hi_atom)))
+
     @overrides(AbstractConnector.create_synaptic_block)
     def create_synaptic_block(
             self, pre_slices, pre_slice_index, post_slices,
             post_slice_index, pre_vertex_slice, post_vertex_slice,
             synapse_type):
         # pylint: disable=too-many-arguments
-        ids = numpy.where(self._mask[
-            pre_vertex_slice.as_slice, post_vertex_slice.as_slice])
-        n_connections = len(ids[0])
+        # The connections from the pre slice, in source then target order
+        start = self._pre_indptr[pre_vertex_slice.lo_atom]
+        end = self._pre_indptr[pre_vertex_slice.hi_atom + 1]
+        sources = numpy.repeat(
+            numpy.arange(pre_vertex_slice.lo_atom,
+                         pre_vertex_slice.hi_atom + 1, dtype="uint32"),
+            numpy.diff(self._pre_indptr[
+                pre_vertex_slice.lo_atom:pre_vertex_slice.hi_atom + 2]))
+        targets = self._pre_targets[start:end]
+        in_post_slice = ((targets >= post_vertex_slice.lo_atom) &
+                         (targets <= post_vertex_slice.hi_atom))
+        n_connections = numpy.count_nonzero(in_post_slice)
 
         block = numpy.zeros(n_connections, dtype=self.NUMPY_SYNAPSES_DTYPE)
-        block["source"] = (
-            (ids[0] % pre_vertex_slice.n_atoms) + pre_vertex_slice.lo_atom)
-        block["target"] = (
-            (ids[1] % post_vertex_slice.n_atoms) + post_vertex_slice.lo_atom)
+        block["source"] = sources[in_post_slice]
+        block["target"] = targets[in_post_slice]
         block["weight"] = self._generate_weights(
             self._weights, n_connections, None)
         block["delay"] = self._generate_delays(
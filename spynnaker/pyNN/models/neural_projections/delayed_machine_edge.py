@@ -1,7 +1,5 @@
 from spinn_utilities.overrides import overrides
 from pacman.model.graphs.machine import MachineEdge
-from spynnaker.pyNN.models.neural_projections.connectors.one_to_one_connector\
-    import OneToOneConnector
 from spynnaker.pyNN.models.abstract_models import AbstractFilterableEdge
 
 
@@ -19,14 +17,10 @@ class DelayedMachineEdge(MachineEdge, AbstractFilterableEdge):
 
     @overrides(AbstractFilterableEdge.filter_edge)
     def filter_edge(self, graph_mapper):
-
-        # Filter one-to-one connections that are out of range
-        for synapse_info in self._synapse_information:
-            if isinstance(synapse_info.connector, OneToOneConnector):
-                pre_lo = graph_mapper.get_slice(self.pre_vertex).lo_atom
-                pre_hi = graph_mapper.get_slice(self.pre_vertex).hi_atom
-                post_lo = graph_mapper.get_slice(self.post_vertex).lo_atom
-                post_hi = graph_mapper.get_slice(self.post_vertex).hi_atom
-                if pre_hi < post_lo or pre_lo > post_hi:
-                    return True
-        return False
+        # Filter edges on which none of the connectors make connections
+        pre_vertex_slice = graph_mapper.get_slice(self.pre_vertex)
+        post_vertex_slice = graph_mapper.get_slice(self.post_vertex)
+        return not any(
+            synapse_info.connector.could_connect(
+                pre_vertex_slice, post_vertex_slice)
+            for synapse_info in self._synapse_information)
@@ -34,7 +34,9 @@ from spinn_front_end_common.interface.profiling import profile_utils
 from spynnaker.pyNN.models.neuron.synaptic_manager import SynapticManager
 from spynnaker.pyNN.models.common import AbstractSpikeRecordable
 from spynnaker.pyNN.models.common import AbstractNeuronRecordable
+from spynnaker.pyNN.models.common import AbstractWindowedRecordable
 from spynnaker.pyNN.models.common import NeuronRecorder
+from spynnaker.pyNN.models.common import recording_utils
 from spynnaker.pyNN.utilities import constants
 from spynnaker.pyNN.models.neuron.population_machine_vertex \
     import PopulationMachineVertex
@@ -43,6 +45,8 @@ from spynnaker.pyNN.models.abstract_models \
 from spynnaker.pyNN.models.abstract_models \
     import AbstractPopulationSettable, AbstractReadParametersBeforeSet
 from spynnaker.pyNN.models.abstract_models import AbstractContainsUnits
+from spynnaker.pyNN.models.abstract_models \
+    import AbstractMeasuresRecordingUsage
 from spynnaker.pyNN.exceptions import InvalidParameterType
 from spynnaker.pyNN.utilities.ranged import SpynnakerRangeDictionary
 
@@ -69,12 +73,14 @@ class AbstractPopulationVertex(
         ApplicationVertex, AbstractGeneratesDataSpecification,
         AbstractHasAssociatedBinary, AbstractContainsUnits,
         AbstractSpikeRecordable,  AbstractNeuronRecordable,
+        AbstractWindowedRecordable,
         AbstractProvidesOutgoingPartitionConstraints,
         AbstractProvidesIncomingPartitionConstraints,
         AbstractPopulationInitializable, AbstractPopulationSettable,
         AbstractChangableAfterRun,
         AbstractRewritesDataSpecification, AbstractReadParametersBeforeSet,
-        AbstractAcceptsIncomingSynapses, ProvidesKeyToAtomMappingImpl):
+        AbstractAcceptsIncomingSynapses, ProvidesKeyToAtomMappingImpl,
+        AbstractMeasuresRecordingUsage):
     """ Underlying vertex model for Neural Populations.
     """
     __slots__ = [
@@ -141,7 +147,12 @@ class AbstractPopulationVertex(
         # Set up for recording
         recordables = ["spikes"]
         recordables.extend(self._neuron_impl.get_recordable_variables())
-        self._neuron_recorder = NeuronRecorder(recordables, n_neurons)
+        sparse_spike_rate = None
+        if config.getboolean("Recording", "sparse_spike_recording"):
+            sparse_spike_rate = config.getfloat(
+                "Recording", "sparse_spike_recording_rate")
+        self._neuron_recorder = NeuronRecorder(
+            recordables, n_neurons, sparse_spike_rate)
 
         self._time_between_requests = config.getint(
             "Buffers", "time_between_requests")
@@ -240,6 +251,19 @@ class AbstractPopulationVertex(
                     variable, vertex_slice))
         return values
 
+    @overrides(AbstractMeasuresRecordingUsage.get_recording_sdram_per_timestep)
+    def get_recording_sdram_per_timestep(
+            self, vertex_slice, n_machine_time_steps, machine_time_step):
+        return self._get_buffered_sdram_per_timestep(vertex_slice)
+
+    @overrides(AbstractMeasuresRecordingUsage.get_recording_usage_key)
+    def get_recording_usage_key(
+            self, vertex_slice, n_machine_time_steps, machine_time_step):
+        # The recording is sized exactly, or for sparse spike recording from
+        # the rate configured, so there is no need to keep what it is
+        # measured to use
+        return None
+
     def _get_buffered_sdram(self, vertex_slice, n_machine_time_steps):
         values = [self._neuron_recorder.get_buffered_sdram(
                 "spikes", vertex_slice, n_machine_time_steps)]
@@ -534,6 +558,34 @@ class AbstractPopulationVertex(
         # End the writing of this specification:
         spec.end_specification()
 
+    @inject_items({
+        "machine_time_step": "MachineTimeStep",
+        "graph_mapper": "MemoryGraphMapper",
+        "application_graph": "MemoryApplicationGraph",
+        "machine_graph": "MemoryMachineGraph"})
+    def get_pregenerable_synaptic_blocks(
+            self, placement, machine_time_step, graph_mapper,
+            application_graph, machine_graph):
+        """ Get the synaptic blocks of the placed machine vertex which can be\
+            generated before the data specification is written.
+
+        :param placement: the placement of a machine vertex of this vertex
+        :return: a list of (key, function, arguments to the function),\
+            where the function generates the block
+        """
+        # pylint: disable=too-many-arguments
+        vertex = placement.vertex
+        return self._synapse_manager.get_pregenerable_blocks(
+            self, graph_mapper.get_slice(vertex), vertex, machine_graph,
+            application_graph, graph_mapper,
+            self._neuron_impl.get_global_weight_scale(), machine_time_step)
+
+    def set_pregenerated_synaptic_blocks(self, pregenerated_blocks):
+        """ Set the source of synaptic blocks generated ahead of the data\
+            specification, or None to generate them as they are written.
+        """
+        self._synapse_manager.pregenerated_blocks = pregenerated_blocks
+
     @overrides(AbstractHasAssociatedBinary.get_binary_file_name)
     def get_binary_file_name(self):
 
@@ -561,9 +613,43 @@ class AbstractPopulationVertex(
     @overrides(AbstractSpikeRecordable.get_spikes)
     def get_spikes(
             self, placements, graph_mapper, buffer_manager, machine_time_step):
+        return self.get_spikes_in_window(
+            placements, graph_mapper, buffer_manager, machine_time_step)
+
+    @overrides(AbstractWindowedRecordable.get_spikes_in_window)
+    def get_spikes_in_window(
+            self, placements, graph_mapper, buffer_manager, machine_time_step,
+            neuron_range=None, time_range=None):
+        # pylint: disable=too-many-arguments
         return self._neuron_recorder.get_spikes(
             self.label, buffer_manager, self.SPIKE_RECORDING_REGION,
-            placements, graph_mapper, self, machine_time_step)
+            placements, graph_mapper, self, machine_time_step,
+            neuron_range=neuron_range, time_range=time_range,
+            n_threads=recording_utils.get_n_decode_threads())
+
+    @overrides(AbstractWindowedRecordable.get_spike_counts)
+    def get_spike_counts(
+            self, placements, graph_mapper, buffer_manager, machine_time_step,
+            neuron_range=None, time_range=None):
+        # pylint: disable=too-many-arguments
+        return self._neuron_recorder.get_spike_counts(
+            self.label, buffer_manager, self.SPIKE_RECORDING_REGION,
+            placements, graph_mapper, self, machine_time_step,
+            neuron_range=neuron_range, time_range=time_range,
+            n_threads=recording_utils.get_n_decode_threads())
+
+    @overrides(AbstractWindowedRecordable.get_spike_histogram)
+    def get_spike_histogram(
+            self, bin_width, n_machine_time_steps, placements, graph_mapper,
+            buffer_manager, machine_time_step, neuron_range=None,
+            time_range=None):
+        # pylint: disable=too-many-arguments
+        return self._neuron_recorder.get_spike_histogram(
+            self.label, buffer_manager, self.SPIKE_RECORDING_REGION,
+            placements, graph_mapper, self, machine_time_step,
+            n_machine_time_steps, bin_width, neuron_range=neuron_range,
+            time_range=time_range,
+            n_threads=recording_utils.get_n_decode_threads())
 
     @overrides(AbstractNeuronRecordable.get_recordable_variables)
     def get_recordable_variables(self):
@@ -584,13 +670,59 @@ class AbstractPopulationVertex(
     def get_data(self, variable, n_machine_time_steps, placements,
                  graph_mapper, buffer_manager, machine_time_step):
         # pylint: disable=too-many-arguments
+        return self.get_data_in_window(
+            variable, n_machine_time_steps, placements, graph_mapper,
+            buffer_manager, machine_time_step)
+
+    @overrides(AbstractWindowedRecordable.get_data_in_window)
+    def get_data_in_window(
+            self, variable, n_machine_time_steps, placements, graph_mapper,
+            buffer_manager, machine_time_step, neuron_range=None,
+            time_range=None):
+        # pylint: disable=too-many-arguments
         index = 0
         if variable != "spikes":
             index = 1 + self._neuron_impl.get_recordable_variable_index(
                 variable)
         return self._neuron_recorder.get_matrix_data(
             self.label, buffer_manager, index, placements, graph_mapper,
-            self, variable, n_machine_time_steps)
+            self, variable, n_machine_time_steps, neuron_range=neuron_range,
+            time_range=time_range,
+            n_threads=recording_utils.get_n_decode_threads())
+
+    @overrides(AbstractWindowedRecordable.export_data)
+    def export_data(
+            self, variable, filename, n_machine_time_steps, placements,
+            graph_mapper, buffer_manager, machine_time_step,
+            neuron_range=None, time_range=None):
+        # pylint: disable=too-many-arguments
+        if variable == "spikes":
+            self._neuron_recorder.write_spikes(
+                filename, self.label, buffer_manager,
+                self.SPIKE_RECORDING_REGION, placements, graph_mapper, self,
+                machine_time_step, neuron_range=neuron_range,
+                time_range=time_range,
+                n_threads=recording_utils.get_n_decode_threads())
+            return
+        index = 1 + self._neuron_impl.get_recordable_variable_index(variable)
+        self._neuron_recorder.write_matrix_data(
+            filename, self.label, buffer_manager, index, placements,
+            graph_mapper, self, variable, n_machine_time_steps,
+            neuron_range=neuron_range, time_range=time_range,
+            n_threads=recording_utils.get_n_decode_threads())
+
+    @overrides(AbstractWindowedRecordable.get_data_statistics)
+    def get_data_statistics(
+            self, variable, window, n_machine_time_steps, placements,
+            graph_mapper, buffer_manager, machine_time_step,
+            neuron_range=None, time_range=None):
+        # pylint: disable=too-many-arguments
+        index = 1 + self._neuron_impl.get_recordable_variable_index(variable)
+        return self._neuron_recorder.get_matrix_statistics(
+            self.label, buffer_manager, index, placements, graph_mapper,
+            self, variable, n_machine_time_steps, window=window,
+            neuron_range=neuron_range, time_range=time_range,
+            n_threads=recording_utils.get_n_decode_threads())
 
     @overrides(AbstractNeuronRecordable.get_neuron_sampling_interval)
     def get_neuron_sampling_interval(self, variable):
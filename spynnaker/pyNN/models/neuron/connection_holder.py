@@ -1,5 +1,14 @@
+import os
+import tempfile
 import numpy
+from numpy.lib.format import open_memmap
 from numpy.lib.recfunctions import merge_arrays
+import scipy.sparse  # @UnresolvedImport
+
+from spinn_front_end_common.utilities.exceptions import ConfigurationException
+
+# The sparse matrix formats that the matrices can be returned in
+_SPARSE_FORMATS = ("coo", "csr")
 
 
 class ConnectionHolder(object):
@@ -24,6 +33,10 @@ class ConnectionHolder(object):
         # A list of the connections that have been added
         "_connections",
 
+        # The post-vertex slice of each of the connections added, or None
+        # where this is not known
+        "_post_slices",
+
         # The merged connections formed just before the data is read
         "_data_items",
 
@@ -34,11 +47,24 @@ class ConnectionHolder(object):
 
         # A callback to call with the data when finished
         "_notify",
+
+        # The scipy.sparse format of the matrices returned, or None to
+        # return dense matrices
+        "_sparse_format",
+
+        # True if the values of connections with the same source and target
+        # are summed in sparse matrices, False to keep the last value
+        "_sum_multapses",
+
+        # A directory in which to store the merged connections returned as
+        # a list in a memory-mapped file, or None to keep them in memory
+        "_memmap_directory",
     )
 
     def __init__(
             self, data_items_to_return, as_list, n_pre_atoms, n_post_atoms,
-            connections=None, fixed_values=None, notify=None):
+            connections=None, fixed_values=None, notify=None,
+            sparse_format=None, sum_multapses=False, memmap_directory=None):
         """
 
         :param data_items_to_return: A list of data fields to be returned
@@ -61,27 +87,54 @@ class ConnectionHolder(object):
             A callback to call when the connections have all been added.\
             This should accept a single parameter, which will contain the\
             data requested
+        :param sparse_format:\
+            If the data is returned as matrices, the scipy.sparse format of\
+            the matrices ("coo" or "csr"), or None to return dense matrices\
+            in which the values of missing connections are NaN
+        :param sum_multapses:\
+            If the data is returned as matrices, True if the values of\
+            connections with the same source and target are summed, False\
+            if only the value of the last of them is kept
+        :param memmap_directory:\
+            If the data is returned as a list, a directory in which to\
+            create a memory-mapped file to hold the list, or None to hold it\
+            in memory.  The file is left in the directory.
         """
         # pylint: disable=too-many-arguments
+        if sparse_format is not None and sparse_format not in _SPARSE_FORMATS:
+            raise ConfigurationException(
+                "Unknown sparse matrix format {}; the formats supported are"
+                " {}".format(sparse_format, sorted(_SPARSE_FORMATS)))
         self._data_items_to_return = data_items_to_return
         self._as_list = as_list
         self._n_pre_atoms = n_pre_atoms
         self._n_post_atoms = n_post_atoms
         self._connections = connections
+        self._post_slices = None
+        if connections is not None:
+            self._post_slices = [None] * len(connections)
         self._data_items = None
         self._notify = notify
         self._fixed_values = fixed_values
+        self._sparse_format = sparse_format
+        self._sum_multapses = sum_multapses
+        self._memmap_directory = memmap_directory
 
-    def add_connections(self, connections):
+    def add_connections(self, connections, post_vertex_slice=None):
         """ Add connections to the holder to be returned
 
         :param connections:\
             The connection to add, as a numpy structured array of\
             source, target, weight and delay
+        :param post_vertex_slice:\
+            The slice of the post-vertex that the targets of the connections\
+            are in, if known
         """
         if self._connections is None:
             self._connections = list()
+            self._post_slices = list()
         self._connections.append(connections)
+        self._post_slices.append(post_vertex_slice)
 
     @property
     def connections(self):
@@ -103,7 +156,42 @@ class ConnectionHolder(object):
         if self._data_items is not None:
             return self._data_items
 
-        # If there are no connections added, raise an exception
+        self._check_connections_added()
+
+        # If we are returning a list, merge the sorted connections of each
+        # post-vertex slice
+        if self._as_list:
+            self._data_items = self._merge_chunks()
+
+        else:
+
+            if self._data_items_to_return is None:
+                return []
+
+            # Join all the connections that have been added (probably over
+            # multiple sub-vertices of a population)
+            connections = self._add_fixed_values(
+                numpy.concatenate(self._connections))
+
+            # Build a matrix of each item
+            if self._sparse_format is not None:
+                merged_connections = self._get_sparse_matrices(connections)
+            else:
+                merged_connections = self._get_dense_matrices(connections)
+
+            # If there is only one matrix, use it directly
+            if len(merged_connections) == 1:
+                self._data_items = merged_connections[0]
+
+            # Otherwise use a tuple of the matrices
+            else:
+                self._data_items = tuple(merged_connections)
+
+        return self._data_items
+
+    def _check_connections_added(self):
+        """ Raise an exception if no connections have been added
+        """
         if self._connections is None:
             raise Exception(
                 "Connections are only set after run has been called, even if"
@@ -111,84 +199,203 @@ class ConnectionHolder(object):
                 " made.  Try examining the {} after the call to run.".format(
                     self._data_items_to_return))
 
-        # Join all the connections that have been added (probably over multiple
-        # sub-vertices of a population)
-        connections = numpy.concatenate(self._connections)
+    def _add_fixed_values(self, connections):
+        """ Merge the additional fixed values, if any, into connections
+        """
+        if self._fixed_values is None or not self._fixed_values:
+            return connections
 
-        # If there are additional fixed values, merge them in
-        if self._fixed_values is not None and self._fixed_values:
+        # Generate a numpy type for the fixed values
+        fixed_dtypes = [
+            ('{}'.format(field[0]), None)
+            for field in self._fixed_values]
 
-            # Generate a numpy type for the fixed values
-            fixed_dtypes = [
-                ('{}'.format(field[0]), None)
-                for field in self._fixed_values]
+        # Get the actual data as a record array
+        fixed_data = numpy.asarray(
+            tuple([field[1] for field in self._fixed_values]),
+            dtype=fixed_dtypes)
 
-            # Get the actual data as a record array
-            fixed_data = numpy.asarray(
-                tuple([field[1] for field in self._fixed_values]),
-                dtype=fixed_dtypes)
+        # Tile the array to be the correct size
+        fixed_values = numpy.tile(fixed_data, [len(connections), 1])
 
-            # Tile the array to be the correct size
-            fixed_values = numpy.tile(fixed_data, [len(connections), 1])
+        # Add the fixed values to the connections
+        return merge_arrays((connections, fixed_values), flatten=True)
 
-            # Add the fixed values to the connections
-            connections = merge_arrays(
-                (connections, fixed_values), flatten=True)
+    def _get_chunk(self, connections):
+        """ Sort connections by source then target, and select the items\
+            to return from them
 
-        # If we are returning a list...
-        if self._as_list:
+        :return: the sources of the sorted connections, and the items
+        """
+        connections = self._add_fixed_values(connections)
+        order = numpy.lexsort((connections["target"], connections["source"]))
+        connections = connections[order]
+        sources = connections["source"]
 
-            # ...sort by source then target
-            order = numpy.lexsort(
-                (connections["target"], connections["source"]))
+        # There are no specific items to return, so just get all the data
+        if (self._data_items_to_return is None or
+                not self._data_items_to_return):
+            return sources, connections
 
-            # There are no specific items to return, so just get
-            # all the data
-            if (self._data_items_to_return is None or
-                    not self._data_items_to_return):
-                self._data_items = connections[order]
+        # There is more than one item to return, so let numpy do its magic
+        if len(self._data_items_to_return) > 1:
+            return sources, connections[self._data_items_to_return]
 
-            # There is more than one item to return, so let numpy do its magic
-            elif len(self._data_items_to_return) > 1:
-                self._data_items = \
-                    connections[order][self._data_items_to_return]
+        # There is 1 item to return, so make sure only one item exists
+        return sources, connections[self._data_items_to_return[0]]
 
-            # There is 1 item to return, so make sure only one item exists
-            else:
-                self._data_items = \
-                    connections[order][self._data_items_to_return[0]]
+    def _iter_sorted_chunks(self):
+        """ Iterate over the sorted connections to each post-vertex slice,\
+            in the order of the slices
 
-        else:
-
-            if self._data_items_to_return is None:
-                return []
+        :return: iterable of the sources and items of each chunk
+        """
+        groups = dict()
+        for connections, post_slice in zip(
+                self._connections, self._post_slices):
+            key = (-1, -1)
+            if post_slice is not None:
+                key = (post_slice.lo_atom, post_slice.hi_atom)
+            groups.setdefault(key, list()).append(connections)
+        for key in sorted(groups):
+            yield self._get_chunk(numpy.concatenate(groups[key]))
+
+    def iter_chunks(self):
+        """ Iterate over the connections a post-vertex slice at a time,\
+            without merging all of them in memory.  Each chunk holds the\
+            items that the list form of the data holds for the connections\
+            to one post-vertex slice, sorted by source then target, and the\
+            chunks are in the order of the slices.
+
+        :rtype: iterable of numpy.ndarray
+        """
+        self._check_connections_added()
+        for _, chunk in self._iter_sorted_chunks():
+            yield chunk
 
-            # Keep track of the matrices
-            merged_connections = list()
-            for item in self._data_items_to_return:
+    def _allocate_merged(self, dtype, n_connections):
+        """ Allocate the list of merged connections, in memory or in a\
+            memory-mapped file
+        """
+        if dtype.names is not None:
+            # Pack the fields, which might be a view of some of the fields
+            # of a larger record
+            dtype = numpy.dtype([
+                (name, dtype.fields[name][0]) for name in dtype.names])
+        if self._memmap_directory is None:
+            return numpy.empty(n_connections, dtype=dtype)
+        handle, filename = tempfile.mkstemp(
+            suffix=".npy", prefix="connections_",
+            dir=self._memmap_directory)
+        os.close(handle)
+        return open_memmap(
+            filename, mode="w+", dtype=dtype, shape=(n_connections,))
+
+    def _merge_chunks(self):
+        """ Merge the chunks into a single list, sorted by source then\
+            target, writing each chunk directly to its place in the list
+        """
+        # Count the connections from each source
+        n_sources = self._n_pre_atoms
+        for connections in self._connections:
+            if len(connections):
+                n_sources = max(
+                    n_sources, int(connections["source"].max()) + 1)
+        source_counts = numpy.zeros(n_sources, dtype="int64")
+        for connections in self._connections:
+            source_counts += numpy.bincount(
+                connections["source"], minlength=n_sources)
+
+        # The connections from each source start after those from the
+        # sources before it; as the targets of each chunk are after those
+        # of the chunks before it, the connections from a source in a chunk
+        # follow those from the same source in the chunks before it
+        next_index = numpy.cumsum(source_counts) - source_counts
+        merged = None
+        for sources, chunk in self._iter_sorted_chunks():
+            if merged is None:
+                merged = self._allocate_merged(
+                    chunk.dtype, int(source_counts.sum()))
+            chunk_counts = numpy.bincount(sources, minlength=n_sources)
+            chunk_starts = numpy.cumsum(chunk_counts) - chunk_counts
+            merged[next_index[sources] +
+                   (numpy.arange(len(sources)) - chunk_starts[sources])] = \
+                chunk
+            next_index += chunk_counts
+
+        # With no chunks, merge the connections as they are
+        if merged is None:
+            _, merged = self._get_chunk(numpy.concatenate(self._connections))
+        return merged
+
+    def _get_dense_matrices(self, connections):
+        """ Get a dense matrix of each item to return, in which the values\
+            of missing connections are NaN
+        """
+        shape = (self._n_pre_atoms, self._n_post_atoms)
+        missing = None
+        keys = None
+        if self._sum_multapses:
+            keys = ((connections["source"].astype("int64") *
+                     self._n_post_atoms) + connections["target"])
+            missing = numpy.bincount(
+                keys, minlength=shape[0] * shape[1]).reshape(shape) == 0
+
+        matrices = list()
+        for item in self._data_items_to_return:
+            if self._sum_multapses:
+
+                # Sum the values of the connections with the same source and
+                # target, and fill the values without connections with NAN
+                matrix = numpy.bincount(
+                    keys, weights=connections[item],
+                    minlength=shape[0] * shape[1]).reshape(shape)
+                matrix[missing] = numpy.nan
+            else:
 
                 # Build an empty matrix and fill it with NAN
-                matrix = numpy.empty((self._n_pre_atoms, self._n_post_atoms))
+                matrix = numpy.empty(shape)
                 matrix.fill(numpy.nan)
 
-                # Fill in the values that have data
-                # TODO: Change this to sum the items with the same
-                #       (source, target) pairs
+                # Fill in the values that have data, keeping the last of
+                # the connections with the same source and target
                 matrix[connections["source"], connections["target"]] = \
                     connections[item]
 
-                # Store the matrix generated
-                merged_connections.append(matrix)
-
-            # If there is only one matrix, use it directly
-            if len(merged_connections) == 1:
-                self._data_items = merged_connections[0]
+            # Store the matrix generated
+            matrices.append(matrix)
+        return matrices
 
-            # Otherwise use a tuple of the matrices
-            else:
-                self._data_items = tuple(merged_connections)
-
-        return self._data_items
+    def _get_sparse_matrices(self, connections):
+        """ Get a sparse matrix of each item to return, built directly\
+            from the connections
+        """
+        shape = (self._n_pre_atoms, self._n_post_atoms)
+        sources = connections["source"]
+        targets = connections["target"]
+        indices = None
+        if not self._sum_multapses:
+
+            # Keep the last connection of each (source, target) pair, which
+            # is the first of the pair in the reversed connections
+            keys = ((sources.astype("uint64") * self._n_post_atoms) +
+                    targets)
+            _, reversed_first = numpy.unique(keys[::-1], return_index=True)
+            indices = (len(keys) - 1) - reversed_first
+            sources = sources[indices]
+            targets = targets[indices]
+
+        matrices = list()
+        for item in self._data_items_to_return:
+            values = connections[item]
+            if indices is not None:
+                values = values[indices]
+            matrix = scipy.sparse.coo_matrix(
+                (values, (sources, targets)), shape=shape)
+            if self._sum_multapses:
+                matrix.sum_duplicates()
+            matrices.append(matrix.asformat(self._sparse_format))
+        return matrices
 
     def __getitem__(self, s):
         data = self._get_data_items()
@@ -1,4 +1,7 @@
+from .decoded_master_pop_table import DecodedMasterPopTable
 from .master_pop_table_as_2d_array import MasterPopTableAs2dArray
 from .master_pop_table_as_binary_search import MasterPopTableAsBinarySearch
+from .master_pop_table_as_hash_table import MasterPopTableAsHashTable
 
-__all__ = ['MasterPopTableAs2dArray', 'MasterPopTableAsBinarySearch']
+__all__ = ['DecodedMasterPopTable', 'MasterPopTableAs2dArray',
+           'MasterPopTableAsBinarySearch', 'MasterPopTableAsHashTable']
@@ -32,6 +32,24 @@ class AbstractMasterPopTableFactory(object):
         :return: a synaptic matrix memory position.
         """
 
+    def read_master_population_table(
+            self, master_pop_base_mem_address, txrx, chip_x, chip_y):
+        """ Read and decode the whole master population table of a core,\
+            so that the synaptic matrix data of many keys can be located\
+            without reading the table again.
+
+        :param master_pop_base_mem_address: the base address of the master pop
+        :param txrx: the transceiver object
+        :param chip_x: the x coordinate of the chip of this master pop
+        :param chip_y: the y coordinate of the chip of this master pop
+        :return: the decoded table, or None if the table can't be decoded,\
+            in which case extract_synaptic_matrix_data_location must be used\
+            for each key
+        :rtype: :py:class:`DecodedMasterPopTable` or None
+        """
+        # pylint: disable=unused-argument
+        return None
+
     @abstractmethod
     def update_master_population_table(
             self, spec, block_start_addr, row_length, key_and_mask,
@@ -0,0 +1,94 @@
+import numpy
+
+
+class DecodedMasterPopTable(object):
+    """ A master population table read from the machine and decoded, so\
+        that the synaptic matrix data of keys can be located without reading\
+        the table again
+    """
+
+    __slots__ = [
+        # The key of each entry, sorted
+        "_keys",
+
+        # The mask of each entry
+        "_masks",
+
+        # The index of the first item of the address list of each entry
+        "_starts",
+
+        # The number of items of the address list of each entry
+        "_counts",
+
+        # The row length of each item of the address list
+        "_row_lengths",
+
+        # The address of each item of the address list
+        "_addresses",
+
+        # Whether each item of the address list is a single row
+        "_is_single"]
+
+    def __init__(self, keys, masks, starts, counts, row_lengths, addresses,
+                 is_single):
+        """
+        :param keys: the key of each entry
+        :param masks: the mask of each entry
+        :param starts: the index of the first item of each entry
+        :param counts: the number of items of each entry
+        :param row_lengths: the row length of each item
+        :param addresses: the address of each item
+        :param is_single: whether each item is a single row
+        """
+        # pylint: disable=too-many-arguments
+        order = numpy.argsort(keys, kind="mergesort")
+        self._keys = numpy.asarray(keys, dtype="uint32")[order]
+        self._masks = numpy.asarray(masks, dtype="uint32")[order]
+        self._starts = numpy.asarray(starts, dtype="uint32")[order]
+        self._counts = numpy.asarray(counts, dtype="uint32")[order]
+        self._row_lengths = numpy.asarray(row_lengths, dtype="uint32")
+        self._addresses = numpy.asarray(addresses, dtype="uint32")
+        self._is_single = numpy.asarray(is_single, dtype="bool")
+
+    @property
+    def n_entries(self):
+        return len(self._keys)
+
+    def locate_entries(self, keys):
+        """ Find the entry of each of a number of keys
+
+        :param keys: the keys to find
+        :type keys: numpy.ndarray
+        :return: the index of the entry of each key, or -1 where there is\
+            no entry for a key
+        :rtype: numpy.ndarray
+        """
+        keys = numpy.asarray(keys, dtype="uint32")
+        if not len(self._keys):
+            return numpy.full(len(keys), -1, dtype="int64")
+
+        # The entries match disjoint ranges of keys, so the only entry that
+        # can match a key is the last whose key is not above it
+        indices = numpy.searchsorted(self._keys, keys, side="right") - 1
+        candidates = numpy.maximum(indices, 0)
+        found = (indices >= 0) & (
+            (keys & self._masks[candidates]) == self._keys[candidates])
+        return numpy.where(found, indices, -1)
+
+    def get_synaptic_matrix_data_location(self, incoming_key):
+        """ Get the locations of the synaptic matrix data of a key
+
+        :param incoming_key: the key to find
+        :return: a list of (row length, address, is single) of each item of\
+            the entry of the key, or an empty list if there is no entry
+        """
+        index = int(self.locate_entries([incoming_key])[0])
+        if index < 0:
+            return []
+        start = int(self._starts[index])
+        end = start + int(self._counts[index])
+        return [
+            (int(row_length), int(address), bool(is_single))
+            for row_length, address, is_single in zip(
+                self._row_lengths[start:end], self._addresses[start:end],
+                self._is_single[start:end])]
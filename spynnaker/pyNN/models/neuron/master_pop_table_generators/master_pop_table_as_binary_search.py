@@ -10,6 +10,7 @@ from spynnaker.pyNN.models.neural_projections \
 from spynnaker.pyNN.exceptions import SynapseRowTooBigException,\
     SynapticConfigurationException
 from .abstract_master_pop_table_factory import AbstractMasterPopTableFactory
+from .decoded_master_pop_table import DecodedMasterPopTable
 
 # general imports
 import logging
@@ -130,10 +131,7 @@ class MasterPopTableAsBinarySearch(AbstractMasterPopTableFactory):
                     n_edge_vertices * len(in_edge.synapse_information))
 
         # Multiply by 2 to get an upper bound
-        return (
-            (n_vertices * 2 * _MasterPopEntry.MASTER_POP_ENTRY_SIZE_BYTES) +
-            (n_entries * 2 * _MasterPopEntry.ADDRESS_LIST_ENTRY_SIZE_BYTES) +
-            8)
+        return self._get_table_size(n_vertices * 2, n_entries * 2)
 
     def get_exact_master_population_table_size(
             self, vertex, machine_graph, graph_mapper):
@@ -150,10 +148,19 @@ class MasterPopTableAsBinarySearch(AbstractMasterPopTableFactory):
                 n_entries += len(edge.synapse_information)
 
         # Multiply by 2 to get an upper bound
+        return self._get_table_size(n_vertices * 2, n_entries * 2)
+
+    def _get_table_size(self, n_pop_entries, n_addresses):
+        """
+        :param n_pop_entries: the number of master pop entries
+        :param n_addresses: the number of entries in the address list
+        :return: the size of a table with the given number of entries (in\
+            bytes)
+        """
         return (
-            (n_vertices * 2 * _MasterPopEntry.MASTER_POP_ENTRY_SIZE_BYTES) +
-            (n_entries * 2 * _MasterPopEntry.ADDRESS_LIST_ENTRY_SIZE_BYTES) +
-            8)
+            (n_pop_entries * _MasterPopEntry.MASTER_POP_ENTRY_SIZE_BYTES) +
+            (n_addresses * _MasterPopEntry.ADDRESS_LIST_ENTRY_SIZE_BYTES) +
+            _TWO_WORDS.size)
 
     def get_allowed_row_length(self, row_length):
         """
@@ -272,8 +279,26 @@ class MasterPopTableAsBinarySearch(AbstractMasterPopTableFactory):
     def extract_synaptic_matrix_data_location(
             self, incoming_key, master_pop_base_mem_address, txrx,
             chip_x, chip_y):
-        # pylint: disable=too-many-arguments, too-many-locals, arguments-differ
+        # pylint: disable=too-many-arguments, arguments-differ
+        entry_list, address_list = self._read_table(
+            master_pop_base_mem_address, txrx, chip_x, chip_y)
+        entry = self._locate_entry(entry_list, incoming_key)
+        return self._get_entry_addresses(entry, address_list)
+
+    @overrides(AbstractMasterPopTableFactory.read_master_population_table)
+    def read_master_population_table(
+            self, master_pop_base_mem_address, txrx, chip_x, chip_y):
+        entry_list, address_list = self._read_table(
+            master_pop_base_mem_address, txrx, chip_x, chip_y)
+        return DecodedMasterPopTable(
+            entry_list["key"], entry_list["mask"], entry_list["start"],
+            entry_list["count"], *self._decode_addresses(address_list))
 
+    def _read_table(self, master_pop_base_mem_address, txrx, chip_x, chip_y):
+        """ Read the entries and address list of the table from the machine
+
+        :return: the entries and the address list, as numpy arrays
+        """
         # get entries in master pop
         n_entries, n_addresses = _TWO_WORDS.unpack(txrx.read_memory(
             chip_x, chip_y, master_pop_base_mem_address, _TWO_WORDS.size))
@@ -294,8 +319,30 @@ class MasterPopTableAsBinarySearch(AbstractMasterPopTableFactory):
         address_list = numpy.frombuffer(
             full_data, 'uint8', n_address_bytes, n_entry_bytes).view(
                 dtype=self.ADDRESS_LIST_DTYPE)
+        return entry_list, address_list
 
-        entry = self._locate_entry(entry_list, incoming_key)
+    def _decode_addresses(self, address_list):
+        """ Decode all the items of the address list at once
+
+        :param address_list: the address list of the table
+        :return: the row lengths, addresses and whether the row is single\
+            of each item
+        :rtype: (numpy.ndarray, numpy.ndarray, numpy.ndarray)
+        """
+        is_single = (address_list & self.SINGLE_BIT_FLAG_BIT) > 0
+        addresses = address_list & self.ADDRESS_MASK
+        addresses = numpy.where(
+            is_single, addresses >> 8, addresses >> self.ADDRESS_SCALED_SHIFT)
+        row_lengths = address_list & self.ROW_LENGTH_MASK
+        return row_lengths, addresses, is_single
+
+    def _get_entry_addresses(self, entry, address_list):
+        """ Decode the addresses of the synaptic matrix of an entry
+
+        :param entry: the entry, or None if there is no entry
+        :param address_list: the address list of the table
+        :return: a list of (row length, address, is single)
+        """
         if entry is None:
             return []
         addresses = list()
@@ -0,0 +1,195 @@
+import struct
+from spinn_utilities.overrides import overrides
+
+from .abstract_master_pop_table_factory import AbstractMasterPopTableFactory
+from .master_pop_table_as_binary_search import (
+    MasterPopTableAsBinarySearch, _MasterPopEntry)
+
+import numpy
+
+_FOUR_WORDS = struct.Struct("<IIII")
+
+
+class MasterPopTableAsHashTable(MasterPopTableAsBinarySearch):
+    """ Master population table, implemented as a hash table of the entries\
+        of the binary search table, so that a key is found in a constant\
+        number of steps however many entries there are.
+
+    The bits of the key which are in the mask of every entry are hashed to\
+    select a bucket, and only the entries in that bucket are compared with\
+    the key.  The table is laid out as:
+
+    * the number of entries, the number of addresses, the number of bits\
+      of the bucket index, and the mask of the bits which are hashed
+    * the index of the first entry of each bucket, and one more than the\
+      index of the last entry of the last bucket
+    * the entries, as in the binary search table, ordered by bucket
+    * the address list, as in the binary search table
+    """
+    __slots__ = ()
+
+    BUCKET_INDEX_DTYPE = "<u4"
+
+    # Fibonacci hashing multiplier (2^32 / golden ratio)
+    HASH_MULTIPLIER = 0x9E3779B1
+
+    # There are at least twice as many buckets as entries
+    BUCKETS_PER_ENTRY = 2
+
+    # The least number of bits of bucket index, so that the shift of the
+    # hash is never the full word
+    MIN_BUCKET_BITS = 1
+
+    @classmethod
+    def get_n_bucket_bits(cls, n_entries):
+        """
+        :param n_entries: the number of entries in the table
+        :return: the number of bits of the bucket index
+        """
+        n_buckets = max(n_entries * cls.BUCKETS_PER_ENTRY, 1)
+        return max(cls.MIN_BUCKET_BITS, int(n_buckets - 1).bit_length())
+
+    @classmethod
+    def get_bucket(cls, key, hash_mask, n_bucket_bits):
+        """ Get the bucket of a key, or of an array of keys
+
+        :param key: the key, or a numpy array of keys
+        :param hash_mask: the mask of the bits of the key to hash
+        :param n_bucket_bits: the number of bits of the bucket index
+        :return: the bucket index, or a numpy array of indices
+        """
+        masked = numpy.asarray(key, dtype="uint64") & hash_mask
+        hashed = (masked * cls.HASH_MULTIPLIER) & 0xFFFFFFFF
+        return (hashed >> (32 - n_bucket_bits)).astype("uint32")
+
+    @overrides(MasterPopTableAsBinarySearch._get_table_size)
+    def _get_table_size(self, n_pop_entries, n_addresses):
+        # Two more header words than the binary search, and the buckets
+        n_buckets = 1 << self.get_n_bucket_bits(n_pop_entries)
+        return (
+            super(MasterPopTableAsHashTable, self)._get_table_size(
+                n_pop_entries, n_addresses) + 8 + ((n_buckets + 1) * 4))
+
+    @overrides(AbstractMasterPopTableFactory.finish_master_pop_table)
+    def finish_master_pop_table(self, spec, master_pop_table_region):
+        spec.switch_write_focus(region=master_pop_table_region)
+
+        # Only the bits in the masks of all the entries can be hashed, as a
+        # key must be in the same bucket as the entry that it matches
+        entries = sorted(
+            self._entries.values(), key=lambda entry: entry.routing_key)
+        hash_mask = 0xFFFFFFFF
+        for entry in entries:
+            hash_mask &= entry.mask
+        n_entries = len(entries)
+        n_bucket_bits = self.get_n_bucket_bits(n_entries)
+        n_buckets = 1 << n_bucket_bits
+
+        # Order the entries by bucket, keeping the key order within each
+        buckets = self.get_bucket(
+            [entry.routing_key for entry in entries], hash_mask,
+            n_bucket_bits)
+        order = numpy.argsort(buckets, kind="mergesort")
+        bucket_starts = numpy.zeros(n_buckets + 1, self.BUCKET_INDEX_DTYPE)
+        numpy.cumsum(
+            numpy.bincount(buckets, minlength=n_buckets),
+            out=bucket_starts[1:])
+
+        spec.write_value(n_entries)
+        spec.write_value(self._n_addresses)
+        spec.write_value(n_bucket_bits)
+        spec.write_value(hash_mask)
+
+        # Generate the table and list as arrays
+        pop_table = numpy.zeros(n_entries, dtype=self.MASTER_POP_ENTRY_DTYPE)
+        address_list = numpy.zeros(
+            self._n_addresses, dtype=self.ADDRESS_LIST_DTYPE)
+        start = 0
+        for i, entry_index in enumerate(order):
+            start += self._make_pop_table_entry(
+                entries[entry_index], i, start, pop_table, address_list)
+
+        # Write the arrays
+        spec.write_array(bucket_starts)
+        spec.write_array(pop_table.view("<u4"))
+        spec.write_array(address_list)
+
+        self._entries.clear()
+        del self._entries
+        self._entries = None
+        self._n_addresses = 0
+
+    @overrides(
+        AbstractMasterPopTableFactory.extract_synaptic_matrix_data_location)
+    def extract_synaptic_matrix_data_location(
+            self, incoming_key, master_pop_base_mem_address, txrx,
+            chip_x, chip_y):
+        # pylint: disable=too-many-arguments, arguments-differ
+        (bucket_starts, hash_mask, n_bucket_bits, entry_list,
+         address_list) = self._read_hash_table(
+            master_pop_base_mem_address, txrx, chip_x, chip_y)
+        entry = self._locate_hashed_entry(
+            bucket_starts, entry_list, hash_mask, n_bucket_bits,
+            incoming_key)
+        return self._get_entry_addresses(entry, address_list)
+
+    @overrides(MasterPopTableAsBinarySearch._read_table)
+    def _read_table(self, master_pop_base_mem_address, txrx, chip_x, chip_y):
+        # The entries are ordered by bucket rather than by key
+        _, _, _, entry_list, address_list = self._read_hash_table(
+            master_pop_base_mem_address, txrx, chip_x, chip_y)
+        order = numpy.argsort(entry_list["key"], kind="mergesort")
+        return entry_list[order], address_list
+
+    def _read_hash_table(
+            self, master_pop_base_mem_address, txrx, chip_x, chip_y):
+        """ Read the table from the machine
+
+        :return: the bucket starts, the hash mask, the number of bits of\
+            the bucket index, the entries and the address list
+        """
+        # pylint: disable=too-many-locals
+        n_entries, n_addresses, n_bucket_bits, hash_mask = \
+            _FOUR_WORDS.unpack(txrx.read_memory(
+                chip_x, chip_y, master_pop_base_mem_address,
+                _FOUR_WORDS.size))
+        n_bucket_bytes = ((1 << n_bucket_bits) + 1) * 4
+        n_entry_bytes = (
+            n_entries * _MasterPopEntry.MASTER_POP_ENTRY_SIZE_BYTES)
+        n_address_bytes = (
+            n_addresses * _MasterPopEntry.ADDRESS_LIST_ENTRY_SIZE_BYTES)
+
+        # read in the rest of the table
+        full_data = txrx.read_memory(
+            chip_x, chip_y, master_pop_base_mem_address + _FOUR_WORDS.size,
+            n_bucket_bytes + n_entry_bytes + n_address_bytes)
+
+        # convert into a numpy arrays
+        bucket_starts = numpy.frombuffer(
+            full_data, 'uint8', n_bucket_bytes, 0).view(
+                dtype=self.BUCKET_INDEX_DTYPE)
+        entry_list = numpy.frombuffer(
+            full_data, 'uint8', n_entry_bytes, n_bucket_bytes).view(
+                dtype=self.MASTER_POP_ENTRY_DTYPE)
+        address_list = numpy.frombuffer(
+            full_data, 'uint8', n_address_bytes,
+            n_bucket_bytes + n_entry_bytes).view(
+                dtype=self.ADDRESS_LIST_DTYPE)
+        return (bucket_starts, hash_mask, n_bucket_bits, entry_list,
+                address_list)
+
+    @classmethod
+    def _locate_hashed_entry(
+            cls, bucket_starts, entries, hash_mask, n_bucket_bits, key):
+        """ Search the bucket of a key for its entry
+
+        :param key: the key to search the master pop table for a given entry
+        :return: the entry for this given key, or None if there is none
+        """
+        # pylint: disable=too-many-arguments
+        bucket = int(cls.get_bucket(key, hash_mask, n_bucket_bits))
+        for i in range(bucket_starts[bucket], bucket_starts[bucket + 1]):
+            entry = entries[i]
+            if key & entry["mask"] == entry["key"]:
+                return entry
+        return None
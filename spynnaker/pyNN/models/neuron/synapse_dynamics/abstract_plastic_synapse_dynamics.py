@@ -36,6 +36,23 @@ class AbstractPlasticSynapseDynamics(AbstractSynapseDynamics):
         for each of the fixed-plastic and plastic-plastic regions.
         """
 
+    @abstractmethod
+    def get_plastic_synaptic_words(
+            self, connections, post_vertex_slice, n_synapse_types):
+        """ Get the fixed-plastic half-word and the plastic-plastic bytes of\
+            each connection, in the order of the connections.
+
+        The fixed-plastic data is returned as an array of 16-bit values, one\
+        per connection, and the plastic-plastic data as a 2D array of 8-bit\
+        values, with a row for each connection.
+        """
+
+    @abstractmethod
+    def get_n_plastic_header_bytes(self):
+        """ Get the number of bytes at the start of the plastic-plastic\
+            region of each row
+        """
+
     @abstractmethod
     def get_n_plastic_plastic_words_per_row(self, pp_size):
         """ Get the number of plastic plastic words to be read from each row
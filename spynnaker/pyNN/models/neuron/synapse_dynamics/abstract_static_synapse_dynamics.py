@@ -34,6 +34,13 @@ class AbstractStaticSynapseDynamics(AbstractSynapseDynamics):
         for the fixed-fixed region.
         """
 
+    @abstractmethod
+    def get_static_synaptic_words(
+            self, connections, post_vertex_slice, n_synapse_types):
+        """ Get the fixed-fixed 32-bit word of each connection, in the order\
+            of the connections.
+        """
+
     @abstractmethod
     def get_n_static_words_per_row(self, ff_size):
         """ Get the number of bytes to be read per row for the static data\
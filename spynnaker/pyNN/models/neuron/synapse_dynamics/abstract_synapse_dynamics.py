@@ -55,6 +55,13 @@ class AbstractSynapseDynamics(object):
         :rtype: int
         """
 
+    @property
+    def pad_to_length(self):
+        """ The number of synapses to which each row is padded, or None if\
+            the rows are not padded
+        """
+        return None
+
     def get_provenance_data(self, pre_population_label, post_population_label):
         """ Get the provenance data from this synapse dynamics object
         """
@@ -45,6 +45,11 @@ class SynapseDynamicsStatic(
         # Nothing to do here
         pass
 
+    @property
+    @overrides(AbstractSynapseDynamics.pad_to_length)
+    def pad_to_length(self):
+        return self._pad_to_length
+
     @overrides(
         AbstractStaticSynapseDynamics.get_n_words_for_static_connections)
     def get_n_words_for_static_connections(self, n_connections):
@@ -58,11 +63,33 @@ class SynapseDynamicsStatic(
             self, connections, connection_row_indices, n_rows,
             post_vertex_slice, n_synapse_types):
         # pylint: disable=too-many-arguments
+        fixed_fixed = self._get_static_synaptic_words(
+            connections, post_vertex_slice, n_synapse_types)
+        fixed_fixed_rows = self.convert_per_connection_data_to_rows(
+            connection_row_indices, n_rows,
+            fixed_fixed.view(dtype="uint8").reshape((-1, 4)))
+        ff_size = self.get_n_items(fixed_fixed_rows, 4)
+        if self._pad_to_length is not None:
+            # Pad the data
+            fixed_fixed_rows = self._pad_row(fixed_fixed_rows, 4)
+        ff_data = [fixed_row.view("uint32") for fixed_row in fixed_fixed_rows]
+
+        return ff_data, ff_size
+
+    @overrides(AbstractStaticSynapseDynamics.get_static_synaptic_words)
+    def get_static_synaptic_words(
+            self, connections, post_vertex_slice, n_synapse_types):
+        return self._get_static_synaptic_words(
+            connections, post_vertex_slice, n_synapse_types)
+
+    @staticmethod
+    def _get_static_synaptic_words(
+            connections, post_vertex_slice, n_synapse_types):
         n_neuron_id_bits = get_n_bits(post_vertex_slice.n_atoms)
         neuron_id_mask = (1 << n_neuron_id_bits) - 1
         n_synapse_type_bits = get_n_bits(n_synapse_types)
 
-        fixed_fixed = (
+        return (
             ((numpy.rint(numpy.abs(connections["weight"])).astype("uint32") &
               0xFFFF) << 16) |
             ((connections["delay"].astype("uint32") & 0xF) <<
@@ -71,16 +98,6 @@ class SynapseDynamicsStatic(
                 "uint32") << n_neuron_id_bits) |
             ((connections["target"] - post_vertex_slice.lo_atom) &
              neuron_id_mask))
-        fixed_fixed_rows = self.convert_per_connection_data_to_rows(
-            connection_row_indices, n_rows,
-            fixed_fixed.view(dtype="uint8").reshape((-1, 4)))
-        ff_size = self.get_n_items(fixed_fixed_rows, 4)
-        if self._pad_to_length is not None:
-            # Pad the data
-            fixed_fixed_rows = self._pad_row(fixed_fixed_rows, 4)
-        ff_data = [fixed_row.view("uint32") for fixed_row in fixed_fixed_rows]
-
-        return ff_data, ff_size
 
     def _pad_row(self, rows, no_bytes_per_connection):
         padded_rows = []
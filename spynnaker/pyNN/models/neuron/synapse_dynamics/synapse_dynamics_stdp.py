@@ -154,6 +154,11 @@ class SynapseDynamicsSTDP(
             spec, machine_time_step, weight_scales,
             self._timing_dependence.n_weight_terms)
 
+    @property
+    @overrides(AbstractPlasticSynapseDynamics.pad_to_length)
+    def pad_to_length(self):
+        return self._pad_to_length
+
     @property
     def _n_header_bytes(self):
         # The header contains a single timestamp and pre-trace
@@ -186,6 +191,48 @@ class SynapseDynamicsSTDP(
             self, connections, connection_row_indices, n_rows,
             post_vertex_slice, n_synapse_types):
         # pylint: disable=too-many-arguments
+        fixed_plastic, plastic_plastic = self._get_plastic_synaptic_words(
+            connections, post_vertex_slice, n_synapse_types)
+
+        # Convert the fixed data into rows
+        fixed_plastic_rows = self.convert_per_connection_data_to_rows(
+            connection_row_indices, n_rows,
+            fixed_plastic.view(dtype="uint8").reshape((-1, 2)))
+        fp_size = self.get_n_items(fixed_plastic_rows, 2)
+        if self._pad_to_length is not None:
+            # Pad the data
+            fixed_plastic_rows = self._pad_row(fixed_plastic_rows, 2)
+        fp_data = self.get_words(fixed_plastic_rows)
+
+        # Convert the plastic data into rows
+        n_bytes_per_connection = plastic_plastic.shape[1]
+        plastic_plastic_row_data = self.convert_per_connection_data_to_rows(
+            connection_row_indices, n_rows, plastic_plastic)
+
+        # pp_size = fp_size in words => fp_size * no_bytes / 4 (bytes)
+        if self._pad_to_length is not None:
+            # Pad the data
+            plastic_plastic_row_data = self._pad_row(
+                plastic_plastic_row_data, n_bytes_per_connection)
+        plastic_headers = numpy.zeros(
+            (n_rows, self._n_header_bytes), dtype="uint8")
+        plastic_plastic_rows = [
+            numpy.concatenate((
+                plastic_headers[i], plastic_plastic_row_data[i]))
+            for i in range(n_rows)]
+        pp_size = self.get_n_items(plastic_plastic_rows, 4)
+        pp_data = self.get_words(plastic_plastic_rows)
+
+        return fp_data, pp_data, fp_size, pp_size
+
+    @overrides(AbstractPlasticSynapseDynamics.get_plastic_synaptic_words)
+    def get_plastic_synaptic_words(
+            self, connections, post_vertex_slice, n_synapse_types):
+        return self._get_plastic_synaptic_words(
+            connections, post_vertex_slice, n_synapse_types)
+
+    def _get_plastic_synaptic_words(
+            self, connections, post_vertex_slice, n_synapse_types):
         n_synapse_type_bits = get_n_bits(n_synapse_types)
         n_neuron_id_bits = get_n_bits(post_vertex_slice.n_atoms)
         neuron_id_mask = (1 << n_neuron_id_bits) - 1
@@ -205,14 +252,6 @@ class SynapseDynamicsSTDP(
              << n_neuron_id_bits) |
             ((connections["target"].astype("uint16") -
               post_vertex_slice.lo_atom) & neuron_id_mask))
-        fixed_plastic_rows = self.convert_per_connection_data_to_rows(
-            connection_row_indices, n_rows,
-            fixed_plastic.view(dtype="uint8").reshape((-1, 2)))
-        fp_size = self.get_n_items(fixed_plastic_rows, 2)
-        if self._pad_to_length is not None:
-            # Pad the data
-            fixed_plastic_rows = self._pad_row(fixed_plastic_rows, 2)
-        fp_data = self.get_words(fixed_plastic_rows)
 
         # Get the plastic data by inserting the weight into the half-word
         # specified by the synapse structure
@@ -224,28 +263,15 @@ class SynapseDynamicsSTDP(
         plastic_plastic[half_word::n_half_words] = \
             numpy.rint(numpy.abs(connections["weight"])).astype("uint16")
 
-        # Convert the plastic data into groups of bytes per connection and
-        # then into rows
+        # Convert the plastic data into groups of bytes per connection
         plastic_plastic = plastic_plastic.view(dtype="uint8").reshape(
             (-1, n_half_words * 2))
-        plastic_plastic_row_data = self.convert_per_connection_data_to_rows(
-            connection_row_indices, n_rows, plastic_plastic)
 
-        # pp_size = fp_size in words => fp_size * no_bytes / 4 (bytes)
-        if self._pad_to_length is not None:
-            # Pad the data
-            plastic_plastic_row_data = self._pad_row(
-                plastic_plastic_row_data, n_half_words * 2)
-        plastic_headers = numpy.zeros(
-            (n_rows, self._n_header_bytes), dtype="uint8")
-        plastic_plastic_rows = [
-            numpy.concatenate((
-                plastic_headers[i], plastic_plastic_row_data[i]))
-            for i in range(n_rows)]
-        pp_size = self.get_n_items(plastic_plastic_rows, 4)
-        pp_data = self.get_words(plastic_plastic_rows)
+        return fixed_plastic, plastic_plastic
 
-        return fp_data, pp_data, fp_size, pp_size
+    @overrides(AbstractPlasticSynapseDynamics.get_n_plastic_header_bytes)
+    def get_n_plastic_header_bytes(self):
+        return self._n_header_bytes
 
     def _pad_row(self, rows, no_bytes_per_connection):
         # Row elements are (individual) bytes
@@ -181,6 +181,17 @@ class SynapseDynamicsStructuralSTDP(AbstractSynapseDynamicsStructural,
             connections, connection_row_indices, n_rows, post_vertex_slice,
             n_synapse_types)
 
+    @overrides(SynapseDynamicsSTDP.get_plastic_synaptic_words,
+               additional_arguments={"app_edge", "machine_edge"})
+    def get_plastic_synaptic_words(self, connections, post_vertex_slice,
+                                   n_synapse_types, app_edge, machine_edge):
+        self._common_sp.synaptic_data_update(
+            connections, post_vertex_slice,
+            app_edge, machine_edge)
+        return super(SynapseDynamicsStructuralSTDP,
+                     self).get_plastic_synaptic_words(
+            connections, post_vertex_slice, n_synapse_types)
+
     @overrides(SynapseDynamicsSTDP.get_n_plastic_plastic_words_per_row)
     def get_n_plastic_plastic_words_per_row(self, pp_size):
 
@@ -17,10 +17,15 @@ class AbstractSynapseIO(object):
 
     def get_max_row_info(
             self, synapse_info, post_vertex_slice, n_delay_stages,
-            population_table, machine_time_step, in_edge):
+            population_table, machine_time_step, in_edge, connections=None):
         """ Get the information about the maximum lengths of delayed and\
             undelayed rows in bytes (including header), words (without header)\
             and number of synapses
+
+        :param connections: \
+            The connections from all the pre-synaptic neurons to the post\
+            slice, if already created, in which case the maximums are exact\
+            rather than estimated by the connector
         """
 
     @abstractmethod
@@ -29,9 +34,14 @@ class AbstractSynapseIO(object):
             post_slices, post_slice_index, pre_vertex_slice,
             post_vertex_slice, n_delay_stages, population_table,
             n_synapse_types, weight_scales, machine_time_step,
-            app_edge, machine_edge):
+            app_edge, machine_edge, connections=None):
         """ Get the synapses as an array of words for non-delayed synapses and\
             an array of words for delayed synapses
+
+        :param connections: \
+            The connections of the block, if already created, in which case\
+            they are used (and updated) rather than creating them with the\
+            connector
         """
 
     @abstractmethod
@@ -57,27 +57,32 @@ class SynapseIORowBased(AbstractSynapseIO):
     @overrides(AbstractSynapseIO.get_max_row_info)
     def get_max_row_info(
             self, synapse_info, post_vertex_slice, n_delay_stages,
-            population_table, machine_time_step, in_edge):
-        max_delay_supported = self.get_maximum_delay_supported_in_ms(
-            machine_time_step)
-        max_delay = max_delay_supported * (n_delay_stages + 1)
-
-        # delay point where delay extensions start
-        min_delay_for_delay_extension = (
-                max_delay_supported + numpy.finfo(numpy.double).tiny)
+            population_table, machine_time_step, in_edge, connections=None):
+        # pylint: disable=arguments-differ
+        if connections is not None:
+            max_undelayed_n_synapses, max_delayed_n_synapses = \
+                self._get_max_n_synapses(connections, machine_time_step)
+        else:
+            max_delay_supported = self.get_maximum_delay_supported_in_ms(
+                machine_time_step)
+            max_delay = max_delay_supported * (n_delay_stages + 1)
 
-        # row length for the non-delayed synaptic matrix
-        max_undelayed_n_synapses = synapse_info.connector \
-            .get_n_connections_from_pre_vertex_maximum(
-                post_vertex_slice, 0, max_delay_supported)
+            # delay point where delay extensions start
+            min_delay_for_delay_extension = (
+                    max_delay_supported + numpy.finfo(numpy.double).tiny)
 
-        # determine the max row length in the delay extension
-        max_delayed_n_synapses = 0
-        if n_delay_stages > 0:
-            max_delayed_n_synapses = synapse_info.connector \
+            # row length for the non-delayed synaptic matrix
+            max_undelayed_n_synapses = synapse_info.connector \
                 .get_n_connections_from_pre_vertex_maximum(
-                    post_vertex_slice,
-                    min_delay_for_delay_extension, max_delay)
+                    post_vertex_slice, 0, max_delay_supported)
+
+            # determine the max row length in the delay extension
+            max_delayed_n_synapses = 0
+            if n_delay_stages > 0:
+                max_delayed_n_synapses = synapse_info.connector \
+                    .get_n_connections_from_pre_vertex_maximum(
+                        post_vertex_slice,
+                        min_delay_for_delay_extension, max_delay)
 
         # Get the row sizes
         dynamics = synapse_info.synapse_dynamics
@@ -113,71 +118,125 @@ class SynapseIORowBased(AbstractSynapseIO):
             undelayed_max_bytes, delayed_max_bytes,
             undelayed_max_n_words, delayed_max_n_words)
 
+    def _get_delay_stages(self, delays, machine_time_step):
+        """ Get the delay stage of connections from their delays in\
+            timesteps, where stage 0 is the undelayed matrix
+        """
+        max_delay = self.get_maximum_delay_supported_in_ms(machine_time_step)
+        max_delay *= (1000.0 / machine_time_step)
+        stages = numpy.floor((numpy.round(delays - 1.0)) / max_delay)
+        stages[delays <= max_delay] = 0
+        return stages.astype("uint32")
+
+    def _get_max_n_synapses(self, connections, machine_time_step):
+        """ Get the exact maximum number of synapses in an undelayed row\
+            and in a delayed row of a set of connections
+        """
+        if not len(connections):
+            return 0, 0
+        delays = numpy.rint(
+            connections["delay"] * (1000.0 / machine_time_step))
+        stages = self._get_delay_stages(delays, machine_time_step)
+        undelayed = stages == 0
+        max_undelayed_n_synapses = 0
+        if numpy.any(undelayed):
+            max_undelayed_n_synapses = int(numpy.amax(numpy.bincount(
+                connections["source"][undelayed])))
+        max_delayed_n_synapses = 0
+        if not numpy.all(undelayed):
+            rows = ((connections["source"][~undelayed].astype("uint64") <<
+                     numpy.uint64(32)) + stages[~undelayed])
+            max_delayed_n_synapses = int(numpy.amax(
+                numpy.unique(rows, return_counts=True)[1]))
+        return max_undelayed_n_synapses, max_delayed_n_synapses
+
+    @staticmethod
+    def _get_row_positions(row_indices, n_rows):
+        """ Get the number of connections in each row, and the position of\
+            each connection within its row, keeping connections in the same\
+            row in the order in which they were given
+        """
+        n_row_connections = numpy.bincount(row_indices, minlength=n_rows)
+        order = numpy.argsort(row_indices, kind="mergesort")
+        row_starts = numpy.cumsum(n_row_connections) - n_row_connections
+        positions = numpy.empty(len(row_indices), dtype="int64")
+        positions[order] = (
+            numpy.arange(len(row_indices)) - row_starts[row_indices[order]])
+        return n_row_connections, positions
+
     @staticmethod
     def _get_max_row_length_and_row_data(
             connections, row_indices, n_rows, post_vertex_slice,
             n_synapse_types, population_table, synapse_dynamics,
             app_edge, machine_edge):
         # pylint: disable=too-many-arguments, too-many-locals
-        row_ids = range(n_rows)
-        ff_data, ff_size = None, None
-        fp_data, pp_data, fp_size, pp_size = None, None, None, None
-        if (isinstance(synapse_dynamics, AbstractStaticSynapseDynamics) or
-                isinstance(synapse_dynamics, SynapseDynamicsStructuralStatic)):
-
-            # Get the static data
+        n_row_connections, positions = SynapseIORowBased._get_row_positions(
+            row_indices, n_rows)
+
+        # Work out the number of synapses to leave space for in each row
+        n_row_synapses = n_row_connections
+        if synapse_dynamics.pad_to_length is not None:
+            n_row_synapses = numpy.maximum(
+                n_row_connections, synapse_dynamics.pad_to_length)
+
+        # Get the data of each connection, and the length of each row
+        is_static = (
+            isinstance(synapse_dynamics, AbstractStaticSynapseDynamics) or
+            isinstance(synapse_dynamics, SynapseDynamicsStructuralStatic))
+        if is_static:
             if isinstance(synapse_dynamics, AbstractSynapseDynamicsStructural):
-                ff_data, ff_size = synapse_dynamics.get_static_synaptic_data(
-                    connections, row_indices, n_rows, post_vertex_slice,
-                    n_synapse_types, app_edge=app_edge,
-                    machine_edge=machine_edge)
+                ff_data = synapse_dynamics.get_static_synaptic_words(
+                    connections, post_vertex_slice, n_synapse_types,
+                    app_edge=app_edge, machine_edge=machine_edge)
             else:
-                ff_data, ff_size = synapse_dynamics.get_static_synaptic_data(
-                    connections, row_indices, n_rows, post_vertex_slice,
-                    n_synapse_types)
-
-            # Blank the plastic data
-            fp_data = [numpy.zeros(0, dtype="uint32") for _ in range(n_rows)]
-            pp_data = [numpy.zeros(0, dtype="uint32") for _ in range(n_rows)]
-            fp_size = [numpy.zeros(1, dtype="uint32") for _ in range(n_rows)]
-            pp_size = [numpy.zeros(1, dtype="uint32") for _ in range(n_rows)]
+                ff_data = synapse_dynamics.get_static_synaptic_words(
+                    connections, post_vertex_slice, n_synapse_types)
+            row_lengths = n_row_synapses
         elif (isinstance(synapse_dynamics, SynapseDynamicsSTDP) or
               isinstance(synapse_dynamics, SynapseDynamicsStructuralSTDP)):
-
-            # Blank the static data
-            ff_data = [numpy.zeros(0, dtype="uint32") for _ in row_ids]
-            ff_size = [numpy.zeros(1, dtype="uint32") for _ in row_ids]
-
-            # Get the plastic data
             if isinstance(synapse_dynamics, AbstractSynapseDynamicsStructural):
-                fp_data, pp_data, fp_size, pp_size = \
-                    synapse_dynamics.get_plastic_synaptic_data(
-                        connections, row_indices, n_rows, post_vertex_slice,
-                        n_synapse_types, app_edge=app_edge,
-                        machine_edge=machine_edge)
+                fp_data, pp_data = synapse_dynamics.get_plastic_synaptic_words(
+                    connections, post_vertex_slice, n_synapse_types,
+                    app_edge=app_edge, machine_edge=machine_edge)
             else:
-                fp_data, pp_data, fp_size, pp_size = \
-                    synapse_dynamics.get_plastic_synaptic_data(
-                        connections, row_indices, n_rows, post_vertex_slice,
-                        n_synapse_types)
-
-        # Add some padding
-        row_lengths = [
-            _N_HEADER_WORDS + pp_data[i].size + fp_data[i].size +
-            ff_data[i].size for i in row_ids]
-        max_length = max(row_lengths) - _N_HEADER_WORDS
-        max_row_length = population_table.get_allowed_row_length(max_length)
-        padding = [
-            numpy.zeros(
-                max_row_length - (row_length - _N_HEADER_WORDS),
-                dtype="uint32")
-            for row_length in row_lengths]
-
-        # Join the bits into rows
-        items_to_join = [
-            pp_size, pp_data, ff_size, fp_size, ff_data, fp_data, padding]
-        rows = [numpy.concatenate(items) for items in zip(*items_to_join)]
-        row_data = numpy.concatenate(rows)
+                fp_data, pp_data = synapse_dynamics.get_plastic_synaptic_words(
+                    connections, post_vertex_slice, n_synapse_types)
+
+            # The plastic region is a header followed by the plastic bytes of
+            # each synapse; the fixed region is a half-word per synapse
+            n_header_bytes = synapse_dynamics.get_n_plastic_header_bytes()
+            n_pp_bytes = pp_data.shape[1]
+            pp_size = (
+                n_header_bytes + (n_row_synapses * n_pp_bytes) + 3) // 4
+            row_lengths = pp_size + ((n_row_synapses + 1) // 2)
+
+        max_row_length = population_table.get_allowed_row_length(
+            int(numpy.max(row_lengths)))
+
+        # Each row is laid out as [pp_size, pp_data, ff_size, fp_size,
+        # ff_data, fp_data, padding], so write each part of each row directly
+        # to its place in the block
+        row_stride = max_row_length + _N_HEADER_WORDS
+        row_starts = numpy.arange(n_rows, dtype="int64") * row_stride
+        row_data = numpy.zeros(n_rows * row_stride, dtype="uint32")
+        connection_starts = row_starts[row_indices]
+        if is_static:
+            row_data[row_starts + 1] = n_row_connections
+            row_data[connection_starts + _N_HEADER_WORDS + positions] = \
+                ff_data
+        else:
+            row_data[row_starts] = pp_size
+            row_data[row_starts + pp_size + 2] = n_row_connections
+            pp_bytes = row_data.view("uint8")
+            pp_offsets = (
+                ((connection_starts + 1) * 4) + n_header_bytes +
+                (positions * n_pp_bytes))
+            pp_bytes[pp_offsets.reshape((-1, 1)) +
+                     numpy.arange(n_pp_bytes)] = pp_data
+            fp_half_words = row_data.view("uint16")
+            fp_half_words[
+                ((connection_starts + pp_size[row_indices] + 3) * 2) +
+                positions] = fp_data
 
         # Return the data
         return max_row_length, row_data
@@ -188,7 +247,7 @@ class SynapseIORowBased(AbstractSynapseIO):
             post_slices, post_slice_index, pre_vertex_slice,
             post_vertex_slice, n_delay_stages, population_table,
             n_synapse_types, weight_scales, machine_time_step,
-            app_edge, machine_edge):
+            app_edge, machine_edge, connections=None):
         # pylint: disable=too-many-arguments, too-many-locals, arguments-differ
 
         # Get delays in timesteps
@@ -197,10 +256,11 @@ class SynapseIORowBased(AbstractSynapseIO):
             max_delay *= (1000.0 / machine_time_step)
 
         # Get the actual connections
-        connections = synapse_info.connector.create_synaptic_block(
-            pre_slices, pre_slice_index, post_slices,
-            post_slice_index, pre_vertex_slice, post_vertex_slice,
-            synapse_info.synapse_type)
+        if connections is None:
+            connections = synapse_info.connector.create_synaptic_block(
+                pre_slices, pre_slice_index, post_slices,
+                post_slice_index, pre_vertex_slice, post_vertex_slice,
+                synapse_info.synapse_type)
 
         # Convert delays to timesteps
         connections["delay"] = numpy.rint(
@@ -249,9 +309,8 @@ class SynapseIORowBased(AbstractSynapseIO):
         if delayed_connections.size:
             # Get the delay stages and which row each delayed connection will
             # go into
-            stages = numpy.floor((numpy.round(
-                delayed_connections["delay"] - 1.0)) / max_delay).astype(
-                "uint32")
+            stages = self._get_delay_stages(
+                delayed_connections["delay"], machine_time_step)
             delayed_row_indices = (
                     (delayed_connections[
                          "source"] - pre_vertex_slice.lo_atom) +
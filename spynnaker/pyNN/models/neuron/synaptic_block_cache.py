@@ -0,0 +1,147 @@
+import logging
+import os
+import tempfile
+
+import numpy
+
+from spynnaker.pyNN.models.neuron.synapse_dynamics \
+    import AbstractPlasticSynapseDynamics, AbstractSynapseDynamicsStructural
+from spynnaker.pyNN.utilities.utility_calls import get_digest
+
+logger = logging.getLogger(__name__)
+
+# The version of the cached data; change this when the format of the
+# synaptic rows changes, so that old blocks are not used
+_CACHE_VERSION = 1
+
+# The names of the arrays of a block, in the order of the result of
+# get_synapses of the synapse IO
+_BLOCK_ITEMS = (
+    "row_data", "row_length", "delayed_row_data", "delayed_row_length",
+    "delayed_source_ids", "delay_stages")
+
+
+class SynapticBlockCache(object):
+    """ A store of synaptic blocks on disk, addressed by a digest of\
+        everything that determines the content of the block, so that blocks\
+        can be reused between runs and between scripts
+    """
+
+    __slots__ = [
+        # The directory holding the blocks
+        "_directory"]
+
+    def __init__(self, directory):
+        """
+        :param directory: The directory to hold the blocks, which is\
+            created if it doesn't exist
+        """
+        self._directory = directory
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+
+    @property
+    def directory(self):
+        return self._directory
+
+    @staticmethod
+    def _get_dynamics_parameters(dynamics):
+        """ Get the parameters of synapse dynamics that determine the rows\
+            that they make
+        """
+        parameters = [
+            dynamics.__class__.__name__,
+            dynamics.get_vertex_executable_suffix(), dynamics.pad_to_length]
+        if isinstance(dynamics, AbstractPlasticSynapseDynamics):
+            parameters.append(dynamics.get_n_plastic_header_bytes())
+            parameters.append(
+                getattr(dynamics, "dendritic_delay_fraction", None))
+            timing_dependence = getattr(dynamics, "timing_dependence", None)
+            if timing_dependence is not None:
+                structure = timing_dependence.synaptic_structure
+                parameters.append(structure.__class__.__name__)
+                parameters.append(
+                    structure.get_n_half_words_per_connection())
+                parameters.append(structure.get_weight_half_word())
+        return parameters
+
+    def get_key(
+            self, synapse_info, pre_vertex_slice, post_vertex_slice,
+            n_delay_stages, population_table, synapse_io, n_synapse_types,
+            weight_scales, machine_time_step):
+        """ Get the key of a synaptic block
+
+        :return: The key, or None if the block can't be cached
+        :rtype: str or None
+        """
+        if isinstance(synapse_info.synapse_dynamics,
+                      AbstractSynapseDynamicsStructural):
+            return None
+        # The connector parameters can be large (e.g. a connection list), so
+        # only their digest, which the connector keeps, is included
+        connector_digest = synapse_info.connector.get_block_cache_digest()
+        if connector_digest is None:
+            return None
+        return get_digest([
+            _CACHE_VERSION, population_table.__class__.__name__,
+            synapse_io.__class__.__name__,
+            pre_vertex_slice.lo_atom, pre_vertex_slice.hi_atom,
+            post_vertex_slice.lo_atom, post_vertex_slice.hi_atom,
+            n_delay_stages, n_synapse_types,
+            numpy.asarray(weight_scales, dtype="float64"),
+            machine_time_step, synapse_info.synapse_type] +
+            self._get_dynamics_parameters(synapse_info.synapse_dynamics) +
+            [connector_digest])
+
+    def _get_filename(self, key):
+        return os.path.join(self._directory, key + ".npz")
+
+    def contains(self, key):
+        """ Determine if a block is in the cache
+
+        :param key: The key of the block
+        :rtype: bool
+        """
+        return os.path.isfile(self._get_filename(key))
+
+    def get_block(self, key):
+        """ Get a block from the cache
+
+        :param key: The key of the block
+        :return: The block, as returned by get_synapses of the synapse IO,\
+            or None if the block is not in the cache
+        """
+        filename = self._get_filename(key)
+        if not os.path.isfile(filename):
+            return None
+        try:
+            with numpy.load(filename) as data:
+                block = tuple(data[name] for name in _BLOCK_ITEMS)
+        except (IOError, OSError, KeyError, ValueError):
+            logger.warning(
+                "Ignoring unreadable cached synaptic block %s", filename)
+            return None
+        (row_data, row_length, delayed_row_data, delayed_row_length,
+         delayed_source_ids, delay_stages) = block
+        return (row_data, int(row_length), delayed_row_data,
+                int(delayed_row_length), delayed_source_ids, delay_stages)
+
+    def store_block(self, key, block):
+        """ Store a block in the cache
+
+        :param key: The key of the block
+        :param block: The block, as returned by get_synapses of the\
+            synapse IO
+        """
+        # Write to a temporary file and then move it into place, so that a
+        # partly written block is never read
+        handle, temp_filename = tempfile.mkstemp(
+            suffix=".npz", dir=self._directory)
+        try:
+            with os.fdopen(handle, "wb") as f:
+                numpy.savez(f, **dict(zip(_BLOCK_ITEMS, block)))
+            os.rename(temp_filename, self._get_filename(key))
+        except (IOError, OSError):
+            logger.warning("Could not cache synaptic block %s", key)
+            if os.path.exists(temp_filename):
+                os.remove(temp_filename)
@@ -2,12 +2,14 @@ import math
 import scipy.stats  # @UnresolvedImport
 import struct
 import sys
+import threading
 from collections import defaultdict
 from scipy import special  # @UnresolvedImport
 import numpy
 
 # PACMAN imports
 from pacman.model.abstract_classes import AbstractHasGlobalMaxAtoms
+from pacman.model.graphs.common import Slice
 
 # spinn utilities
 from spinn_utilities.helpful_functions import get_valid_components
@@ -15,7 +17,7 @@ from spynnaker.pyNN.models.neuron.generator_data import GeneratorData
 
 # front-end common
 from spinn_front_end_common.utilities.helpful_functions \
-    import locate_memory_region_for_placement
+    import locate_memory_region_for_placement, read_config
 from spinn_front_end_common.utilities.globals_variables import get_simulator
 
 # dsg
@@ -31,6 +33,8 @@ from spynnaker.pyNN.models.neuron.synapse_dynamics \
     import SynapseDynamicsStatic, AbstractSynapseDynamicsStructural, \
     AbstractGenerateOnMachine
 from spynnaker.pyNN.models.neuron.synapse_io import SynapseIORowBased
+from spynnaker.pyNN.models.neuron.synaptic_block_cache \
+    import SynapticBlockCache
 from spynnaker.pyNN.models.spike_source.spike_source_poisson_vertex \
     import SpikeSourcePoissonVertex
 from spynnaker.pyNN.models.utility_models import DelayExtensionVertex
@@ -80,7 +84,17 @@ class SynapticManager(object):
         "_weight_scales",
         "_ring_buffer_shifts",
         "_gen_on_machine",
-        "_max_row_info"]
+        "_max_row_info",
+        "_pregenerated_blocks",
+        "_exact_synaptic_memory",
+        "_exact_connections",
+        "_block_cache",
+        "_decoded_pop_tables",
+        "_read_whole_synaptic_matrix",
+        "_synaptic_matrix_sizes",
+        "_read_regions",
+        "_read_locks",
+        "_read_locks_lock"]
 
     def __init__(self, n_synapse_types, ring_buffer_sigma, spikes_per_second,
                  config, population_table_type=None, synapse_io=None):
@@ -120,6 +134,27 @@ class SynapticManager(object):
         self._delay_key_index = dict()
         self._retrieved_blocks = dict()
 
+        # The master population tables read from the machine by placement,
+        # decoded
+        self._decoded_pop_tables = dict()
+
+        # Whether to read the synaptic matrix of a placement in one go when
+        # reading back the connections, rather than a block at a time
+        self._read_whole_synaptic_matrix = config.getboolean(
+            "Simulation", "read_whole_synaptic_matrix")
+
+        # The size of the synaptic matrix region of each placement
+        self._synaptic_matrix_sizes = dict()
+
+        # The synaptic matrix and direct matrix regions read from the
+        # machine by placement, as numpy arrays of bytes
+        self._read_regions = dict()
+
+        # Locks that serialise the reads of each placement, as connections
+        # can be read in several threads, and a lock for the dict of them
+        self._read_locks = dict()
+        self._read_locks_lock = threading.Lock()
+
         # A list of connection holders to be filled in pre-run, indexed by
         # the edge the connection is for
         self._pre_run_connection_holders = defaultdict(list)
@@ -135,6 +170,27 @@ class SynapticManager(object):
         # size in bytes
         self._max_row_info = dict()
 
+        # A source of synaptic blocks generated ahead of the data
+        # specification, or None if all blocks are generated as written
+        self._pregenerated_blocks = None
+
+        # Whether to size the synaptic matrix from the connections
+        # themselves, rather than from an estimate
+        self._exact_synaptic_memory = config.getboolean(
+            "Simulation", "exact_synaptic_memory")
+
+        # A map of synapse information and post slice to the connections from
+        # all the pre-neurons, sorted by source, when sizing exactly
+        self._exact_connections = dict()
+
+        # A store of synaptic blocks kept between runs, or None if blocks
+        # are not kept
+        self._block_cache = None
+        cache_directory = read_config(
+            config, "Simulation", "synaptic_block_cache_directory")
+        if cache_directory is not None:
+            self._block_cache = SynapticBlockCache(cache_directory)
+
     @property
     def synapse_dynamics(self):
         return self._synapse_dynamics
@@ -203,6 +259,71 @@ class SynapticManager(object):
         # 4 for the size of the direct addresses matrix in bytes
         return 8
 
+    def _is_sized_exactly(self, synapse_info):
+        """ Determine if the synaptic matrix of a synapse information is\
+            sized from its connections, which are then created when the\
+            vertex is partitioned and kept until its data is written
+        """
+        connector = synapse_info.connector
+        dynamics = synapse_info.synapse_dynamics
+        return (
+            self._exact_synaptic_memory and
+            connector.can_create_blocks_for_all_pre_neurons and
+            not isinstance(dynamics, AbstractSynapseDynamicsStructural) and
+            not (isinstance(connector, AbstractGenerateConnectorOnMachine) and
+                 connector.generate_on_machine and
+                 isinstance(dynamics, AbstractGenerateOnMachine) and
+                 dynamics.generate_on_machine))
+
+    def _get_exact_connections(
+            self, synapse_info, post_vertex_slice, app_edge):
+        """ Get the connections from all the pre-neurons to a post slice,\
+            sorted by source, creating them if not already created
+        """
+        key = (synapse_info, post_vertex_slice.lo_atom,
+               post_vertex_slice.hi_atom)
+        if key not in self._exact_connections:
+            pre_vertex_slice = Slice(0, app_edge.pre_vertex.n_atoms - 1)
+            connections = synapse_info.connector.create_synaptic_block(
+                [pre_vertex_slice], 0, [post_vertex_slice], 0,
+                pre_vertex_slice, post_vertex_slice,
+                synapse_info.synapse_type)
+            self._exact_connections[key] = connections[numpy.argsort(
+                connections["source"], kind="mergesort")]
+        return self._exact_connections[key]
+
+    def _get_block_connections(
+            self, synapse_info, pre_vertex_slice, post_vertex_slice,
+            app_edge):
+        """ Get a copy of the connections of a block from the connections\
+            created to size the synaptic matrix exactly, or None if the\
+            matrix is not sized exactly
+        """
+        if not self._is_sized_exactly(synapse_info):
+            return None
+        connections = self._get_exact_connections(
+            synapse_info, post_vertex_slice, app_edge)
+        start, end = numpy.searchsorted(connections["source"], numpy.array(
+            [pre_vertex_slice.lo_atom, pre_vertex_slice.hi_atom + 1],
+            dtype=connections["source"].dtype))
+        return connections[start:end].copy()
+
+    def _prune_exact_connections(self, post_slices):
+        """ Forget the connections to the post slices that were considered\
+            while partitioning but are not in the partitioned graph, along\
+            with the row information found from them.  The connections of\
+            the slices in the graph are kept, so that the data written when\
+            it is regenerated is the same as that the memory was sized for.
+
+        :param post_slices: the slices of the partitioned post-vertex
+        """
+        slices = {(post_slice.lo_atom, post_slice.hi_atom)
+                  for post_slice in post_slices}
+        for key in list(self._exact_connections):
+            if key[1:] not in slices:
+                del self._exact_connections[key]
+                self._max_row_info.pop(key, None)
+
     def _get_max_row_info(
             self, synapse_info, post_vertex_slice, app_edge,
             machine_time_step):
@@ -211,18 +332,41 @@ class SynapticManager(object):
         key = (synapse_info, post_vertex_slice.lo_atom,
                post_vertex_slice.hi_atom)
         if key not in self._max_row_info:
+            connections = None
+            if self._is_sized_exactly(synapse_info):
+                connections = self._get_exact_connections(
+                    synapse_info, post_vertex_slice, app_edge)
             self._max_row_info[key] = self._synapse_io.get_max_row_info(
                 synapse_info, post_vertex_slice,
                 app_edge.n_delay_stages, self._poptable_type,
-                machine_time_step, app_edge)
+                machine_time_step, app_edge, connections=connections)
         return self._max_row_info[key]
 
+    @staticmethod
+    def _get_n_pre_vertices(in_edge):
+        """ Get the likely number of machine vertices of the pre-vertex of\
+            an edge
+        """
+        max_atoms = sys.maxsize
+        edge_pre_vertex = in_edge.pre_vertex
+        if (isinstance(
+                edge_pre_vertex, AbstractHasGlobalMaxAtoms)):
+            max_atoms = in_edge.pre_vertex.get_max_atoms_per_core()
+        if in_edge.pre_vertex.n_atoms < max_atoms:
+            max_atoms = in_edge.pre_vertex.n_atoms
+        return int(math.ceil(
+            float(in_edge.pre_vertex.n_atoms) / float(max_atoms)))
+
     def _get_synaptic_blocks_size(
             self, post_vertex_slice, in_edges, machine_time_step):
         """ Get the size of the synaptic blocks in bytes
         """
         memory_size = self._get_static_synaptic_matrix_sdram_requirements()
 
+        # The most padding that can be added before a block
+        max_padding = self._poptable_type.get_next_allowed_address(1) - 1
+
+        all_exact = True
         for in_edge in in_edges:
             if isinstance(in_edge, ProjectionApplicationEdge):
                 for synapse_info in in_edge.synapse_information:
@@ -239,6 +383,17 @@ class SynapticManager(object):
                         max_row_info.delayed_max_bytes * n_atoms *
                         in_edge.n_delay_stages)
 
+                    # An exactly sized matrix can still be padded before
+                    # the undelayed and delayed block of each pre-vertex
+                    if self._is_sized_exactly(synapse_info):
+                        memory_size += (
+                            max_padding * 2 *
+                            self._get_n_pre_vertices(in_edge))
+                    else:
+                        all_exact = False
+
+        if all_exact:
+            return int(memory_size)
         return int(memory_size * _SYNAPSE_SDRAM_OVERSCALE)
 
     def _get_size_of_generator_information(self, in_edges):
@@ -251,15 +406,7 @@ class SynapticManager(object):
                 for synapse_info in in_edge.synapse_information:
 
                     # Get the number of likely vertices
-                    max_atoms = sys.maxsize
-                    edge_pre_vertex = in_edge.pre_vertex
-                    if (isinstance(
-                            edge_pre_vertex, AbstractHasGlobalMaxAtoms)):
-                        max_atoms = in_edge.pre_vertex.get_max_atoms_per_core()
-                    if in_edge.pre_vertex.n_atoms < max_atoms:
-                        max_atoms = in_edge.pre_vertex.n_atoms
-                    n_edge_vertices = int(math.ceil(
-                        float(in_edge.pre_vertex.n_atoms) / float(max_atoms)))
+                    n_edge_vertices = self._get_n_pre_vertices(in_edge)
 
                     # Get the size
                     connector = synapse_info.connector
@@ -525,6 +672,13 @@ class SynapticManager(object):
         """
         return float(math.pow(2, 16 - (ring_buffer_to_input_left_shift + 1)))
 
+    def _get_weight_scales(self, ring_buffer_shifts, weight_scale):
+        """ Get the amount to scale the weights of each synapse type by
+        """
+        return numpy.array([
+            self._get_weight_scale(r) * weight_scale
+            for r in ring_buffer_shifts])
+
     def _write_synapse_parameters(
             self, spec, ring_buffer_shifts, post_vertex_slice, weight_scale):
         # Get the ring buffer shifts and scaling factors
@@ -533,10 +687,7 @@ class SynapticManager(object):
 
         spec.write_array(ring_buffer_shifts)
 
-        weight_scales = numpy.array([
-            self._get_weight_scale(r) * weight_scale
-            for r in ring_buffer_shifts])
-        return weight_scales
+        return self._get_weight_scales(ring_buffer_shifts, weight_scale)
 
     def _write_padding(
             self, spec, synaptic_matrix_region, next_block_start_address):
@@ -773,13 +924,26 @@ class SynapticManager(object):
             master_pop_table_region, weight_scales, machine_time_step,
             rinfo, all_syn_block_sz, block_addr, single_addr,
             machine_edge):
+        block = None
+        cache_key = self._get_block_cache_key(
+            synapse_info, pre_vertex_slice, post_vertex_slice, app_edge,
+            n_synapse_types, weight_scales, machine_time_step)
+        if cache_key is not None:
+            block = self._block_cache.get_block(cache_key)
+        is_cached = block is not None
+        if block is None and self._pregenerated_blocks is not None:
+            block = self._pregenerated_blocks.get_block(
+                (machine_edge, synapse_info))
+        if block is None:
+            block = self._generate_block(
+                synapse_info, pre_slices, pre_slice_idx, post_slices,
+                post_slice_index, pre_vertex_slice, post_vertex_slice,
+                app_edge, n_synapse_types, weight_scales, machine_time_step,
+                machine_edge)
+        if cache_key is not None and not is_cached:
+            self._block_cache.store_block(cache_key, block)
         (row_data, row_length, delayed_row_data, delayed_row_length,
-         delayed_source_ids, delay_stages) = self._synapse_io.get_synapses(
-             synapse_info, pre_slices, pre_slice_idx, post_slices,
-             post_slice_index, pre_vertex_slice, post_vertex_slice,
-             app_edge.n_delay_stages, self._poptable_type, n_synapse_types,
-             weight_scales, machine_time_step,
-             app_edge=app_edge, machine_edge=machine_edge)
+         delayed_source_ids, delay_stages) = block
 
         if app_edge.delay_edge is not None:
             app_edge.delay_edge.pre_vertex.add_delays(
@@ -796,7 +960,8 @@ class SynapticManager(object):
                     synapse_info, pre_vertex_slice, post_vertex_slice,
                     row_length, delayed_row_length, n_synapse_types,
                     weight_scales, row_data, delayed_row_data,
-                    app_edge.n_delay_stages, machine_time_step))
+                    app_edge.n_delay_stages, machine_time_step),
+                    post_vertex_slice)
                 conn_holder.finish()
 
         if row_data.size:
@@ -838,6 +1003,19 @@ class SynapticManager(object):
                     block_addr, all_syn_block_sz))
         return block_addr, single_addr
 
+    def _get_block_cache_key(
+            self, synapse_info, pre_vertex_slice, post_vertex_slice,
+            app_edge, n_synapse_types, weight_scales, machine_time_step):
+        """ Get the key of a synaptic block in the block cache, or None if\
+            blocks are not being cached or the block can't be cached
+        """
+        if self._block_cache is None:
+            return None
+        return self._block_cache.get_key(
+            synapse_info, pre_vertex_slice, post_vertex_slice,
+            app_edge.n_delay_stages, self._poptable_type, self._synapse_io,
+            n_synapse_types, weight_scales, machine_time_step)
+
     def __is_direct(
             self, single_addr, connector, pre_vertex_slice, post_vertex_slice,
             app_edge):
@@ -889,10 +1067,128 @@ class SynapticManager(object):
                     weight_scale)
         return self._ring_buffer_shifts
 
+    @property
+    def pregenerated_blocks(self):
+        """ The source of synaptic blocks generated ahead of the data\
+            specification; this has a get_block method taking a tuple of\
+            (machine edge, synapse information) and returning the result of\
+            the synapse IO get_synapses, or None if the block was not\
+            generated in advance.
+        """
+        return self._pregenerated_blocks
+
+    @pregenerated_blocks.setter
+    def pregenerated_blocks(self, pregenerated_blocks):
+        self._pregenerated_blocks = pregenerated_blocks
+
+    def get_pregenerable_blocks(
+            self, application_vertex, post_vertex_slice, machine_vertex,
+            machine_graph, application_graph, graph_mapper, weight_scale,
+            machine_time_step):
+        """ Get the synaptic blocks of a machine vertex which can be\
+            generated ahead of (and independently of) the data specification.
+
+        Only blocks which are generated on host, whose connectors are\
+        deterministic (or whose connections were created when sizing the\
+        matrix exactly) and whose synapse dynamics hold no per-edge state\
+        are included, so that generating them in another process gives\
+        exactly the same data as generating them while writing the\
+        specification.
+
+        The blocks listed depend only on the graph, so the same list is\
+        returned in every process, and nothing is generated or copied until\
+        a block is generated; a block which is then found to be in the\
+        block cache is not generated again.
+
+        :return: a list of (key, function, arguments to the function), in\
+            the order that the blocks will be written, where the function\
+            returns the result of the synapse IO get_synapses, or None if\
+            the block is in the block cache
+        :rtype: list(tuple(tuple, callable, tuple))
+        """
+        ring_buffer_shifts = self._get_ring_buffer_shifts(
+            application_vertex, application_graph, machine_time_step,
+            weight_scale)
+        weight_scales = self._get_weight_scales(
+            ring_buffer_shifts, weight_scale)
+        post_slices = graph_mapper.get_slices(application_vertex)
+        post_slice_idx = graph_mapper.get_machine_vertex_index(machine_vertex)
+        self._prune_exact_connections(post_slices)
+
+        blocks = list()
+        for machine_edge in machine_graph.get_edges_ending_at_vertex(
+                machine_vertex):
+            app_edge = graph_mapper.get_application_edge(machine_edge)
+            if not isinstance(app_edge, ProjectionApplicationEdge):
+                continue
+            pre_vertex_slice = graph_mapper.get_slice(machine_edge.pre_vertex)
+            pre_slices = graph_mapper.get_slices(app_edge.pre_vertex)
+            pre_slice_idx = graph_mapper.get_machine_vertex_index(
+                machine_edge.pre_vertex)
+            for synapse_info in app_edge.synapse_information:
+                connector = synapse_info.connector
+                dynamics = synapse_info.synapse_dynamics
+                if ((not connector.is_deterministic and
+                        not self._is_sized_exactly(synapse_info)) or
+                        isinstance(
+                            dynamics, AbstractSynapseDynamicsStructural) or
+                        (isinstance(
+                            connector, AbstractGenerateConnectorOnMachine) and
+                         connector.generate_on_machine and
+                         isinstance(dynamics, AbstractGenerateOnMachine) and
+                         dynamics.generate_on_machine)):
+                    continue
+                blocks.append((
+                    (machine_edge, synapse_info), self._pregenerate_block, (
+                        synapse_info, pre_slices, pre_slice_idx, post_slices,
+                        post_slice_idx, pre_vertex_slice, post_vertex_slice,
+                        app_edge, weight_scales, machine_time_step,
+                        machine_edge)))
+        return blocks
+
+    def _pregenerate_block(
+            self, synapse_info, pre_slices, pre_slice_idx, post_slices,
+            post_slice_index, pre_vertex_slice, post_vertex_slice, app_edge,
+            weight_scales, machine_time_step, machine_edge):
+        """ Generate a synaptic block ahead of the data specification, or\
+            return None if the block is in the block cache
+        """
+        cache_key = self._get_block_cache_key(
+            synapse_info, pre_vertex_slice, post_vertex_slice, app_edge,
+            self._n_synapse_types, weight_scales, machine_time_step)
+        if cache_key is not None and self._block_cache.contains(cache_key):
+            return None
+        return self._generate_block(
+            synapse_info, pre_slices, pre_slice_idx, post_slices,
+            post_slice_index, pre_vertex_slice, post_vertex_slice, app_edge,
+            self._n_synapse_types, weight_scales, machine_time_step,
+            machine_edge)
+
+    def _generate_block(
+            self, synapse_info, pre_slices, pre_slice_idx, post_slices,
+            post_slice_index, pre_vertex_slice, post_vertex_slice, app_edge,
+            n_synapse_types, weight_scales, machine_time_step, machine_edge):
+        """ Generate a synaptic block on host, from the connections created\
+            to size the matrix exactly if there are any
+        """
+        return self._synapse_io.get_synapses(
+            synapse_info, pre_slices, pre_slice_idx, post_slices,
+            post_slice_index, pre_vertex_slice, post_vertex_slice,
+            app_edge.n_delay_stages, self._poptable_type, n_synapse_types,
+            weight_scales, machine_time_step,
+            app_edge=app_edge, machine_edge=machine_edge,
+            connections=self._get_block_connections(
+                synapse_info, pre_vertex_slice, post_vertex_slice,
+                app_edge))
+
     def write_data_spec(
             self, spec, application_vertex, post_vertex_slice, machine_vertex,
             placement, machine_graph, application_graph, routing_info,
             graph_mapper, weight_scale, machine_time_step, placements):
+        # The table and matrix of the placement are being rewritten
+        self._decoded_pop_tables.pop(placement, None)
+        self._read_regions.pop(placement, None)
+
         # Create an index of delay keys into this vertex
         for m_edge in machine_graph.get_edges_ending_at_vertex(machine_vertex):
             app_edge = graph_mapper.get_application_edge(m_edge)
@@ -907,6 +1203,9 @@ class SynapticManager(object):
         post_slices = graph_mapper.get_slices(application_vertex)
         post_slice_idx = graph_mapper.get_machine_vertex_index(machine_vertex)
 
+        # Partitioning is over, so only the slices in the graph are needed
+        self._prune_exact_connections(post_slices)
+
         # Reserve the memory
         in_edges = application_graph.get_edges_ending_at_vertex(
             application_vertex)
@@ -915,6 +1214,7 @@ class SynapticManager(object):
         self._reserve_memory_regions(
             spec, machine_vertex, post_vertex_slice, machine_graph,
             all_syn_block_sz, graph_mapper)
+        self._synaptic_matrix_sizes[placement] = all_syn_block_sz
 
         ring_buffer_shifts = self._get_ring_buffer_shifts(
             application_vertex, application_graph, machine_time_step,
@@ -954,6 +1254,8 @@ class SynapticManager(object):
 
     def clear_connection_cache(self):
         self._retrieved_blocks = dict()
+        self._decoded_pop_tables = dict()
+        self._read_regions = dict()
 
     def get_connections_from_machine(
             self, transceiver, placement, machine_edge, graph_mapper,
@@ -988,7 +1290,8 @@ class SynapticManager(object):
             direct_synapses, key, pre_vertex_slice.n_atoms, synapse_info.index,
             using_extra_monitor_cores, placements, data_receiver,
             sender_extra_monitor_core_placement,
-            extra_monitor_cores_for_router_timeout, fixed_routes)
+            extra_monitor_cores_for_router_timeout,
+            handle_time_out_configuration, fixed_routes)
 
         # Get the block for the connections from the delayed pre_vertex
         delayed_data = None
@@ -1035,51 +1338,103 @@ class SynapticManager(object):
         """ Read in a synaptic block from a given processor and vertex on\
             the machine
         """
-        # See if we have already got this block
-        if (placement, key, index) in self._retrieved_blocks:
-            return self._retrieved_blocks[placement, key, index]
-
-        items = self._poptable_type.extract_synaptic_matrix_data_location(
-            key, master_pop_table_address, transceiver,
-            placement.x, placement.y)
-        if index >= len(items):
-            return None, None
-
-        max_row_length, synaptic_block_offset, is_single = items[index]
-        if max_row_length == 0:
-            return None, None
-
-        block = None
-        if max_row_length > 0 and synaptic_block_offset is not None:
-            # if exploiting the extra monitor cores, need to set the machine
-            # for data extraction mode
-            if using_extra_monitor_cores and handle_time_out_configuration:
-                data_receiver.set_cores_for_data_extraction(
-                    transceiver, extra_monitor_cores_for_router_timeout,
-                    placements)
-
-            # read in the synaptic block
-            if not is_single:
-                block = self.__read_multiple_synaptic_blocks(
-                    transceiver, data_receiver, placement, n_rows,
-                    max_row_length,
-                    indirect_synapses_address + synaptic_block_offset,
-                    using_extra_monitor_cores,
-                    sender_extra_monitor_core_placement, fixed_routes)
-            else:
-                block, max_row_length = self.__read_single_synaptic_block(
-                    transceiver, data_receiver, placement, n_rows,
-                    direct_synapses_address + synaptic_block_offset,
-                    using_extra_monitor_cores,
-                    sender_extra_monitor_core_placement, fixed_routes)
-
-            if using_extra_monitor_cores and handle_time_out_configuration:
-                data_receiver.unset_cores_for_data_extraction(
-                    transceiver, extra_monitor_cores_for_router_timeout,
-                    placements)
-
-        self._retrieved_blocks[placement, key, index] = (block, max_row_length)
-        return block, max_row_length
+        # Check and fill the caches of the placement in one thread at a time,
+        # so that each item is read once
+        with self.__get_read_lock(placement):
+            # See if we have already got this block
+            if (placement, key, index) in self._retrieved_blocks:
+                return self._retrieved_blocks[placement, key, index]
+
+            items = self._get_synaptic_matrix_data_location(
+                transceiver, placement, master_pop_table_address, key)
+            if index >= len(items):
+                return None, None
+
+            max_row_length, synaptic_block_offset, is_single = items[index]
+            if max_row_length == 0:
+                return None, None
+
+            block = None
+            if (max_row_length > 0 and synaptic_block_offset is not None and
+                    self._read_whole_synaptic_matrix and
+                    placement in self._synaptic_matrix_sizes):
+                # slice the block out of the regions read in one go
+                synaptic_matrix, direct_matrix = self.__get_synaptic_regions(
+                    transceiver, placement, indirect_synapses_address,
+                    direct_synapses_address, using_extra_monitor_cores,
+                    placements, data_receiver,
+                    sender_extra_monitor_core_placement,
+                    extra_monitor_cores_for_router_timeout,
+                    handle_time_out_configuration, fixed_routes)
+                if not is_single:
+                    block = synaptic_matrix[
+                        synaptic_block_offset:synaptic_block_offset +
+                        self._synapse_io.get_block_n_bytes(
+                            max_row_length, n_rows)]
+                else:
+                    block, max_row_length = self.__convert_single_block(
+                        direct_matrix[
+                            synaptic_block_offset:
+                            synaptic_block_offset + (n_rows * 4)], n_rows)
+            elif max_row_length > 0 and synaptic_block_offset is not None:
+                # if exploiting the extra monitor cores, need to set the
+                # machine for data extraction mode
+                if using_extra_monitor_cores and handle_time_out_configuration:
+                    data_receiver.set_cores_for_data_extraction(
+                        transceiver, extra_monitor_cores_for_router_timeout,
+                        placements)
+
+                # read in the synaptic block
+                if not is_single:
+                    block = self.__read_multiple_synaptic_blocks(
+                        transceiver, data_receiver, placement, n_rows,
+                        max_row_length,
+                        indirect_synapses_address + synaptic_block_offset,
+                        using_extra_monitor_cores,
+                        sender_extra_monitor_core_placement, fixed_routes)
+                else:
+                    block, max_row_length = self.__read_single_synaptic_block(
+                        transceiver, data_receiver, placement, n_rows,
+                        direct_synapses_address + synaptic_block_offset,
+                        using_extra_monitor_cores,
+                        sender_extra_monitor_core_placement, fixed_routes)
+
+                if using_extra_monitor_cores and handle_time_out_configuration:
+                    data_receiver.unset_cores_for_data_extraction(
+                        transceiver, extra_monitor_cores_for_router_timeout,
+                        placements)
+
+            self._retrieved_blocks[placement, key, index] = (
+                block, max_row_length)
+            return block, max_row_length
+
+    def __get_read_lock(self, placement):
+        """ Get the lock that serialises the reads of a placement
+        """
+        with self._read_locks_lock:
+            lock = self._read_locks.get(placement)
+            if lock is None:
+                lock = threading.RLock()
+                self._read_locks[placement] = lock
+            return lock
+
+    def _get_synaptic_matrix_data_location(
+            self, transceiver, placement, master_pop_table_address, key):
+        """ Get the locations of the synaptic matrix data of a key, from\
+            the master population table of the placement, which is read\
+            once and decoded where the table type allows
+        """
+        if placement not in self._decoded_pop_tables:
+            self._decoded_pop_tables[placement] = \
+                self._poptable_type.read_master_population_table(
+                    master_pop_table_address, transceiver, placement.x,
+                    placement.y)
+        table = self._decoded_pop_tables[placement]
+        if table is None:
+            return self._poptable_type.extract_synaptic_matrix_data_location(
+                key, master_pop_table_address, transceiver, placement.x,
+                placement.y)
+        return table.get_synaptic_matrix_data_location(key)
 
     def __read_multiple_synaptic_blocks(
             self, transceiver, data_receiver, placement, n_rows,
@@ -1116,14 +1471,77 @@ class SynapticManager(object):
         else:
             single_block = transceiver.read_memory(
                 placement.x, placement.y, address, synaptic_block_size)
+        return self.__convert_single_block(single_block, n_rows)
 
-        # Convert the block into a set of rows
+    @staticmethod
+    def __convert_single_block(single_block, n_rows):
+        """ Convert a block of single synapses into a set of rows
+        """
         numpy_block = numpy.zeros((n_rows, 4), dtype="uint32")
         numpy_block[:, 3] = numpy.asarray(
             single_block, dtype="uint8").view("uint32")
         numpy_block[:, 1] = 1
         return bytearray(numpy_block.tobytes()), 1
 
+    def __get_synaptic_regions(
+            self, transceiver, placement, indirect_synapses_address,
+            direct_synapses_address, using_extra_monitor_cores,
+            placements, data_receiver, sender_extra_monitor_core_placement,
+            extra_monitor_cores_for_router_timeout,
+            handle_time_out_configuration, fixed_routes):
+        """ Get the whole synaptic matrix and direct matrix regions of a\
+            placement, reading each in one transfer the first time
+        """
+        if placement in self._read_regions:
+            return self._read_regions[placement]
+
+        # The direct matrix starts with its size in bytes
+        n_direct_bytes = _ONE_WORD.unpack_from(transceiver.read_memory(
+            placement.x, placement.y, direct_synapses_address - 4,
+            _ONE_WORD.size))[0]
+
+        if using_extra_monitor_cores and handle_time_out_configuration:
+            data_receiver.set_cores_for_data_extraction(
+                transceiver, extra_monitor_cores_for_router_timeout,
+                placements)
+
+        regions = tuple(
+            self.__read_region(
+                transceiver, data_receiver, placement, address, n_bytes,
+                using_extra_monitor_cores,
+                sender_extra_monitor_core_placement, fixed_routes)
+            for address, n_bytes in (
+                (indirect_synapses_address,
+                 self._synaptic_matrix_sizes[placement]),
+                (direct_synapses_address, n_direct_bytes)))
+
+        if using_extra_monitor_cores and handle_time_out_configuration:
+            data_receiver.unset_cores_for_data_extraction(
+                transceiver, extra_monitor_cores_for_router_timeout,
+                placements)
+
+        self._read_regions[placement] = regions
+        return regions
+
+    @staticmethod
+    def __read_region(
+            transceiver, data_receiver, placement, address, n_bytes,
+            using_extra_monitor_cores, sender_extra_monitor_core_placement,
+            fixed_routes):
+        """ Read a region in one transfer, as a numpy array of bytes so that\
+            blocks can be sliced out of it without copying
+        """
+        if n_bytes == 0:
+            return numpy.zeros(0, dtype="uint8")
+        if using_extra_monitor_cores:
+            data = data_receiver.get_data(
+                transceiver, sender_extra_monitor_core_placement, address,
+                n_bytes, fixed_routes)
+        else:
+            data = transceiver.read_memory(
+                placement.x, placement.y, address, n_bytes)
+        return numpy.frombuffer(data, dtype="uint8")
+
     # inherited from AbstractProvidesIncomingPartitionConstraints
     def get_incoming_partition_constraints(self):
         return self._poptable_type.get_edge_constraints()
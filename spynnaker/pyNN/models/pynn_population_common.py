@@ -10,6 +10,7 @@ from spynnaker.pyNN.models.abstract_models \
     import AbstractReadParametersBeforeSet, AbstractContainsUnits
 from spynnaker.pyNN.models.abstract_models \
     import AbstractPopulationInitializable, AbstractPopulationSettable
+from spynnaker.pyNN.models.common import recording_statistics
 from .abstract_pynn_model import AbstractPyNNModel
 
 from spinn_front_end_common.utilities import globals_variables
@@ -438,15 +439,20 @@ class PyNNPopulationCommon(object):
 
             self._has_read_neuron_parameters_this_run = True
 
-    def get_spike_counts(self, spikes, gather=True):
+    def get_spike_counts(self, spikes=None, gather=True):
         """ Return the number of spikes for each neuron.
+
+        :param spikes: the spikes to count, as rows of (neuron ID, time), or\
+            None to count the recorded spikes as they are read, a core at a\
+            time, without building the list of all the spikes
         """
-        n_spikes = {}
-        counts = numpy.bincount(spikes[:, 0].astype(dtype=numpy.int32),
-                                minlength=self._vertex.n_atoms)
-        for i in range(self._vertex.n_atoms):
-            n_spikes[i] = counts[i]
-        return n_spikes
+        if spikes is None:
+            # The population is also the recorder of its spikes
+            counts = self._get_spike_counts()
+        else:
+            counts = numpy.zeros(self._vertex.n_atoms, dtype="int64")
+            recording_statistics.add_spike_counts(counts, spikes[:, 0], 0)
+        return dict(enumerate(counts))
 
     @property
     def positions(self):
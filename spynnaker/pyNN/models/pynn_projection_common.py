@@ -1,6 +1,5 @@
 from pacman.model.constraints.partitioner_constraints \
     import SameAtomsAsVertexConstraint
-from spinn_front_end_common.utilities import helpful_functions
 
 from spynnaker.pyNN.models.abstract_models \
     import AbstractAcceptsIncomingSynapses
@@ -16,6 +15,9 @@ from spinn_front_end_common.utilities.exceptions import ConfigurationException
 
 from spinn_utilities.progress_bar import ProgressBar
 
+from collections import OrderedDict
+from multiprocessing.pool import ThreadPool
+from six import iteritems, itervalues
 import logging
 import math
 # pylint: disable=protected-access
@@ -231,7 +233,20 @@ class PyNNProjectionCommon(object):
 
     def _get_synaptic_data(
             self, as_list, data_to_get, fixed_values=None, notify=None,
-            handle_time_out_configuration=True):
+            handle_time_out_configuration=True, sparse_format=None,
+            sum_multapses=False, memmap_directory=None):
+        """ Get the synaptic data of the projection
+
+        :param sparse_format:\
+            If the data is returned as matrices, the scipy.sparse format of\
+            the matrices ("coo" or "csr"), or None to return dense matrices
+        :param sum_multapses:\
+            True if the values of connections with the same source and\
+            target are summed in sparse matrices
+        :param memmap_directory:\
+            If the data is returned as a list, a directory in which to hold\
+            the list in a memory-mapped file, or None to hold it in memory
+        """
         # pylint: disable=too-many-arguments
         post_vertex = self._projection_edge.post_vertex
         pre_vertex = self._projection_edge.pre_vertex
@@ -243,7 +258,9 @@ class PyNNProjectionCommon(object):
             connection_holder = ConnectionHolder(
                 data_to_get, as_list, pre_vertex.n_atoms, post_vertex.n_atoms,
                 self._virtual_connection_list, fixed_values=fixed_values,
-                notify=notify)
+                notify=notify, sparse_format=sparse_format,
+                sum_multapses=sum_multapses,
+                memmap_directory=memmap_directory)
             connection_holder.finish()
             return connection_holder
 
@@ -251,7 +268,9 @@ class PyNNProjectionCommon(object):
         # possible later date
         connection_holder = ConnectionHolder(
             data_to_get, as_list, pre_vertex.n_atoms, post_vertex.n_atoms,
-            fixed_values=fixed_values, notify=notify)
+            fixed_values=fixed_values, notify=notify,
+            sparse_format=sparse_format, sum_multapses=sum_multapses,
+            memmap_directory=memmap_directory)
 
         # If we haven't run, add the holder to get connections, and return it
         # and set up a callback for after run to fill in this connection holder
@@ -287,37 +306,88 @@ class PyNNProjectionCommon(object):
             receivers = None
             extra_monitor_placements = None
 
-        edges = ctl.graph_mapper.get_machine_edges(self._projection_edge)
-        progress = ProgressBar(
-            edges, "Getting {}s for projection between {} and {}".format(
-                data_to_get, pre_vertex.label, post_vertex.label))
-        for edge in progress.over(edges):
+        # Group the edges by the Ethernet chip of the post-vertex, as the
+        # reads of each group are independent of those of the others
+        edge_groups = OrderedDict()
+        for edge in ctl.graph_mapper.get_machine_edges(self._projection_edge):
             placement = ctl.placements.get_placement_of_vertex(
                 edge.post_vertex)
+            chip = ctl.machine.get_chip_at(placement.x, placement.y)
+            edge_groups.setdefault(
+                (chip.nearest_ethernet_x, chip.nearest_ethernet_y),
+                list()).append((edge, placement))
+
+        def get_group_connections(ethernet_and_edges):
+            (ethernet_x, ethernet_y), edges = ethernet_and_edges
 
             # if using extra monitor data extractor find local receiver
+            receiver = None
             if extra_monitors is not None:
-                receiver = helpful_functions.locate_extra_monitor_mc_receiver(
-                    placement_x=placement.x, placement_y=placement.y,
-                    machine=ctl.machine,
-                    extra_monitor_cores_to_ethernet_connection_map=receivers)
-                sender_extra_monitor_core = extra_monitor_placements[
-                    placement.x, placement.y]
-                sender_monitor_place = ctl.placements.get_placement_of_vertex(
-                    sender_extra_monitor_core)
-            else:
-                receiver = None
+                receiver = receivers[ethernet_x, ethernet_y]
+            connections = list()
+            for edge, placement in edges:
                 sender_monitor_place = None
+                if extra_monitors is not None:
+                    sender_extra_monitor_core = extra_monitor_placements[
+                        placement.x, placement.y]
+                    sender_monitor_place = \
+                        ctl.placements.get_placement_of_vertex(
+                            sender_extra_monitor_core)
+                edge_connections = post_vertex.get_connections_from_machine(
+                    ctl.transceiver, placement, edge, ctl.graph_mapper,
+                    ctl.routing_infos, self._synapse_information,
+                    ctl.machine_time_step, extra_monitors is not None,
+                    ctl.placements, receiver, sender_monitor_place,
+                    extra_monitors, False, ctl.fixed_routes)
+                if edge_connections is not None:
+                    connections.append((
+                        edge_connections,
+                        ctl.graph_mapper.get_slice(edge.post_vertex)))
+            return edges, connections
+
+        # Set up the router timeouts once for all the reads, rather than in
+        # each thread for each block
+        timeout_receivers = list()
+        if extra_monitors is not None and handle_time_out_configuration:
+            timeout_receivers = ctl._locate_receivers_from_projections(
+                [self], receivers, extra_monitor_placements)
+        for data_receiver, extra_monitor_cores in timeout_receivers:
+            data_receiver.set_cores_for_data_extraction(
+                ctl.transceiver, list(extra_monitor_cores), ctl.placements)
 
-            connections = post_vertex.get_connections_from_machine(
-                ctl.transceiver, placement, edge, ctl.graph_mapper,
-                ctl.routing_infos, self._synapse_information,
-                ctl.machine_time_step, extra_monitors is not None,
-                ctl.placements, receiver, sender_monitor_place,
-                extra_monitors, handle_time_out_configuration,
-                ctl.fixed_routes)
-            if connections is not None:
-                connection_holder.add_connections(connections)
+        progress = ProgressBar(
+            sum(len(edges) for edges in itervalues(edge_groups)),
+            "Getting {}s for projection between {} and {}".format(
+                data_to_get, pre_vertex.label, post_vertex.label))
+        n_threads = min(len(edge_groups), ctl.config.getint(
+            "Simulation", "n_readback_threads"))
+        try:
+            if n_threads > 1:
+                pool = ThreadPool(n_threads)
+                try:
+                    for edges, connections in pool.imap(
+                            get_group_connections, iteritems(edge_groups)):
+                        for edge_connections, post_slice in connections:
+                            connection_holder.add_connections(
+                                edge_connections, post_slice)
+                        progress.update(len(edges))
+                finally:
+                    pool.close()
+                    pool.join()
+            else:
+                for edges, connections in map(
+                        get_group_connections, iteritems(edge_groups)):
+                    for edge_connections, post_slice in connections:
+                        connection_holder.add_connections(
+                            edge_connections, post_slice)
+                    progress.update(len(edges))
+        finally:
+            # reset the router timeouts
+            for data_receiver, extra_monitor_cores in timeout_receivers:
+                data_receiver.unset_cores_for_data_extraction(
+                    ctl.transceiver, list(extra_monitor_cores),
+                    ctl.placements)
+        progress.end()
         connection_holder.finish()
 
     def _clear_cache(self):
@@ -1,3 +1,4 @@
+from pacman.model.graphs.common import Slice
 from spinn_utilities import logger_utils
 from spinn_utilities.log import FormatAdapter
 from spinn_utilities.timer import Timer
@@ -6,8 +7,12 @@ from spinn_front_end_common.utilities.globals_variables import get_simulator
 
 from spynnaker.pyNN.models.common import AbstractSpikeRecordable
 from spynnaker.pyNN.models.common import AbstractNeuronRecordable
+from spynnaker.pyNN.models.common import AbstractWindowedRecordable
+from spynnaker.pyNN.models.common import recording_export
+from spynnaker.pyNN.models.common import recording_statistics
 
 from collections import defaultdict
+import math
 import numpy
 import logging
 from six.moves import xrange
@@ -130,12 +135,19 @@ class RecordingCommon(object):
         (data, ids, sampling_interval) = self._get_recorded_matrix(variable)
         return self.pynn7_format(data, ids, sampling_interval)
 
-    def _get_recorded_matrix(self, variable):
+    def _get_recorded_matrix(
+            self, variable, neuron_range=None, time_range=None):
         """ Perform safety checks and get the recorded data from the vertex\
             in matrix format.
 
         :param variable: the variable name to read. supported variable names
             are :'gsyn_exc', 'gsyn_inh', 'v'
+        :param neuron_range:\
+            The (start, stop) IDs of the neurons to read, with stop\
+            excluded, or None to read all the neurons
+        :param time_range:\
+            The (start, stop) times in milliseconds to read, with stop\
+            excluded, or None to read the whole run
         :return: the data
         """
         timer = Timer()
@@ -177,18 +189,37 @@ class RecordingCommon(object):
         else:
             # assuming we got here, everything is ok, so we should go get the
             # data
-            results = self._population._vertex.get_data(
-                variable, sim.no_machine_time_steps, sim.placements,
-                sim.graph_mapper, sim.buffer_manager, sim.machine_time_step)
+            vertex = self._population._vertex
+            if isinstance(vertex, AbstractWindowedRecordable):
+                results = vertex.get_data_in_window(
+                    variable, sim.no_machine_time_steps, sim.placements,
+                    sim.graph_mapper, sim.buffer_manager,
+                    sim.machine_time_step, neuron_range=neuron_range,
+                    time_range=time_range)
+            elif neuron_range is not None or time_range is not None:
+                raise ConfigurationException(
+                    "This population cannot read {} of a range of neurons"
+                    " or times".format(variable))
+            else:
+                results = vertex.get_data(
+                    variable, sim.no_machine_time_steps, sim.placements,
+                    sim.graph_mapper, sim.buffer_manager,
+                    sim.machine_time_step)
             (data, indexes, sampling_interval) = results
 
         get_simulator().add_extraction_timing(
             timer.take_sample())
         return (data, indexes, sampling_interval)
 
-    def _get_spikes(self):
+    def _get_spikes(self, neuron_range=None, time_range=None):
         """ How to get spikes from a vertex.
 
+        :param neuron_range:\
+            The (start, stop) IDs of the neurons to get the spikes of, with\
+            stop excluded, or None to get the spikes of all the neurons
+        :param time_range:\
+            The (start, stop) times in milliseconds to get the spikes in,\
+            with stop excluded, or None to get the spikes of the whole run
         :return: the spikes from a vertex
         """
 
@@ -214,10 +245,248 @@ class RecordingCommon(object):
             return numpy.zeros((0, 2))
 
         # assuming we got here, everything is OK, so we should go get the
-        # spikes
-        return self._population._vertex.get_spikes(
+        # spikes, only reading those in range if the vertex can do so
+        vertex = self._population._vertex
+        if isinstance(vertex, AbstractWindowedRecordable):
+            return vertex.get_spikes_in_window(
+                sim.placements, sim.graph_mapper, sim.buffer_manager,
+                sim.machine_time_step, neuron_range=neuron_range,
+                time_range=time_range)
+        spikes = vertex.get_spikes(
             sim.placements, sim.graph_mapper, sim.buffer_manager,
             sim.machine_time_step)
+        if neuron_range is not None:
+            spikes = spikes[(spikes[:, 0] >= neuron_range[0]) &
+                            (spikes[:, 0] < neuron_range[1])]
+        if time_range is not None:
+            spikes = spikes[(spikes[:, 1] >= time_range[0]) &
+                            (spikes[:, 1] < time_range[1])]
+        return spikes
+
+    def _export_recorded_data(
+            self, variable, filename, neuron_range=None, time_range=None):
+        """ Write the recorded data of a variable, or the spikes, straight to\
+            memory-mappable files, a core at a time where the vertex can do\
+            so, without building the whole recording in memory
+
+        :param variable: the variable name to write, or "spikes"
+        :param filename: the base name of the files to write; see\
+            :py:mod:`spynnaker.pyNN.models.common.recording_export`
+        :param neuron_range:\
+            The (start, stop) IDs of the neurons to write, with stop\
+            excluded, or None to write all the neurons
+        :param time_range:\
+            The (start, stop) times in milliseconds to write, with stop\
+            excluded, or None to write the whole run
+        """
+        sim = get_simulator()
+        vertex = self._population._vertex
+        if self._reduces_while_reading(variable):
+            timer = Timer()
+            timer.start_timing()
+            vertex.export_data(
+                variable, filename, sim.no_machine_time_steps,
+                sim.placements, sim.graph_mapper, sim.buffer_manager,
+                sim.machine_time_step, neuron_range=neuron_range,
+                time_range=time_range)
+            sim.add_extraction_timing(timer.take_sample())
+            return
+
+        # Otherwise the vertex can only read the whole recording, so write
+        # it from memory; the checks of the state, such as that the variable
+        # is being recorded, are done when reading
+        whole_population = Slice(0, vertex.n_atoms - 1)
+        if variable == "spikes":
+            spikes = self._get_spikes(neuron_range, time_range)
+            recording_export.write_spikes(
+                filename, [(whole_population, spikes[:, 0], spikes[:, 1])])
+            return
+        data, indexes, sampling_interval = self._get_recorded_matrix(
+            variable, neuron_range, time_range)
+        data = numpy.asarray(data)
+        matrix = recording_export.create_matrix_file(filename, data.shape)
+        matrix[:] = data
+        matrix.flush()
+
+        recording_export.write_matrix_index(
+            filename, variable, indexes, sampling_interval,
+            self._get_first_sample_time(time_range, sampling_interval),
+            [(whole_population, 0, len(indexes))])
+
+    @staticmethod
+    def _get_first_sample_time(time_range, sampling_interval):
+        """ Get the time of the first sample taken in a time range, which is\
+            that of the first row of the data read for the range
+
+        :param time_range:\
+            The (start, stop) times in milliseconds, with stop excluded, or\
+            None for the whole run
+        :param sampling_interval: the time between samples in milliseconds
+        """
+        if time_range is None:
+            return 0.0
+
+        # Allow for rounding of times that are multiples of the interval
+        return max(0, math.ceil(
+            (float(time_range[0]) / sampling_interval) - 1e-9)) * \
+            sampling_interval
+
+    def _reduces_while_reading(self, variable):
+        """ Determine if the recording of a variable can be reduced a core at\
+            a time as it is read, rather than once it has all been read
+        """
+        sim = get_simulator()
+        sim.verify_not_running()
+        vertex = self._population._vertex
+        return (isinstance(vertex, AbstractWindowedRecordable) and
+                vertex.is_recording(variable) and sim.has_ran and
+                not sim.use_virtual_board)
+
+    @staticmethod
+    def _get_time_range(time_range):
+        """ Get a time range, or the range of the whole run if None
+        """
+        if time_range is not None:
+            return time_range
+        sim = get_simulator()
+        return (0.0, sim.no_machine_time_steps * sim.machine_time_step /
+                1000.0)
+
+    def _get_spike_counts(self, neuron_range=None, time_range=None):
+        """ Count the spikes of each neuron, a core at a time where the\
+            vertex can do so, without building the list of all the spikes
+
+        :param neuron_range:\
+            The (start, stop) IDs of the neurons to count, with stop\
+            excluded, or None to count all the neurons
+        :param time_range:\
+            The (start, stop) times in milliseconds to count in, with stop\
+            excluded, or None to count in the whole run
+        :return: the number of spikes of each neuron of the population
+        """
+        vertex = self._population._vertex
+        if self._reduces_while_reading("spikes"):
+            sim = get_simulator()
+            timer = Timer()
+            timer.start_timing()
+            counts = vertex.get_spike_counts(
+                sim.placements, sim.graph_mapper, sim.buffer_manager,
+                sim.machine_time_step, neuron_range=neuron_range,
+                time_range=time_range)
+            sim.add_extraction_timing(timer.take_sample())
+            return counts
+
+        # Otherwise the vertex can only read all the spikes
+        spikes = self._get_spikes(neuron_range, time_range)
+        counts = numpy.zeros(vertex.n_atoms, dtype="int64")
+        recording_statistics.add_spike_counts(counts, spikes[:, 0], 0)
+        return counts
+
+    def _get_mean_spike_rates(self, neuron_range=None, time_range=None):
+        """ Get the mean rate of the spikes of each neuron
+
+        :param neuron_range:\
+            The (start, stop) IDs of the neurons, with stop excluded, or None\
+            for all the neurons
+        :param time_range:\
+            The (start, stop) times in milliseconds to get the rate over,\
+            with stop excluded, or None for the whole run
+        :return: the rate of each neuron of the population in spikes per\
+            second
+        """
+        start_time, end_time = self._get_time_range(time_range)
+        counts = self._get_spike_counts(neuron_range, time_range)
+        if end_time <= start_time:
+            return numpy.zeros(len(counts))
+        return counts * (1000.0 / (end_time - start_time))
+
+    def _get_spike_histogram(
+            self, bin_width, neuron_range=None, time_range=None):
+        """ Count the spikes of the neurons in each of a number of bins of\
+            time (the peri-stimulus time histogram of the population), a\
+            core at a time where the vertex can do so, without building the\
+            list of all the spikes
+
+        :param bin_width: the width of each bin in milliseconds
+        :param neuron_range:\
+            The (start, stop) IDs of the neurons to count, with stop\
+            excluded, or None to count all the neurons
+        :param time_range:\
+            The (start, stop) times in milliseconds of the bins, with stop\
+            excluded, or None for the whole run
+        :return: the number of spikes in each bin, and the start time of\
+            each bin in milliseconds
+        """
+        vertex = self._population._vertex
+        if self._reduces_while_reading("spikes"):
+            sim = get_simulator()
+            timer = Timer()
+            timer.start_timing()
+            histogram = vertex.get_spike_histogram(
+                bin_width, sim.no_machine_time_steps, sim.placements,
+                sim.graph_mapper, sim.buffer_manager, sim.machine_time_step,
+                neuron_range=neuron_range, time_range=time_range)
+            sim.add_extraction_timing(timer.take_sample())
+            return histogram
+
+        # Otherwise the vertex can only read all the spikes
+        spikes = self._get_spikes(neuron_range, time_range)
+        start_time, end_time = self._get_time_range(time_range)
+        histogram = numpy.zeros(
+            recording_statistics.get_n_bins(start_time, end_time, bin_width),
+            dtype="int64")
+        recording_statistics.add_spike_histogram(
+            histogram, spikes[:, 1], start_time, bin_width)
+        return (histogram,
+                start_time + numpy.arange(len(histogram)) * bin_width)
+
+    def _get_recorded_statistics(
+            self, variable, window=None, neuron_range=None, time_range=None):
+        """ Get the mean and variance of a recorded variable of each neuron\
+            in each of a number of windows of time, a core at a time where\
+            the vertex can do so, without building the matrix of all the data
+
+        :param variable: the variable name to get the statistics of
+        :param window: the length of each window in milliseconds, which is\
+            rounded to a whole number of samples, or None for one window of\
+            the whole time range
+        :param neuron_range:\
+            The (start, stop) IDs of the neurons, with stop excluded, or None\
+            for all the neurons
+        :param time_range:\
+            The (start, stop) times in milliseconds, with stop excluded, or\
+            None for the whole run
+        :return: the mean and variance of each window (rows) and neuron\
+            (columns), the neuron IDs of the columns, and the start time of\
+            each window in milliseconds
+        """
+        vertex = self._population._vertex
+        if self._reduces_while_reading(variable):
+            sim = get_simulator()
+            timer = Timer()
+            timer.start_timing()
+            statistics = vertex.get_data_statistics(
+                variable, window, sim.no_machine_time_steps, sim.placements,
+                sim.graph_mapper, sim.buffer_manager, sim.machine_time_step,
+                neuron_range=neuron_range, time_range=time_range)
+            sim.add_extraction_timing(timer.take_sample())
+            return statistics
+
+        # Otherwise the vertex can only read all the data
+        data, indexes, sampling_interval = self._get_recorded_matrix(
+            variable, neuron_range, time_range)
+        rows_per_window = None
+        if window is not None:
+            rows_per_window = max(1, int(round(window / sampling_interval)))
+        means, variances = recording_statistics.get_window_statistics(
+            data, rows_per_window)
+        if rows_per_window is None:
+            window = 0.0
+        else:
+            window = rows_per_window * sampling_interval
+        return (means, variances, indexes,
+                self._get_first_sample_time(time_range, sampling_interval) +
+                numpy.arange(len(means)) * window)
 
     def _turn_off_all_recording(self, indexes=None):
         """ Turns off recording, is used by a pop saying `.record()`
@@ -15,6 +15,7 @@ from spinn_front_end_common.utilities import globals_variables
 from spynnaker.pyNN.models.common import AbstractSpikeRecordable
 from spynnaker.pyNN.models.common import EIEIOSpikeRecorder
 from spynnaker.pyNN.models.common import SimplePopulationSettable
+from spynnaker.pyNN.models.common import recording_utils
 from spynnaker.pyNN.utilities import constants
 
 logger = logging.getLogger(__name__)
@@ -155,7 +156,8 @@ class SpikeSourceArrayVertex(
                 vertex.virtual_key
                 if vertex.virtual_key is not None
                 else 0,
-            machine_time_step)
+            machine_time_step,
+            n_threads=recording_utils.get_n_decode_threads())
 
     @overrides(AbstractSpikeRecordable.clear_spike_recording)
     def clear_spike_recording(self, buffer_manager, placements, graph_mapper):
@@ -1,4 +1,5 @@
 import scipy.stats
+import hashlib
 import logging
 import math
 import random
@@ -35,10 +36,12 @@ from spinn_front_end_common.utilities.exceptions import ConfigurationException
 
 from spynnaker.pyNN.models.common import AbstractSpikeRecordable
 from spynnaker.pyNN.models.common import MultiSpikeRecorder
+from spynnaker.pyNN.models.common import recording_utils
+from spynnaker.pyNN.models.common.recording_usage import RecordingUsage
 from spynnaker.pyNN.utilities import constants
 from spynnaker.pyNN.utilities import utility_calls
 from spynnaker.pyNN.models.abstract_models\
-    import AbstractReadParametersBeforeSet
+    import AbstractReadParametersBeforeSet, AbstractMeasuresRecordingUsage
 from spynnaker.pyNN.models.common.simple_population_settable \
     import SimplePopulationSettable
 from spynnaker.pyNN.models.neuron.implementations import Struct
@@ -80,7 +83,7 @@ class SpikeSourcePoissonVertex(
         AbstractProvidesOutgoingPartitionConstraints,
         AbstractChangableAfterRun, AbstractReadParametersBeforeSet,
         AbstractRewritesDataSpecification, SimplePopulationSettable,
-        ProvidesKeyToAtomMappingImpl):
+        ProvidesKeyToAtomMappingImpl, AbstractMeasuresRecordingUsage):
     """ A Poisson Spike source object
     """
 
@@ -145,6 +148,16 @@ class SpikeSourcePoissonVertex(
                 "Buffers", "buffer_size_before_receive")
         self._maximum_sdram_for_buffering = [spike_buffer_max_size]
 
+        # The space measured to be used by the recording in earlier runs, from
+        # which it is sized if kept, or None to size it from an estimate.
+        # Without buffered recording, spikes that do not fit in the space
+        # reserved are lost without warning, so the estimate is always used.
+        self._recording_usage = None
+        if config.getboolean("Buffers", "enable_buffered_recording"):
+            self._recording_usage = RecordingUsage.from_config(config)
+        self._recording_usage_margin = config.getfloat(
+            "Recording", "recording_usage_margin")
+
     @property
     @overrides(AbstractChangableAfterRun.requires_mapping)
     def requires_mapping(self):
@@ -161,6 +174,27 @@ class SpikeSourcePoissonVertex(
 
     def _max_spikes_per_ts(
             self, vertex_slice, n_machine_time_steps, machine_time_step):
+        max_spikes_per_ts = self._estimate_max_spikes_per_ts(
+            vertex_slice, n_machine_time_steps, machine_time_step)
+        if self._recording_usage is None:
+            return max_spikes_per_ts
+        measured = self._recording_usage.get_bytes_per_timestep(
+            self.get_recording_usage_key(
+                vertex_slice, n_machine_time_steps, machine_time_step),
+            self.SPIKE_RECORDING_REGION_ID)
+        if measured is None:
+            return max_spikes_per_ts
+
+        # Each timestep records a word of header, and a block of a bit per
+        # neuron for each time that any neuron spikes in the timestep
+        block_bytes = int(math.ceil(vertex_slice.n_atoms / 32.0)) * 4
+        size = RecordingUsage.get_size(
+            (max_spikes_per_ts * block_bytes) + 4, measured,
+            self._recording_usage_margin)
+        return int(math.ceil(max(size - 4, 0) / float(block_bytes)))
+
+    def _estimate_max_spikes_per_ts(
+            self, vertex_slice, n_machine_time_steps, machine_time_step):
         max_rate = numpy.amax(self._rate[vertex_slice.as_slice])
         if max_rate == 0:
             return 0
@@ -206,6 +240,31 @@ class SpikeSourcePoissonVertex(
     def n_atoms(self):
         return self._n_atoms
 
+    @overrides(AbstractMeasuresRecordingUsage.get_recording_sdram_per_timestep)
+    def get_recording_sdram_per_timestep(
+            self, vertex_slice, n_machine_time_steps, machine_time_step):
+        return [self._spike_recorder.get_sdram_usage_in_bytes(
+            vertex_slice.n_atoms, self._max_spikes_per_ts(
+                vertex_slice, n_machine_time_steps, machine_time_step), 1)]
+
+    @overrides(AbstractMeasuresRecordingUsage.get_recording_usage_key)
+    def get_recording_usage_key(
+            self, vertex_slice, n_machine_time_steps, machine_time_step):
+        # The spikes recorded per timestep depend on the rates, starts and
+        # durations, and on how much of the run the sources are active for
+        digest = hashlib.sha1()
+        for item in [
+                self.label, vertex_slice.lo_atom, vertex_slice.hi_atom,
+                n_machine_time_steps, machine_time_step,
+                self._rate[vertex_slice.as_slice],
+                self._start[vertex_slice.as_slice],
+                self._duration[vertex_slice.as_slice]]:
+            if isinstance(item, numpy.ndarray):
+                item = item.tolist()
+            digest.update(repr(item).encode())
+            digest.update(b"\0")
+        return digest.hexdigest()
+
     @inject_items({
         "n_machine_time_steps": "TotalMachineTimeSteps",
         "machine_time_step": "MachineTimeStep"
@@ -703,7 +762,8 @@ class SpikeSourcePoissonVertex(
         return self._spike_recorder.get_spikes(
             self.label, buffer_manager,
             SpikeSourcePoissonVertex.SPIKE_RECORDING_REGION_ID,
-            placements, graph_mapper, self, machine_time_step)
+            placements, graph_mapper, self, machine_time_step,
+            n_threads=recording_utils.get_n_decode_threads())
 
     @overrides(AbstractProvidesOutgoingPartitionConstraints.
                get_outgoing_partition_constraints)
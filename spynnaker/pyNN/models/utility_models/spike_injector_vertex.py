@@ -12,6 +12,7 @@ from spinn_front_end_common.utilities.globals_variables import get_simulator
 from spynnaker.pyNN.models.common \
     import AbstractSpikeRecordable, EIEIOSpikeRecorder, \
     SimplePopulationSettable
+from spynnaker.pyNN.models.common import recording_utils
 
 logger = logging.getLogger(__name__)
 
@@ -123,7 +124,8 @@ class SpikeInjectorVertex(
                 vertex.virtual_key
                 if vertex.virtual_key is not None
                 else 0,
-            machine_time_step)
+            machine_time_step,
+            n_threads=recording_utils.get_n_decode_threads())
 
     @overrides(AbstractSpikeRecordable.clear_spike_recording)
     def clear_spike_recording(self, buffer_manager, placements, graph_mapper):
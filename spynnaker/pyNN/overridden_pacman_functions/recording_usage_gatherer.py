@@ -0,0 +1,108 @@
+import logging
+
+from spinn_utilities.progress_bar import ProgressBar
+from spinn_front_end_common.interface.buffer_management.buffer_models \
+    import AbstractReceiveBuffersToHost
+from spinn_front_end_common.utilities import globals_variables
+from spinn_front_end_common.utilities.utility_objs import ProvenanceDataItem
+
+from spynnaker.pyNN.models.abstract_models \
+    import AbstractMeasuresRecordingUsage
+from spynnaker.pyNN.models.common.recording_usage import RecordingUsage
+
+logger = logging.getLogger(__name__)
+
+# The fraction of the space reserved for a recording region above which the
+# use of the space is reported
+_REPORT_FRACTION = 0.9
+
+
+class RecordingUsageGatherer(object):
+    """ Measures the space used per timestep by each recording region after\
+        a run, reports how close it came to the space reserved for it, and\
+        keeps the measurements so that later runs can be sized from them
+    """
+
+    def __call__(
+            self, placements, graph_mapper, buffer_manager,
+            n_machine_time_steps, machine_time_step, has_ran,
+            provenance_data_objects=None):
+        """
+        :param placements: the placements of the vertices
+        :param graph_mapper: the mapping between application and machine\
+            vertices
+        :param buffer_manager: the manager of the recorded data
+        :param n_machine_time_steps: the number of timesteps run so far
+        :param machine_time_step: the machine time step in microseconds
+        :param has_ran: token that states that the simulation has ran
+        :param provenance_data_objects: provenance items to add to
+        :return: the provenance items, with the use of each region added
+        """
+        # pylint: disable=too-many-arguments
+        if provenance_data_objects is not None:
+            prov_items = provenance_data_objects
+        else:
+            prov_items = list()
+        if not has_ran or not n_machine_time_steps:
+            return prov_items
+
+        usage = RecordingUsage.from_config(
+            globals_variables.get_simulator().config)
+        progress = ProgressBar(
+            placements.n_placements, "Measuring recording usage")
+        for placement in progress.over(placements.placements):
+            vertex = placement.vertex
+            if not isinstance(vertex, AbstractReceiveBuffersToHost):
+                continue
+            application_vertex = graph_mapper.get_application_vertex(vertex)
+            if not isinstance(
+                    application_vertex, AbstractMeasuresRecordingUsage):
+                continue
+            prov_items.extend(self._measure_vertex(
+                placement, graph_mapper.get_slice(vertex),
+                application_vertex, buffer_manager, n_machine_time_steps,
+                machine_time_step, usage))
+
+        if usage is not None:
+            usage.save()
+        return prov_items
+
+    @staticmethod
+    def _measure_vertex(
+            placement, vertex_slice, application_vertex, buffer_manager,
+            n_machine_time_steps, machine_time_step, usage):
+        # pylint: disable=too-many-arguments
+        reserved = application_vertex.get_recording_sdram_per_timestep(
+            vertex_slice, n_machine_time_steps, machine_time_step)
+        key = None
+        if usage is not None:
+            key = application_vertex.get_recording_usage_key(
+                vertex_slice, n_machine_time_steps, machine_time_step)
+        names = ["{}_{}_{}_{}".format(
+            placement.x, placement.y, placement.p, placement.vertex.label)]
+        items = list()
+        for region in placement.vertex.get_recorded_region_ids():
+            data, _ = buffer_manager.get_data_for_vertex(placement, region)
+            used = len(data.read_all()) / float(n_machine_time_steps)
+            if key is not None:
+                usage.add_measurement(key, region, used)
+            fraction = 0.0
+            if reserved[region]:
+                fraction = used / float(reserved[region])
+            region_names = names + ["Recording_region_{}".format(region)]
+            items.append(ProvenanceDataItem(
+                region_names + ["Bytes_used_per_timestep"], used))
+            items.append(ProvenanceDataItem(
+                region_names + ["Bytes_reserved_per_timestep"],
+                reserved[region]))
+            items.append(ProvenanceDataItem(
+                region_names + ["Fraction_of_reservation_used"], fraction,
+                report=fraction > _REPORT_FRACTION,
+                message=(
+                    "Recording region {} of {} on {}, {}, {} used {:.0%} of"
+                    " the space reserved for it; the space may be"
+                    " underestimated, and data may be lost or extracted"
+                    " during the run".format(
+                        region, placement.vertex.label, placement.x,
+                        placement.y, placement.p, fraction))))
+        return items
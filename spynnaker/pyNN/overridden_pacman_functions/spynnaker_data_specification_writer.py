@@ -1,8 +1,129 @@
+import logging
+import multiprocessing
+import os
+
 from spinn_front_end_common.interface.interface_functions import \
     GraphDataSpecificationWriter
 
+from spynnaker.pyNN.models.neuron import AbstractPopulationVertex
 from spynnaker.pyNN.models.utility_models import DelayExtensionVertex
 
+logger = logging.getLogger(__name__)
+
+# The number of placements per process to generate ahead of the
+# specification
+_PLACEMENTS_AHEAD_PER_PROCESS = 2
+
+# The (placement, application vertex) of the placements whose blocks are to be
+# generated by the worker processes; this is set before the workers are
+# forked so that they inherit it rather than it being pickled
+_placements_to_generate = list()
+
+
+def _generate_blocks(index):
+    placement, app_vertex = _placements_to_generate[index]
+    return [
+        generate(*arguments) for _, generate, arguments in
+        app_vertex.get_pregenerable_synaptic_blocks(placement)]
+
+
+class _SynapticBlockPregenerator(object):
+    """ Generates the synaptic blocks of each placement in a pool of worker\
+        processes, a few placements ahead of the data specification that\
+        will write them.  The blocks of a placement are only listed, and\
+        generated, when the placement is submitted to the pool.
+    """
+
+    __slots__ = [
+        # The pool of worker processes
+        "_pool",
+
+        # The index of the next placement to be submitted to the pool
+        "_next_placement",
+
+        # The index of each placement by machine vertex
+        "_placement_index",
+
+        # Dict of placement index to the keys of its blocks and the pending
+        # result of generating them
+        "_pending",
+
+        # Dict of placement index to a dict of key to block, of the blocks
+        # generated but not yet requested
+        "_blocks",
+
+        # The maximum number of pending results
+        "_max_pending"]
+
+    def __init__(self, placements, n_processes):
+        """
+        :param placements: list of (placement, application vertex), in the\
+            order in which the blocks will be requested
+        :param n_processes: the number of worker processes to use
+        """
+        # pylint: disable=global-statement
+        global _placements_to_generate
+        _placements_to_generate = placements
+        self._pool = multiprocessing.Pool(n_processes)
+        self._next_placement = 0
+        self._placement_index = {
+            placement.vertex: index
+            for index, (placement, _) in enumerate(placements)}
+        self._pending = dict()
+        self._blocks = dict()
+        self._max_pending = n_processes * _PLACEMENTS_AHEAD_PER_PROCESS
+        self._submit()
+
+    def _submit(self):
+        while (self._next_placement < len(_placements_to_generate) and
+                len(self._pending) < self._max_pending):
+            placement, app_vertex = _placements_to_generate[
+                self._next_placement]
+            keys = [key for key, _, _ in
+                    app_vertex.get_pregenerable_synaptic_blocks(placement)]
+            if keys:
+                self._pending[self._next_placement] = (
+                    keys, self._pool.apply_async(
+                        _generate_blocks, (self._next_placement,)))
+            self._next_placement += 1
+
+    def get_block(self, key):
+        """ Get a block that has been generated in advance
+
+        :param key: the (machine edge, synapse information) of the block
+        :return: the result of get_synapses for the block, or None if the\
+            block is not being generated in advance
+        """
+        machine_edge, _ = key
+        index = self._placement_index.get(machine_edge.post_vertex)
+        if index is None:
+            return None
+
+        # The blocks of the placements before are no longer needed
+        for earlier in [i for i in self._blocks if i < index]:
+            del self._blocks[earlier]
+        for earlier in [i for i in self._pending if i < index]:
+            del self._pending[earlier]
+
+        if index in self._pending:
+            keys, result = self._pending.pop(index)
+            self._blocks[index] = dict(zip(keys, result.get()))
+        elif index >= self._next_placement:
+            # If requested before being submitted, skip ahead past it so
+            # that it is generated only once, by the caller
+            self._next_placement = index + 1
+        self._submit()
+        blocks = self._blocks.get(index)
+        if blocks is None:
+            return None
+        return blocks.pop(key, None)
+
+    def close(self):
+        global _placements_to_generate  # pylint: disable=global-statement
+        self._pool.terminate()
+        self._pool.join()
+        _placements_to_generate = list()
+
 
 class SpynnakerDataSpecificationWriter(
         GraphDataSpecificationWriter):
@@ -14,7 +135,14 @@ class SpynnakerDataSpecificationWriter(
     def __call__(
             self, placements, graph, hostname,
             report_default_directory, write_text_specs,
-            app_data_runtime_folder, machine, graph_mapper=None):
+            app_data_runtime_folder, machine, graph_mapper=None,
+            n_processes=None):
+        """
+        :param n_processes: \
+            the number of processes to use to generate synaptic blocks in\
+            parallel with the specification; if None or 1, the synaptic\
+            blocks are generated as each specification is written
+        """
         # pylint: disable=too-many-arguments
 
         delay_extensions = list()
@@ -29,6 +157,50 @@ class SpynnakerDataSpecificationWriter(
                 placement_order.append(placement)
         placement_order.extend(delay_extensions)
 
-        return super(SpynnakerDataSpecificationWriter, self).__call__(
-            placements, hostname, report_default_directory, write_text_specs,
-            app_data_runtime_folder, machine, graph_mapper, placement_order)
+        pregenerator = None
+        if n_processes is not None and n_processes > 1:
+            pregenerator = self._start_pregeneration(
+                placement_order, graph_mapper, n_processes)
+        try:
+            return super(SpynnakerDataSpecificationWriter, self).__call__(
+                placements, hostname, report_default_directory,
+                write_text_specs, app_data_runtime_folder, machine,
+                graph_mapper, placement_order)
+        finally:
+            if pregenerator is not None:
+                self._stop_pregeneration(placement_order, graph_mapper)
+                pregenerator.close()
+
+    @staticmethod
+    def _population_vertices(placement_order, graph_mapper):
+        vertices = list()
+        for placement in placement_order:
+            app_vertex = graph_mapper.get_application_vertex(placement.vertex)
+            if isinstance(app_vertex, AbstractPopulationVertex):
+                vertices.append((placement, app_vertex))
+        return vertices
+
+    def _start_pregeneration(self, placement_order, graph_mapper, n_processes):
+        """ Start generating the synaptic blocks of the neuron placements in\
+            worker processes.  Delay extensions are written after all the\
+            neuron vertices, as before, and the blocks are written in the\
+            same order, so the specifications are identical to those\
+            generated serially.
+        """
+        if not hasattr(os, "fork"):
+            logger.warning(
+                "Parallel synaptic block generation needs processes to be"
+                " forked; generating blocks serially")
+            return None
+        vertices = self._population_vertices(placement_order, graph_mapper)
+        if not vertices:
+            return None
+        pregenerator = _SynapticBlockPregenerator(vertices, n_processes)
+        for _, app_vertex in vertices:
+            app_vertex.set_pregenerated_synaptic_blocks(pregenerator)
+        return pregenerator
+
+    def _stop_pregeneration(self, placement_order, graph_mapper):
+        for _, app_vertex in self._population_vertices(
+                placement_order, graph_mapper):
+            app_vertex.set_pregenerated_synaptic_blocks(None)
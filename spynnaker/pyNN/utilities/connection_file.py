@@ -0,0 +1,209 @@
+""" Reading and writing of binary connection files.
+
+A binary connection file holds the connections of a FromFileConnector in a\
+form that can be memory-mapped, so that the connections do not have to be\
+held in memory.  The file is a header followed by a record for each\
+connection, sorted by target and then by source.
+"""
+import itertools
+import os
+import numpy
+
+from spinn_front_end_common.utilities.exceptions import ConfigurationException
+
+#: The identifier at the start of a binary connection file
+MAGIC = b"SPYNCONN"
+
+#: The version of the binary connection file format
+VERSION = 1
+
+#: The header of a binary connection file
+HEADER_DTYPE = numpy.dtype([
+    ("magic", "S8"), ("version", "<u4"), ("flags", "<u4"),
+    ("n_connections", "<u8"), ("n_sources", "<u8")])
+
+#: The record of each connection in a binary connection file
+CONNECTION_DTYPE = numpy.dtype([
+    ("source", "<u4"), ("target", "<u4"),
+    ("weight", "<f8"), ("delay", "<f8")])
+
+# The number of connections to process at a time when converting files
+_CHUNK_SIZE = 1 << 20
+
+
+def is_binary_connection_file(filename):
+    """ Determine if a file is a binary connection file
+
+    :param filename: The name of the file to check
+    :rtype: bool
+    """
+    if not os.path.isfile(filename):
+        return False
+    with open(filename, "rb") as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+def read_binary_connection_file(filename):
+    """ Memory-map the connections of a binary connection file
+
+    :param filename: The name of the file to read
+    :return: The connections, sorted by target and then by source, and the\
+        number of sources (one more than the largest source index)
+    :rtype: (numpy.memmap, int)
+    """
+    header = numpy.fromfile(filename, dtype=HEADER_DTYPE, count=1)
+    if len(header) != 1 or header["magic"][0] != MAGIC:
+        raise ConfigurationException(
+            "{} is not a binary connection file".format(filename))
+    if header["version"][0] != VERSION:
+        raise ConfigurationException(
+            "{} has version {} of the binary connection format; only version"
+            " {} is supported".format(
+                filename, header["version"][0], VERSION))
+    n_connections = int(header["n_connections"][0])
+    n_sources = int(header["n_sources"][0])
+    if n_connections == 0:
+        return numpy.zeros(0, dtype=CONNECTION_DTYPE), n_sources
+    connections = numpy.memmap(
+        filename, dtype=CONNECTION_DTYPE, mode="r",
+        offset=HEADER_DTYPE.itemsize, shape=(n_connections,))
+    return connections, n_sources
+
+
+def _create_binary_connection_file(filename, n_connections, n_sources):
+    header = numpy.zeros(1, dtype=HEADER_DTYPE)
+    header["magic"] = MAGIC
+    header["version"] = VERSION
+    header["n_connections"] = n_connections
+    header["n_sources"] = n_sources
+    with open(filename, "wb") as f:
+        header.tofile(f)
+        f.truncate(HEADER_DTYPE.itemsize +
+                   (n_connections * CONNECTION_DTYPE.itemsize))
+    if n_connections == 0:
+        return None
+    return numpy.memmap(
+        filename, dtype=CONNECTION_DTYPE, mode="r+",
+        offset=HEADER_DTYPE.itemsize, shape=(n_connections,))
+
+
+def write_binary_connection_file(filename, conn_list):
+    """ Write connections held in memory to a binary connection file
+
+    :param filename: The name of the file to write
+    :param conn_list: The connections, as an array with fields source,\
+        target, weight and delay, or with a column for each of these
+    """
+    conn_list = numpy.asarray(conn_list)
+    connections = numpy.zeros(len(conn_list), dtype=CONNECTION_DTYPE)
+    if conn_list.dtype.names is not None:
+        for name in CONNECTION_DTYPE.names:
+            connections[name] = conn_list[name]
+    elif len(conn_list):
+        for i, name in enumerate(CONNECTION_DTYPE.names):
+            connections[name] = conn_list[:, i]
+    order = numpy.lexsort((connections["source"], connections["target"]))
+    n_sources = 0
+    if len(connections):
+        n_sources = int(numpy.max(connections["source"])) + 1
+    output = _create_binary_connection_file(
+        filename, len(connections), n_sources)
+    if output is not None:
+        output[:] = connections[order]
+        output.flush()
+        del output
+
+
+def _read_text_chunks(text_file):
+    """ Read the connections from a text file in chunks of connections
+    """
+    lines = (line for line in text_file
+             if line.strip() and not line.lstrip().startswith("#"))
+    while True:
+        chunk_lines = list(itertools.islice(lines, _CHUNK_SIZE))
+        if not chunk_lines:
+            return
+        values = numpy.loadtxt(chunk_lines, ndmin=2)
+        if values.shape[1] != 4:
+            raise ConfigurationException(
+                "Each connection must have 4 values (pre_idx, post_idx,"
+                " weight, delay) but {} were found".format(values.shape[1]))
+        chunk = numpy.zeros(len(values), dtype=CONNECTION_DTYPE)
+        for i, name in enumerate(CONNECTION_DTYPE.names):
+            chunk[name] = values[:, i]
+        yield chunk
+
+
+def convert_text_connection_file(text_filename, binary_filename):
+    """ Convert a text connection file, as read by FromFileConnector, to a\
+        binary connection file.  The connections are sorted on disk, so the\
+        whole file is never held in memory.
+
+    Each line of the text file holds the pre_idx, post_idx, weight and delay\
+    of a connection; lines starting with # are ignored.
+
+    :param text_filename: The name of the text file to read
+    :param binary_filename: The name of the binary file to write
+    """
+    # pylint: disable=too-many-locals
+    # Copy the connections to a temporary file in the order found, counting
+    # the connections to each target
+    unsorted_filename = binary_filename + ".unsorted"
+    n_per_target = numpy.zeros(0, dtype="uint64")
+    n_connections = 0
+    n_sources = 0
+    with open(text_filename, "r") as text_file, \
+            open(unsorted_filename, "wb") as unsorted_file:
+        for chunk in _read_text_chunks(text_file):
+            counts = numpy.bincount(chunk["target"]).astype("uint64")
+            if len(counts) > len(n_per_target):
+                n_per_target = numpy.pad(
+                    n_per_target, (0, len(counts) - len(n_per_target)),
+                    mode="constant")
+            n_per_target[:len(counts)] += counts
+            n_sources = max(n_sources, int(numpy.max(chunk["source"])) + 1)
+            n_connections += len(chunk)
+            chunk.tofile(unsorted_file)
+
+    try:
+        output = _create_binary_connection_file(
+            binary_filename, n_connections, n_sources)
+        if output is None:
+            return
+
+        # Move each connection to the run of connections of its target
+        target_starts = numpy.cumsum(n_per_target) - n_per_target
+        next_free = target_starts.copy()
+        unsorted = numpy.memmap(
+            unsorted_filename, dtype=CONNECTION_DTYPE, mode="r",
+            shape=(n_connections,))
+        for start in range(0, n_connections, _CHUNK_SIZE):
+            chunk = numpy.array(unsorted[start:start + _CHUNK_SIZE])
+            chunk = chunk[numpy.argsort(chunk["target"], kind="mergesort")]
+            targets = chunk["target"]
+            counts = numpy.bincount(
+                targets, minlength=len(next_free)).astype("uint64")
+            ranks = (numpy.arange(len(chunk), dtype="uint64") -
+                     (numpy.cumsum(counts) - counts)[targets])
+            output[next_free[targets] + ranks] = chunk
+            next_free += counts
+        del unsorted
+
+        # Sort the runs of connections of each target by source, a group of
+        # targets at a time
+        target_ends = target_starts + n_per_target
+        group_start = 0
+        while group_start < n_connections:
+            last_target = numpy.searchsorted(
+                target_ends, group_start + _CHUNK_SIZE, side="right")
+            group_end = int(target_ends[max(
+                last_target - 1,
+                numpy.searchsorted(target_ends, group_start, side="right"))])
+            group = numpy.array(output[group_start:group_end])
+            output[group_start:group_end] = group[numpy.lexsort(
+                (group["source"], group["target"]))]
+            group_start = group_end
+        output.flush()
+        del output
+    finally:
+        os.remove(unsorted_filename)
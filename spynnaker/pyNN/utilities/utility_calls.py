@@ -1,6 +1,7 @@
 """
 utility class containing simple helper methods
 """
+import hashlib
 import numpy
 import os
 import logging
@@ -283,3 +284,22 @@ def get_n_bits(n_values):
     if n_values == 1:
         return 1
     return int(math.ceil(math.log(n_values, 2)))
+
+
+def get_digest(items):
+    """ Get a digest of a sequence of values, which is the same for equal\
+        values in any run
+
+    :param items: the values (numbers, strings or numpy arrays)
+    :return: the hexadecimal SHA1 digest of the values
+    :rtype: str
+    """
+    digest = hashlib.sha1()
+    for item in items:
+        if isinstance(item, numpy.ndarray):
+            digest.update(repr((item.dtype.descr, item.shape)).encode())
+            digest.update(numpy.ascontiguousarray(item).tobytes())
+        else:
+            digest.update(repr(item).encode())
+        digest.update(b"\0")
+    return digest.hexdigest()
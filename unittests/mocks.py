@@ -46,6 +46,12 @@ class MockSimulator(object):
                                   "enable_buffered_recording": "False"}
         self.config["MasterPopTable"] = {"generator": "BinarySearch"}
         self.config["Reports"] = {"n_profile_samples": 0}
+        self.config["Recording"] = {"n_decode_threads": "1",
+                                    "measure_recording_usage": "False",
+                                    "recording_usage_file": "None",
+                                    "recording_usage_margin": "0.25",
+                                    "sparse_spike_recording": "False",
+                                    "sparse_spike_recording_rate": "10"}
 
     def is_a_pynn_random(self, values):
         return isinstance(values, MockRNG)
@@ -2,6 +2,7 @@ import numpy
 import math
 import pytest
 
+from spinn_front_end_common.utilities.exceptions import ConfigurationException
 from spynnaker.pyNN.models.neuron.connection_holder import ConnectionHolder
 from spynnaker.pyNN.models.neuron.synapse_dynamics \
     import AbstractSynapseDynamics
@@ -147,3 +148,158 @@ def test_connection_holder_matrix_multiple_items():
         [(0, 0, 1, 10), (0, 0, 2, 20), (0, 1, 3, 30)],
         AbstractSynapseDynamics.NUMPY_CONNECTORS_DTYPE)
     connection_holder.add_connections(connections)
+
+
+@pytest.mark.parametrize("sparse_format", ["coo", "csr"])
+def test_connection_holder_sparse(sparse_format):
+    connections = numpy.array(
+        [(0, 0, 1, 10), (0, 0, 2, 20), (0, 1, 3, 30), (1, 2, 4, 40)],
+        AbstractSynapseDynamics.NUMPY_CONNECTORS_DTYPE)
+
+    # The last of the connections with the same source and target is kept
+    connection_holder = ConnectionHolder(
+        data_items_to_return=["weight", "delay"], as_list=False,
+        n_pre_atoms=2, n_post_atoms=3, sparse_format=sparse_format)
+    connection_holder.add_connections(connections)
+    weights, delays = connection_holder[0], connection_holder[1]
+    assert weights.format == sparse_format
+    assert weights.shape == (2, 3)
+    assert weights.nnz == 3
+    assert numpy.array_equal(
+        weights.toarray(), [[2, 3, 0], [0, 0, 4]])
+    assert numpy.array_equal(
+        delays.toarray(), [[20, 30, 0], [0, 0, 40]])
+
+    # The connections with the same source and target are summed
+    connection_holder = ConnectionHolder(
+        data_items_to_return=["weight"], as_list=False,
+        n_pre_atoms=2, n_post_atoms=3, sparse_format=sparse_format,
+        sum_multapses=True)
+    connection_holder.add_connections(connections)
+    weights = connection_holder._get_data_items()
+    assert weights.format == sparse_format
+    assert weights.nnz == 3
+    assert numpy.array_equal(
+        weights.toarray(), [[3, 3, 0], [0, 0, 4]])
+
+
+def test_connection_holder_dense_sum_multapses():
+    connections = numpy.array(
+        [(0, 0, 1, 10), (0, 0, 2, 20), (0, 1, 3, 30), (1, 2, 4, 40)],
+        AbstractSynapseDynamics.NUMPY_CONNECTORS_DTYPE)
+
+    # The connections with the same source and target are summed, and the
+    # values without connections are NaN
+    connection_holder = ConnectionHolder(
+        data_items_to_return=["weight", "delay"], as_list=False,
+        n_pre_atoms=2, n_post_atoms=3, sum_multapses=True)
+    connection_holder.add_connections(connections)
+    weights, delays = connection_holder[0], connection_holder[1]
+    assert numpy.array_equal(
+        numpy.isnan(weights), [[False, False, True], [True, True, False]])
+    assert numpy.array_equal(
+        numpy.nan_to_num(weights), [[3, 3, 0], [0, 0, 4]])
+    assert numpy.array_equal(
+        numpy.nan_to_num(delays), [[30, 30, 0], [0, 0, 40]])
+
+
+def test_connection_holder_sparse_matches_dense():
+    rng = numpy.random.RandomState(0)
+    n_pre, n_post = 20, 30
+    pairs = rng.choice(n_pre * n_post, 100, replace=False)
+    connections = numpy.zeros(
+        len(pairs), AbstractSynapseDynamics.NUMPY_CONNECTORS_DTYPE)
+    connections["source"] = pairs // n_post
+    connections["target"] = pairs % n_post
+    connections["weight"] = rng.uniform(0.1, 1.0, len(pairs))
+    dense = ConnectionHolder(["weight"], False, n_pre, n_post)
+    dense.add_connections(connections)
+    sparse = ConnectionHolder(
+        ["weight"], False, n_pre, n_post, sparse_format="csr")
+    sparse.add_connections(connections)
+    dense_matrix = dense._get_data_items()
+    sparse_matrix = sparse._get_data_items().toarray()
+    connected = ~numpy.isnan(dense_matrix)
+    assert numpy.array_equal(dense_matrix[connected], sparse_matrix[connected])
+    assert not numpy.any(sparse_matrix[~connected])
+
+
+def test_connection_holder_unknown_sparse_format():
+    with pytest.raises(ConfigurationException):
+        ConnectionHolder(["weight"], False, 2, 2, sparse_format="dia")
+
+
+class _Slice(object):
+    def __init__(self, lo_atom, hi_atom):
+        self.lo_atom = lo_atom
+        self.hi_atom = hi_atom
+
+
+def _add_slice_connections(connection_holder, n_pre, n_post, slice_size):
+    """ Add random connections to the holder as if read from post-vertex\
+        slices, in a random order of slices, returning all of them
+    """
+    rng = numpy.random.RandomState(0)
+    all_connections = list()
+    los = numpy.arange(0, n_post, slice_size)
+    for lo_atom in los[rng.permutation(len(los))]:
+        hi_atom = min(lo_atom + slice_size, n_post) - 1
+        n_connections = rng.randint(0, 200)
+        connections = numpy.zeros(
+            n_connections, AbstractSynapseDynamics.NUMPY_CONNECTORS_DTYPE)
+        connections["source"] = rng.randint(0, n_pre, n_connections)
+        connections["target"] = rng.randint(
+            lo_atom, hi_atom + 1, n_connections)
+        connections["weight"] = rng.uniform(0, 1, n_connections)
+        connections["delay"] = numpy.arange(n_connections)
+        connection_holder.add_connections(
+            connections, _Slice(lo_atom, hi_atom))
+        all_connections.append(connections)
+    return numpy.concatenate(all_connections)
+
+
+@pytest.mark.parametrize("data_items", [
+    None, ["weight"], ["target", "delay", "source"]])
+def test_connection_holder_chunks(data_items, tmpdir):
+    n_pre, n_post, slice_size = 50, 100, 16
+    in_memory = ConnectionHolder(data_items, True, n_pre, n_post)
+    connections = _add_slice_connections(
+        in_memory, n_pre, n_post, slice_size)
+    in_file = ConnectionHolder(
+        data_items, True, n_pre, n_post, memmap_directory=str(tmpdir))
+    _add_slice_connections(in_file, n_pre, n_post, slice_size)
+
+    # The list is sorted by source then target, keeping the order of
+    # connections with the same source and target
+    expected = connections[numpy.lexsort(
+        (connections["target"], connections["source"]))]
+    if data_items is not None:
+        expected = expected[data_items if len(data_items) > 1
+                            else data_items[0]]
+    for connection_holder in (in_memory, in_file):
+        data = connection_holder._get_data_items()
+        assert len(data) == len(expected)
+        if data_items is not None and len(data_items) == 1:
+            assert numpy.array_equal(data, expected)
+        else:
+            for name in expected.dtype.names:
+                assert numpy.array_equal(data[name], expected[name])
+    assert isinstance(in_file._get_data_items(), numpy.memmap)
+    assert len(tmpdir.listdir()) == 1
+
+    # The chunks are sorted within each slice, in the order of the slices
+    chunks = list(in_memory.iter_chunks())
+    assert len(chunks) == (n_post + slice_size - 1) // slice_size
+    assert sum(len(chunk) for chunk in chunks) == len(connections)
+    if data_items is None:
+        for chunk in chunks:
+            assert numpy.all(numpy.diff(chunk["source"]) >= 0)
+        assert numpy.array_equal(
+            numpy.concatenate(chunks)["target"] // slice_size,
+            numpy.sort(connections["target"]) // slice_size)
+
+
+def test_connection_holder_chunks_before_run():
+    connection_holder = ConnectionHolder(["weight"], True, 2, 2)
+    with pytest.raises(Exception):
+        list(connection_holder.iter_chunks())
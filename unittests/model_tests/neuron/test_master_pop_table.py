@@ -0,0 +1,115 @@
+import struct
+
+import numpy
+import pytest
+
+from pacman.model.routing_info import BaseKeyAndMask
+
+from spynnaker.pyNN.models.neuron.master_pop_table_generators \
+    import MasterPopTableAsBinarySearch, MasterPopTableAsHashTable
+
+
+class _MockSpec(object):
+    """ Collects the words written to a region
+    """
+
+    def __init__(self):
+        self.words = list()
+
+    def switch_write_focus(self, region):
+        pass
+
+    def write_value(self, data):
+        self.words.append(data)
+
+    def write_array(self, array_values):
+        self.words.extend(numpy.asarray(array_values).view("<u4"))
+
+
+class _MockTransceiver(object):
+    """ Reads memory from the words written to a region at address 0
+    """
+
+    def __init__(self, words):
+        self._data = struct.pack("<{}I".format(len(words)), *words)
+
+    def read_memory(self, x, y, base_address, length):
+        return self._data[base_address:base_address + length]
+
+
+def _make_keys_and_masks(n_sources, seed=0):
+    """ Allocate keys to sources of different sizes, as the routing key\
+        allocator does, aligned to the size of the key space of each source
+    """
+    rng = numpy.random.RandomState(seed)
+    keys_and_masks = list()
+    next_key = 0
+    for n_atoms in rng.choice([32, 64, 100, 255, 256], n_sources):
+        n_keys = 1 << int(n_atoms - 1).bit_length()
+        key = ((next_key + n_keys - 1) // n_keys) * n_keys
+        keys_and_masks.append(
+            (BaseKeyAndMask(key, 0xFFFFFFFF - (n_keys - 1)), int(n_atoms)))
+        next_key = key + n_keys
+    return keys_and_masks
+
+
+def _write_table(table, keys_and_masks):
+    spec = _MockSpec()
+    table.initialise_table(spec, 0)
+    for i, (key_and_mask, _) in enumerate(keys_and_masks):
+        table.update_master_population_table(
+            spec, i * 1024, (i % 255) + 1, key_and_mask, 0)
+        if i % 3 == 0:
+            table.update_master_population_table(
+                spec, i * 4, 1, key_and_mask, 0, is_single=True)
+    table.finish_master_pop_table(spec, 0)
+    return spec.words
+
+
+@pytest.mark.parametrize("n_sources", [0, 1, 2, 50, 500])
+def test_hash_table_lookup(n_sources):
+    keys_and_masks = _make_keys_and_masks(n_sources)
+    binary_search = MasterPopTableAsBinarySearch()
+    hash_table = MasterPopTableAsHashTable()
+    binary_words = _write_table(binary_search, keys_and_masks)
+    hash_words = _write_table(hash_table, keys_and_masks)
+    assert len(hash_words) * 4 <= hash_table._get_table_size(
+        n_sources, n_sources + (n_sources + 2) // 3)
+
+    binary_txrx = _MockTransceiver(binary_words)
+    hash_txrx = _MockTransceiver(hash_words)
+    for key_and_mask, n_atoms in keys_and_masks:
+        for key in (key_and_mask.key, key_and_mask.key + n_atoms - 1):
+            expected = binary_search.extract_synaptic_matrix_data_location(
+                key, 0, binary_txrx, 0, 0)
+            assert len(expected) > 0
+            assert hash_table.extract_synaptic_matrix_data_location(
+                key, 0, hash_txrx, 0, 0) == expected
+
+    # A key of no source
+    missing_key = 0xFFFFFFF0
+    assert hash_table.extract_synaptic_matrix_data_location(
+        missing_key, 0, hash_txrx, 0, 0) == []
+
+
+@pytest.mark.parametrize("table_type", [
+    MasterPopTableAsBinarySearch, MasterPopTableAsHashTable])
+@pytest.mark.parametrize("n_sources", [0, 1, 50])
+def test_decoded_table(table_type, n_sources):
+    keys_and_masks = _make_keys_and_masks(n_sources)
+    table = table_type()
+    txrx = _MockTransceiver(_write_table(table, keys_and_masks))
+    decoded = table.read_master_population_table(0, txrx, 0, 0)
+    assert decoded.n_entries == n_sources
+
+    keys = list()
+    for key_and_mask, n_atoms in keys_and_masks:
+        keys.extend((key_and_mask.key, key_and_mask.key + n_atoms - 1))
+    keys.append(0xFFFFFFF0)
+    for key in keys:
+        assert decoded.get_synaptic_matrix_data_location(key) == \
+            table.extract_synaptic_matrix_data_location(key, 0, txrx, 0, 0)
+    indices = decoded.locate_entries(numpy.array(keys, dtype="uint32"))
+    assert numpy.array_equal(
+        indices[:-1], numpy.repeat(numpy.arange(n_sources), 2))
+    assert indices[-1] == -1
@@ -1,6 +1,13 @@
+import struct
+import numpy
+import pytest
+from data_specification.enums import DataType
 from pacman.model.graphs.common import Slice
+from pacman.model.placements import Placement
 from spinn_front_end_common.utilities import globals_variables
 from spynnaker.pyNN.models.common import NeuronRecorder
+from spynnaker.pyNN.models.common.recording_export import (
+    NpyColumnWriter, read_exported_matrix, read_exported_spikes)
 from spynnaker.pyNN.utilities.spynnaker_failed_state \
     import SpynnakerFailedState
 
@@ -28,3 +35,366 @@ def test_simple_record():
     assert (gps[1].get_value() == 1)
     # 4 n_neurons second (index "5") is v
     assert (gps[5].get_value() == _slice.n_atoms)
+
+
+class _MockVertex(object):
+    def __init__(self, vertex_slice, p):
+        self.vertex_slice = vertex_slice
+        self.p = p
+
+
+class _MockGraphMapper(object):
+    def __init__(self, vertices):
+        self._vertices = vertices
+
+    def get_machine_vertices(self, application_vertex):
+        return self._vertices
+
+    def get_slice(self, vertex):
+        return vertex.vertex_slice
+
+
+class _MockPlacements(object):
+    def get_placement_of_vertex(self, vertex):
+        return Placement(vertex, 0, 0, vertex.p)
+
+
+class _MockDataPointer(object):
+    def __init__(self, data):
+        self._data = data
+
+    def read_all(self):
+        return self._data
+
+
+class _MockBufferManager(object):
+    def __init__(self, data):
+        self._data = data
+
+    def get_data_for_vertex(self, placement, region):
+        return self._data[placement.p]
+
+
+@pytest.mark.parametrize("n_threads", [1, 4])
+def test_get_matrix_data(n_threads):
+    globals_variables.set_failed_state(SpynnakerFailedState())
+    globals_variables.set_simulator(MockSimulator())
+    nr = NeuronRecorder(["v"], 10)
+    nr.set_recording("v", True, sampling_interval=2.0)
+    n_steps = 9
+    times = numpy.arange(0, n_steps, 2)
+    vertices = [_MockVertex(Slice(0, 5), 1), _MockVertex(Slice(6, 9), 2)]
+    values = numpy.arange(len(times) * 10).reshape(len(times), 10)
+
+    # The first core has all its data; the second is missing a timestep
+    data = dict()
+    missing_row = 2
+    for vertex in vertices:
+        vertex_slice = vertex.vertex_slice
+        record = numpy.column_stack((
+            times, values[:, vertex_slice.lo_atom:vertex_slice.hi_atom + 1]
+            * DataType.S1615.scale)).astype("<i4")
+        if vertex.p == 2:
+            record = numpy.delete(record, missing_row, axis=0)
+        data[vertex.p] = (
+            _MockDataPointer(bytearray(record.tobytes())), vertex.p == 2)
+
+    matrix, indexes, interval = nr.get_matrix_data(
+        "test", _MockBufferManager(data), 0, _MockPlacements(),
+        _MockGraphMapper(vertices), None, "v", n_steps, n_threads=n_threads)
+    assert list(indexes) == list(range(10))
+    assert interval == 2.0
+    assert matrix.shape == (len(times), 10)
+    assert numpy.array_equal(matrix[:, :6], values[:, :6])
+    assert numpy.all(numpy.isnan(matrix[missing_row, 6:]))
+    expected = numpy.delete(values[:, 6:], missing_row, axis=0)
+    assert numpy.array_equal(
+        numpy.delete(matrix[:, 6:], missing_row, axis=0), expected)
+
+
+@pytest.mark.parametrize("n_threads", [1, 4])
+def test_get_spikes_of_indexes(n_threads):
+    globals_variables.set_failed_state(SpynnakerFailedState())
+    globals_variables.set_simulator(MockSimulator())
+    nr = NeuronRecorder(["spikes"], 100)
+    nr.set_recording("spikes", True, indexes=[70, 3, 5, 40, 99])
+    vertices = [_MockVertex(Slice(0, 49), 1), _MockVertex(Slice(50, 99), 2)]
+
+    # Each core records the spikes of its neurons recording, in order
+    spikes = {1: [(0, 3), (2, 3), (2, 40), (5, 5)], 2: [(1, 70), (4, 99)]}
+    data = dict()
+    for vertex in vertices:
+        neurons = nr._neurons_recording("spikes", vertex.vertex_slice)
+        record = numpy.zeros((6, 2), dtype="<u4")
+        record[:, 0] = numpy.arange(6)
+        for time, neuron in spikes[vertex.p]:
+            record[time, 1] |= 1 << neurons.index(neuron)
+        data[vertex.p] = (_MockDataPointer(bytearray(record.tobytes())), False)
+
+    result = nr.get_spikes(
+        "test", _MockBufferManager(data), 0, _MockPlacements(),
+        _MockGraphMapper(vertices), None, 1000, n_threads=n_threads)
+    expected = sorted(
+        (neuron, time) for core_spikes in spikes.values()
+        for time, neuron in core_spikes)
+    assert numpy.array_equal(result, expected)
+
+
+def _make_v_and_spike_data(vertices, values, n_steps):
+    """ Make the recordings of v, sampled every other timestep, and of\
+        spikes, where each neuron spikes at the time of its ID
+    """
+    v_data = dict()
+    spike_data = dict()
+    for vertex in vertices:
+        vertex_slice = vertex.vertex_slice
+        record = numpy.column_stack((
+            numpy.arange(0, n_steps, 2),
+            values[:, vertex_slice.lo_atom:vertex_slice.hi_atom + 1] *
+            DataType.S1615.scale)).astype("<i4")
+        v_data[vertex.p] = (
+            _MockDataPointer(bytearray(record.tobytes())), False)
+
+        record = numpy.zeros((n_steps, 2), dtype="<u4")
+        record[:, 0] = numpy.arange(n_steps)
+        for neuron in range(vertex_slice.lo_atom, vertex_slice.hi_atom + 1):
+            record[neuron, 1] = 1 << (neuron - vertex_slice.lo_atom)
+        spike_data[vertex.p] = (
+            _MockDataPointer(bytearray(record.tobytes())), False)
+    return v_data, spike_data
+
+
+def test_get_data_in_window():
+    globals_variables.set_failed_state(SpynnakerFailedState())
+    globals_variables.set_simulator(MockSimulator())
+    nr = NeuronRecorder(["v", "spikes"], 10)
+    nr.set_recording("v", True, sampling_interval=2.0)
+    nr.set_recording("spikes", True)
+    n_steps = 10
+    vertices = [_MockVertex(Slice(0, 5), 1), _MockVertex(Slice(6, 9), 2)]
+    values = numpy.arange(50).reshape(5, 10)
+    v_data, spike_data = _make_v_and_spike_data(vertices, values, n_steps)
+
+    # Only the second core is read for neurons after the first core
+    buffer_manager = _MockBufferManager({2: v_data[2]})
+    matrix, indexes, _ = nr.get_matrix_data(
+        "test", buffer_manager, 0, _MockPlacements(),
+        _MockGraphMapper(vertices), None, "v", n_steps,
+        neuron_range=(7, 9), time_range=(3.0, 8.0))
+    assert list(indexes) == [7, 8]
+    assert numpy.array_equal(matrix, values[2:4, 7:9])
+
+    buffer_manager = _MockBufferManager(v_data)
+    matrix, indexes, _ = nr.get_matrix_data(
+        "test", buffer_manager, 0, _MockPlacements(),
+        _MockGraphMapper(vertices), None, "v", n_steps,
+        neuron_range=(4, 8))
+    assert list(indexes) == [4, 5, 6, 7]
+    assert numpy.array_equal(matrix, values[:, 4:8])
+
+    spikes = nr.get_spikes(
+        "test", _MockBufferManager(spike_data), 0, _MockPlacements(),
+        _MockGraphMapper(vertices), None, 1000, neuron_range=(2, 8),
+        time_range=(4.0, 9.0))
+    assert numpy.array_equal(spikes, [[4, 4], [5, 5], [6, 6], [7, 7]])
+
+
+def test_export_data(tmpdir):
+    globals_variables.set_failed_state(SpynnakerFailedState())
+    globals_variables.set_simulator(MockSimulator())
+    nr = NeuronRecorder(["v", "spikes"], 10)
+    nr.set_recording("v", True, sampling_interval=2.0)
+    nr.set_recording("spikes", True)
+    n_steps = 10
+    vertices = [_MockVertex(Slice(0, 5), 1), _MockVertex(Slice(6, 9), 2)]
+    values = numpy.arange(50).reshape(5, 10)
+    v_data, spike_data = _make_v_and_spike_data(vertices, values, n_steps)
+
+    filename = str(tmpdir.join("v"))
+    shape = nr.write_matrix_data(
+        filename, "test", _MockBufferManager(v_data), 0, _MockPlacements(),
+        _MockGraphMapper(vertices), None, "v", n_steps,
+        time_range=(2.0, 10.0))
+    assert shape == (4, 10)
+    data, ids, sampling_interval, first_time, index = \
+        read_exported_matrix(filename)
+    assert isinstance(data, numpy.memmap)
+    assert numpy.array_equal(data, values[1:])
+    assert list(ids) == list(range(10))
+    assert sampling_interval == 2.0
+    assert first_time == 2.0
+    assert [(vertex["lo_atom"], vertex["first_column"], vertex["n_columns"])
+            for vertex in index["vertices"]] == [(0, 0, 6), (6, 6, 4)]
+
+    filename = str(tmpdir.join("spikes"))
+    n_spikes = nr.write_spikes(
+        filename, "test", _MockBufferManager(spike_data), 0,
+        _MockPlacements(), _MockGraphMapper(vertices), None, 1000,
+        neuron_range=(3, 10))
+    assert n_spikes == 7
+    ids, times, index = read_exported_spikes(filename)
+    assert list(ids) == list(range(3, 10))
+    assert numpy.array_equal(times, numpy.arange(3, 10))
+    assert [(vertex["first_row"], vertex["n_rows"])
+            for vertex in index["vertices"]] == [(0, 3), (3, 4)]
+
+
+def test_npy_column_writer(tmpdir):
+    filename = str(tmpdir.join("column.npy"))
+    with NpyColumnWriter(filename, "float64") as writer:
+        for start in range(0, 1000, 300):
+            writer.append(numpy.arange(start, min(start + 300, 1000)))
+    column = numpy.load(filename, mmap_mode="r")
+    assert column.dtype == numpy.dtype("float64")
+    assert numpy.array_equal(column, numpy.arange(1000))
+
+    with NpyColumnWriter(filename, "int64"):
+        pass
+    assert len(numpy.load(filename)) == 0
+
+
+def test_get_spike_statistics():
+    globals_variables.set_failed_state(SpynnakerFailedState())
+    globals_variables.set_simulator(MockSimulator())
+    nr = NeuronRecorder(["spikes"], 10)
+    nr.set_recording("spikes", True)
+    n_steps = 10
+    vertices = [_MockVertex(Slice(0, 5), 1), _MockVertex(Slice(6, 9), 2)]
+    values = numpy.arange(50).reshape(5, 10)
+    _, spike_data = _make_v_and_spike_data(vertices, values, n_steps)
+    args = ("test", _MockBufferManager(spike_data), 0, _MockPlacements(),
+            _MockGraphMapper(vertices), None, 1000)
+
+    # Each neuron spikes once, at the time of its ID
+    assert list(nr.get_spike_counts(*args)) == [1] * 10
+    assert list(nr.get_spike_counts(
+        *args, neuron_range=(2, 8), time_range=(4.0, 9.0))) == \
+        [0, 0, 0, 0, 1, 1, 1, 1, 0, 0]
+
+    histogram, times = nr.get_spike_histogram(*(args + (n_steps, 4.0)))
+    assert list(histogram) == [4, 4, 2]
+    assert list(times) == [0.0, 4.0, 8.0]
+    histogram, times = nr.get_spike_histogram(
+        *(args + (n_steps, 2.0)), neuron_range=(0, 6), time_range=(2.0, 7.0))
+    assert list(histogram) == [2, 2, 0]
+    assert list(times) == [2.0, 4.0, 6.0]
+
+
+@pytest.mark.parametrize("n_threads", [1, 4])
+def test_get_matrix_statistics(n_threads):
+    globals_variables.set_failed_state(SpynnakerFailedState())
+    globals_variables.set_simulator(MockSimulator())
+    nr = NeuronRecorder(["v"], 10)
+    nr.set_recording("v", True, sampling_interval=2.0)
+    n_steps = 10
+    vertices = [_MockVertex(Slice(0, 5), 1), _MockVertex(Slice(6, 9), 2)]
+    values = numpy.random.RandomState(0).randint(-100, 100, (5, 10))
+    v_data, _ = _make_v_and_spike_data(vertices, values, n_steps)
+
+    # The second core is missing a sample
+    record = numpy.frombuffer(
+        v_data[2][0].read_all(), dtype="<i4").reshape(5, 5)
+    v_data[2] = (_MockDataPointer(
+        bytearray(numpy.delete(record, 1, axis=0).tobytes())), True)
+    args = ("test", _MockBufferManager(v_data), 0, _MockPlacements(),
+            _MockGraphMapper(vertices), None, "v", n_steps)
+
+    for window, neuron_range, time_range in [
+            (None, None, None), (4.0, None, None), (4.0, (3, 9), (2.0, 9.0))]:
+        means, variances, indexes, times = nr.get_matrix_statistics(
+            *args, window=window, neuron_range=neuron_range,
+            time_range=time_range, n_threads=n_threads)
+        matrix, expected_indexes, _ = nr.get_matrix_data(
+            *args, neuron_range=neuron_range, time_range=time_range)
+        rows_per_window = len(matrix) if window is None else 2
+        starts = range(0, len(matrix), rows_per_window)
+        windows = [matrix[start:start + rows_per_window] for start in starts]
+        assert list(indexes) == list(expected_indexes)
+        assert numpy.allclose(
+            means, [numpy.nanmean(rows, axis=0) for rows in windows])
+        assert numpy.allclose(
+            variances, [numpy.nanvar(rows, axis=0) for rows in windows])
+        first_time = 0.0 if time_range is None else time_range[0]
+        assert list(times) == [first_time + start * 2.0 for start in starts]
+
+
+def _make_spike_records(step_neurons, n_recording):
+    """ Write spikes as they are recorded as a bit field and as a list, for\
+        each timestep in which any neuron spikes
+    """
+    bit_data = bytearray()
+    sparse_data = bytearray()
+    n_words = (n_recording + 31) // 32
+    for step, neurons in enumerate(step_neurons):
+        neurons = numpy.unique(neurons)
+        if not len(neurons):
+            continue
+        bits = numpy.zeros(n_words, dtype="<u4")
+        numpy.bitwise_or.at(
+            bits, neurons // 32,
+            numpy.left_shift(1, neurons % 32).astype("<u4"))
+        bit_data += struct.pack("<I", step) + bits.tobytes()
+        indices = numpy.zeros(((len(neurons) + 3) // 4) * 4, dtype="uint8")
+        indices[:len(neurons)] = neurons
+        sparse_data += struct.pack("<II", step, len(neurons))
+        sparse_data += indices.tobytes()
+    return bit_data, sparse_data
+
+
+@pytest.mark.parametrize("indexes", [None, [70, 3, 5, 40, 99, 1, 2]])
+def test_get_sparse_spikes(indexes):
+    globals_variables.set_failed_state(SpynnakerFailedState())
+    globals_variables.set_simulator(MockSimulator())
+    bit_nr = NeuronRecorder(["spikes"], 100)
+    sparse_nr = NeuronRecorder(["spikes"], 100, sparse_spike_rate=10)
+    bit_nr.set_recording("spikes", True, indexes=indexes)
+    sparse_nr.set_recording("spikes", True, indexes=indexes)
+    vertices = [_MockVertex(Slice(0, 49), 1), _MockVertex(Slice(50, 99), 2)]
+
+    rng = numpy.random.RandomState(0)
+    bit_data = dict()
+    sparse_data = dict()
+    for vertex in vertices:
+        n_recording = bit_nr._count_recording_per_slice(
+            "spikes", vertex.vertex_slice)
+        bit_records, sparse_records = _make_spike_records(
+            [rng.randint(0, n_recording, rng.poisson(2))
+             for _ in range(50)], n_recording)
+        bit_data[vertex.p] = (_MockDataPointer(bit_records), False)
+        sparse_data[vertex.p] = (_MockDataPointer(sparse_records), False)
+
+    for neuron_range, time_range in [(None, None), ((3, 60), (10.0, 40.0))]:
+        expected = bit_nr.get_spikes(
+            "test", _MockBufferManager(bit_data), 0, _MockPlacements(),
+            _MockGraphMapper(vertices), None, 1000,
+            neuron_range=neuron_range, time_range=time_range)
+        spikes = sparse_nr.get_spikes(
+            "test", _MockBufferManager(sparse_data), 0, _MockPlacements(),
+            _MockGraphMapper(vertices), None, 1000,
+            neuron_range=neuron_range, time_range=time_range, n_threads=4)
+        assert len(expected) > 0
+        assert numpy.array_equal(spikes, expected)
+
+
+def test_sparse_spike_sdram():
+    globals_variables.set_failed_state(SpynnakerFailedState())
+    globals_variables.set_simulator(MockSimulator())
+    vertex_slice = Slice(0, 255)
+    nr = NeuronRecorder(["spikes"], 256, sparse_spike_rate=10)
+    nr.set_recording("spikes", True)
+    assert nr.get_data(vertex_slice)[0] == 1
+
+    # 256 neurons at 10Hz spike 2.56 times in each 1ms timestep on average,
+    # and space is reserved for up to 8 (three standard deviations more)
+    assert nr.get_buffered_sdram_per_timestep("spikes", vertex_slice) == 16
+
+    # No more neurons can spike than are recording
+    nr = NeuronRecorder(["spikes"], 256, sparse_spike_rate=10000)
+    nr.set_recording("spikes", True)
+    assert nr.get_buffered_sdram_per_timestep(
+        "spikes", vertex_slice) == 8 + 256
+
+    nr = NeuronRecorder(["spikes"], 256)
+    nr.set_recording("spikes", True)
+    assert nr.get_data(vertex_slice)[0] == 0
+    assert nr.get_buffered_sdram_per_timestep("spikes", vertex_slice) == 36
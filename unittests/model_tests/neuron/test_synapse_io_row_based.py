@@ -11,7 +11,11 @@ from spynnaker.pyNN.models.neuron.plasticity.stdp.timing_dependence \
 from spynnaker.pyNN.models.neuron.synapse_dynamics import SynapseDynamicsSTDP
 from spynnaker.pyNN.models.neural_projections.synapse_information \
     import SynapseInformation
+from spynnaker.pyNN.models.neural_projections.connectors \
+    import AbstractConnector
+from pacman.model.graphs.common import Slice
 
+import numpy
 import pytest
 
 
@@ -48,3 +52,96 @@ def test_get_max_row_length(dynamics, size, exception, max_size):
         actual_size = io._get_max_row_length(
             size, dynamics, population_table, in_edge, size)
         assert actual_size == max_size
+
+
+def _make_connections(n_rows, n_connections, post_slice, seed=0):
+    rng = numpy.random.RandomState(seed)
+    connections = numpy.zeros(
+        n_connections, dtype=AbstractConnector.NUMPY_SYNAPSES_DTYPE)
+    connections["source"] = rng.randint(0, n_rows, n_connections)
+    connections["target"] = rng.randint(
+        post_slice.lo_atom, post_slice.hi_atom + 1, n_connections)
+    connections["weight"] = rng.uniform(0, 0xFFFF, n_connections)
+    connections["delay"] = rng.randint(1, 16, n_connections)
+    connections["synapse_type"] = rng.randint(0, 2, n_connections)
+    return connections
+
+
+def _get_row_data_by_row(
+        connections, n_rows, post_slice, population_table, dynamics):
+    """ Build the rows one at a time from the per-row data of the dynamics
+    """
+    row_indices = connections["source"]
+    empty = [numpy.zeros(0, dtype="uint32") for _ in range(n_rows)]
+    size = [numpy.zeros(1, dtype="uint32") for _ in range(n_rows)]
+    if isinstance(dynamics, SynapseDynamicsSTDP):
+        fp_data, pp_data, fp_size, pp_size = \
+            dynamics.get_plastic_synaptic_data(
+                connections, row_indices, n_rows, post_slice, 2)
+        ff_data, ff_size = empty, size
+    else:
+        ff_data, ff_size = dynamics.get_static_synaptic_data(
+            connections, row_indices, n_rows, post_slice, 2)
+        fp_data, pp_data, fp_size, pp_size = empty, empty, size, size
+    lengths = [
+        pp_data[i].size + fp_data[i].size + ff_data[i].size
+        for i in range(n_rows)]
+    max_row_length = population_table.get_allowed_row_length(max(lengths))
+    padding = [
+        numpy.zeros(max_row_length - length, dtype="uint32")
+        for length in lengths]
+    return max_row_length, numpy.concatenate([
+        numpy.concatenate(items) for items in zip(
+            pp_size, pp_data, ff_size, fp_size, ff_data, fp_data, padding)])
+
+
+def _dynamics():
+    return [
+        SynapseDynamicsStatic(),
+        SynapseDynamicsStatic(pad_to_length=32),
+        SynapseDynamicsSTDP(
+            TimingDependenceSpikePair(), WeightDependenceAdditive()),
+        SynapseDynamicsSTDP(
+            TimingDependenceSpikePair(), WeightDependenceAdditive(),
+            pad_to_length=7)]
+
+
+@pytest.mark.parametrize("dynamics", _dynamics())
+@pytest.mark.parametrize("n_rows,n_connections", [
+    (1, 0), (10, 0), (10, 3), (100, 2000)])
+def test_row_data(dynamics, n_rows, n_connections):
+    post_slice = Slice(100, 199)
+    population_table = MasterPopTableAsBinarySearch()
+    connections = _make_connections(n_rows, n_connections, post_slice)
+    max_row_length, row_data = \
+        SynapseIORowBased._get_max_row_length_and_row_data(
+            connections, connections["source"], n_rows, post_slice, 2,
+            population_table, dynamics, None, None)
+    expected_max_row_length, expected_row_data = _get_row_data_by_row(
+        connections, n_rows, post_slice, population_table, dynamics)
+    assert max_row_length == expected_max_row_length
+    assert row_data.dtype == expected_row_data.dtype
+    assert numpy.array_equal(row_data, expected_row_data)
+
+
+@pytest.mark.parametrize("dynamics", _dynamics())
+def test_exact_max_row_info(dynamics):
+    io = SynapseIORowBased()
+    n_rows = 100
+    pre_slice = Slice(0, n_rows - 1)
+    post_slice = Slice(100, 199)
+    population_table = MasterPopTableAsBinarySearch()
+    synapse_information = SynapseInformation(None, dynamics, 0)
+    in_edge = ProjectionApplicationEdge(None, None, synapse_information)
+    connections = _make_connections(n_rows, 2000, post_slice)
+    connections["delay"] = numpy.random.RandomState(1).randint(
+        1, 64, len(connections))
+    max_row_info = io.get_max_row_info(
+        synapse_information, post_slice, 3, population_table, 1000, in_edge,
+        connections=connections)
+    (_, max_row_length, _, max_delayed_row_length, _, _) = io.get_synapses(
+        synapse_information, [pre_slice], 0, [post_slice], 0, pre_slice,
+        post_slice, 3, population_table, 2, [1.0, 1.0], 1000, in_edge, None,
+        connections=connections.copy())
+    assert max_row_info.undelayed_max_words == max_row_length
+    assert max_row_info.delayed_max_words == max_delayed_row_length
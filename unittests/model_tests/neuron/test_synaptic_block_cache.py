@@ -0,0 +1,111 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy
+
+from pacman.model.graphs.common import Slice
+
+from spynnaker.pyNN.models.neural_projections.connectors \
+    import OneToOneConnector, FixedProbabilityConnector, FromListConnector
+from spynnaker.pyNN.models.neural_projections.synapse_information \
+    import SynapseInformation
+from spynnaker.pyNN.models.neuron.master_pop_table_generators \
+    import MasterPopTableAsBinarySearch
+from spynnaker.pyNN.models.neuron.synapse_dynamics \
+    import SynapseDynamicsStatic
+from spynnaker.pyNN.models.neuron.synapse_io import SynapseIORowBased
+from spynnaker.pyNN.models.neuron.synaptic_block_cache \
+    import SynapticBlockCache
+from unittests.mocks import MockSimulator, MockPopulation
+
+
+class _CountingFromListConnector(FromListConnector):
+    """ A FromListConnector that counts the requests for its block cache\
+        parameters
+    """
+
+    def __init__(self, conn_list):
+        super(_CountingFromListConnector, self).__init__(conn_list)
+        self.n_calls = 0
+
+    def get_block_cache_parameters(self):
+        self.n_calls += 1
+        return super(
+            _CountingFromListConnector, self).get_block_cache_parameters()
+
+
+class TestSynapticBlockCache(unittest.TestCase):
+
+    def setUp(self):
+        self._dir = tempfile.mkdtemp()
+        MockSimulator.setup()
+
+    def tearDown(self):
+        shutil.rmtree(self._dir)
+
+    def _synapse_info(self, connector, weights=1.0, delays=1.0):
+        connector.set_projection_information(
+            pre_population=MockPopulation(100, "Pre"),
+            post_population=MockPopulation(100, "Post"),
+            rng=None, machine_time_step=1000)
+        connector.set_weights_and_delays(weights, delays)
+        return SynapseInformation(connector, SynapseDynamicsStatic(), 0)
+
+    def _key(self, cache, synapse_info, pre_slice=Slice(0, 49),
+             weight_scales=(32.0, 32.0)):
+        return cache.get_key(
+            synapse_info, pre_slice, Slice(0, 49), 0,
+            MasterPopTableAsBinarySearch(), SynapseIORowBased(), 2,
+            numpy.array(weight_scales), 1000)
+
+    def test_key(self):
+        cache = SynapticBlockCache(self._dir)
+        key = self._key(cache, self._synapse_info(OneToOneConnector()))
+        self.assertIsNotNone(key)
+        self.assertEqual(
+            key, self._key(cache, self._synapse_info(OneToOneConnector())))
+        self.assertNotEqual(key, self._key(
+            cache, self._synapse_info(OneToOneConnector(), weights=2.0)))
+        self.assertNotEqual(key, self._key(
+            cache, self._synapse_info(OneToOneConnector()),
+            pre_slice=Slice(50, 99)))
+        self.assertNotEqual(key, self._key(
+            cache, self._synapse_info(OneToOneConnector()),
+            weight_scales=(16.0, 32.0)))
+        self.assertIsNone(self._key(
+            cache, self._synapse_info(FixedProbabilityConnector(0.5))))
+
+    def test_connector_digest_computed_once(self):
+        cache = SynapticBlockCache(self._dir)
+        connector = _CountingFromListConnector(numpy.array(
+            [(i, (i * 7) % 100, 1.0, 1.0) for i in range(100)]))
+        synapse_info = self._synapse_info(connector)
+        keys = [self._key(cache, synapse_info, pre_slice=pre_slice)
+                for pre_slice in (Slice(0, 49), Slice(50, 99), Slice(0, 49))]
+        self.assertEqual(connector.n_calls, 1)
+        self.assertEqual(keys[0], keys[2])
+        self.assertNotEqual(keys[0], keys[1])
+
+    def test_round_trip(self):
+        cache = SynapticBlockCache(os.path.join(self._dir, "blocks"))
+        key = self._key(cache, self._synapse_info(OneToOneConnector()))
+        self.assertFalse(cache.contains(key))
+        self.assertIsNone(cache.get_block(key))
+        block = (numpy.arange(20, dtype="uint32"), 3,
+                 numpy.zeros(0, dtype="uint32"), 0,
+                 numpy.zeros(0, dtype="uint32"),
+                 numpy.zeros(0, dtype="uint32"))
+        cache.store_block(key, block)
+        self.assertTrue(cache.contains(key))
+        self.assertEqual(os.listdir(cache.directory), [key + ".npz"])
+        cached = cache.get_block(key)
+        self.assertEqual(len(cached), len(block))
+        for cached_item, item in zip(cached, block):
+            self.assertTrue(numpy.array_equal(cached_item, item))
+        self.assertEqual(cached[1], 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
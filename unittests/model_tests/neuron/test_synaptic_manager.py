@@ -2,6 +2,8 @@ import unittest
 import struct
 import os
 import tempfile
+import numpy
+from multiprocessing.pool import ThreadPool
 
 import spinn_utilities.conf_loader as conf_loader
 from spinn_utilities.overrides import overrides
@@ -30,9 +32,11 @@ from spynnaker.pyNN.models.neural_projections \
 from spynnaker.pyNN.models.neural_projections \
     import SynapseInformation
 from spynnaker.pyNN.models.neural_projections.connectors \
-    import OneToOneConnector, AllToAllConnector
+    import OneToOneConnector, AllToAllConnector, FixedProbabilityConnector
 from spynnaker.pyNN.models.neuron.synapse_dynamics \
     import SynapseDynamicsStatic
+from spynnaker.pyNN.overridden_pacman_functions.\
+    spynnaker_data_specification_writer import _SynapticBlockPregenerator
 
 from unittests.mocks import MockSimulator
 
@@ -52,6 +56,10 @@ class MockMasterPopulationTable(object):
             self, key, master_pop_table_address, transceiver, x, y):
         return self._key_to_entry_map[key]
 
+    def read_master_population_table(
+            self, master_pop_table_address, transceiver, x, y):
+        return None
+
 
 class MockTransceiverRawData(object):
 
@@ -88,6 +96,26 @@ class SimpleApplicationVertex(ApplicationVertex):
         return ResourceContainer()
 
 
+class MockPopulationVertex(SimpleApplicationVertex):
+    """ A post-vertex that lists the synaptic blocks that can be generated\
+        ahead of the specification, as the population vertex does
+    """
+
+    def __init__(self, n_atoms, synaptic_manager, graph, graph_mapper,
+                 machine_time_step):
+        super(MockPopulationVertex, self).__init__(n_atoms)
+        self._synaptic_manager = synaptic_manager
+        self._graph = graph
+        self._graph_mapper = graph_mapper
+        self._machine_time_step = machine_time_step
+
+    def get_pregenerable_synaptic_blocks(self, placement):
+        return self._synaptic_manager.get_pregenerable_blocks(
+            self, self._graph_mapper.get_slice(placement.vertex),
+            placement.vertex, self._graph, None, self._graph_mapper, 1.0,
+            self._machine_time_step)
+
+
 class TestSynapticManager(unittest.TestCase):
 
     def test_retrieve_synaptic_block(self):
@@ -183,6 +211,89 @@ class TestSynapticManager(unittest.TestCase):
         assert data_1 == direct_matrix_1_expanded
         assert data_2 == direct_matrix_2_expanded
 
+    def test_retrieve_whole_synaptic_matrix(self):
+        default_config_paths = os.path.join(
+            os.path.dirname(abstract_spinnaker_common.__file__),
+            AbstractSpiNNakerCommon.CONFIG_FILE_NAME)
+
+        config = conf_loader.load_config(
+            AbstractSpiNNakerCommon.CONFIG_FILE_NAME, default_config_paths)
+        config.set("Simulation", "read_whole_synaptic_matrix", "True")
+
+        key = 0
+        n_rows = 2
+
+        # The synaptic matrix of 16 bytes, followed by the direct matrix
+        # starting with its size
+        synaptic_matrix = bytearray(struct.pack("<IIII", 5, 6, 7, 8))
+        direct_matrix = bytearray(struct.pack("<IIII", 1, 2, 3, 4))
+        data = synaptic_matrix + struct.pack("<I", 16) + direct_matrix
+        direct_matrix_2_expanded = bytearray(
+            struct.pack("<IIIIIIII", 0, 1, 0, 3, 0, 1, 0, 4))
+
+        synaptic_manager = SynapticManager(
+            n_synapse_types=2, ring_buffer_sigma=5.0, spikes_per_second=100.0,
+            config=config,
+            population_table_type=MockMasterPopulationTable(
+                {key: [(1, 4, False), (1, n_rows * 4, True)]}),
+            synapse_io=MockSynapseIO())
+
+        transceiver = MockTransceiverRawData(data)
+        n_reads = [0]
+        read_memory = transceiver.read_memory
+
+        def counted_read_memory(x, y, base_address, length):
+            n_reads[0] += 1
+            return read_memory(x, y, base_address, length)
+        transceiver.read_memory = counted_read_memory
+
+        placement = Placement(None, 0, 0, 1)
+        synaptic_manager._synaptic_matrix_sizes[placement] = 16
+
+        block, row_len_1 = synaptic_manager._retrieve_synaptic_block(
+            transceiver=transceiver, placement=placement,
+            master_pop_table_address=0, indirect_synapses_address=0,
+            direct_synapses_address=20, key=key, n_rows=n_rows, index=0,
+            using_extra_monitor_cores=False)
+        direct_block, row_len_2 = synaptic_manager._retrieve_synaptic_block(
+            transceiver=transceiver, placement=placement,
+            master_pop_table_address=0, indirect_synapses_address=0,
+            direct_synapses_address=20, key=key, n_rows=n_rows, index=1,
+            using_extra_monitor_cores=False)
+
+        # The size of the direct matrix and the two regions are read once
+        assert n_reads[0] == 3
+
+        # The block is a view of the region read, which decodes as the
+        # synapse IO reads it
+        assert isinstance(block, numpy.ndarray)
+        assert block.base is not None
+        assert numpy.array_equal(
+            numpy.frombuffer(block, dtype="<u4"), [6])
+        assert row_len_1 == 1
+        assert direct_block == direct_matrix_2_expanded
+        assert row_len_2 == 1
+
+        # Clearing the cache releases the regions, which are then read once
+        # again even when several threads read blocks at once
+        synaptic_manager.clear_connection_cache()
+
+        def read_block(index):
+            return synaptic_manager._retrieve_synaptic_block(
+                transceiver=transceiver, placement=placement,
+                master_pop_table_address=0, indirect_synapses_address=0,
+                direct_synapses_address=20, key=key, n_rows=n_rows,
+                index=index, using_extra_monitor_cores=False)
+        pool = ThreadPool(4)
+        try:
+            blocks = pool.map(read_block, [0, 1] * 4)
+        finally:
+            pool.close()
+            pool.join()
+        assert n_reads[0] == 6
+        assert all(block is blocks[0] for block in blocks[0::2])
+        assert all(block is blocks[1] for block in blocks[1::2])
+
     def test_write_synaptic_matrix_and_master_population_table(self):
         MockSimulator.setup()
 
@@ -193,6 +304,7 @@ class TestSynapticManager(unittest.TestCase):
         config = conf_loader.load_config(
             AbstractSpiNNakerCommon.CONFIG_FILE_NAME, default_config_paths)
         config.set("Simulation", "one_to_one_connection_dtcm_max_bytes", 40)
+        config.set("Simulation", "read_whole_synaptic_matrix", "True")
 
         machine_time_step = 1000.0
 
@@ -375,6 +487,176 @@ class TestSynapticManager(unittest.TestCase):
         assert all([conn["weight"] == 4.5 for conn in connections_3])
         assert all([conn["delay"] == 4.0 for conn in connections_3])
 
+        # Reading the whole regions gives blocks that decode to the same
+        # connections
+        synaptic_manager.clear_connection_cache()
+        synaptic_manager._synaptic_matrix_sizes[placement] = \
+            synaptic_matrix.max_write_pointer
+        for index, synapse_info, connections in (
+                (0, direct_synapse_information_1, connections_1),
+                (2, all_to_all_synapse_information, connections_3)):
+            data, row_len = synaptic_manager._retrieve_synaptic_block(
+                transceiver=transceiver, placement=placement,
+                master_pop_table_address=master_pop_table_address,
+                indirect_synapses_address=indirect_synapses_address,
+                direct_synapses_address=direct_synapses_address, key=key,
+                n_rows=pre_vertex_slice.n_atoms, index=index,
+                using_extra_monitor_cores=False)
+            assert numpy.array_equal(
+                synaptic_manager._synapse_io.read_synapses(
+                    synapse_info, pre_vertex_slice, post_vertex_slice,
+                    row_len, 0, 2, weight_scales, data, None,
+                    app_edge.n_delay_stages, machine_time_step),
+                connections)
+
+    def test_exact_connections_kept_for_partitioned_slices(self):
+        MockSimulator.setup()
+
+        default_config_paths = os.path.join(
+            os.path.dirname(abstract_spinnaker_common.__file__),
+            AbstractSpiNNakerCommon.CONFIG_FILE_NAME)
+
+        config = conf_loader.load_config(
+            AbstractSpiNNakerCommon.CONFIG_FILE_NAME, default_config_paths)
+        config.set("Simulation", "exact_synaptic_memory", "True")
+
+        machine_time_step = 1000.0
+
+        pre_app_vertex = SimpleApplicationVertex(10)
+        post_app_vertex = SimpleApplicationVertex(20)
+        connector = FixedProbabilityConnector(0.5)
+        connector.set_projection_information(
+            pre_app_vertex, post_app_vertex, None, machine_time_step)
+        connector.set_weights_and_delays(1.0, 1.0)
+        synapse_info = SynapseInformation(
+            connector, SynapseDynamicsStatic(), 0)
+        app_edge = ProjectionApplicationEdge(
+            pre_app_vertex, post_app_vertex, synapse_info)
+
+        synaptic_manager = SynapticManager(
+            n_synapse_types=2, ring_buffer_sigma=5.0,
+            spikes_per_second=100.0, config=config)
+
+        # Size the candidate slices considered while partitioning
+        whole_slice = Slice(0, 19)
+        post_slices = [Slice(0, 9), Slice(10, 19)]
+        for post_slice in [whole_slice] + post_slices:
+            synaptic_manager._get_max_row_info(
+                synapse_info, post_slice, app_edge, machine_time_step)
+        sized = [synaptic_manager._get_block_connections(
+            synapse_info, Slice(0, 9), post_slice, app_edge)
+            for post_slice in post_slices]
+
+        # Only the connections of the partitioned slices are kept, and
+        # writing (or rewriting) the blocks uses the connections sized
+        synaptic_manager._prune_exact_connections(post_slices)
+        assert (synapse_info, 0, 19) not in \
+            synaptic_manager._exact_connections
+        assert (synapse_info, 0, 19) not in synaptic_manager._max_row_info
+        for _ in range(2):
+            for post_slice, connections in zip(post_slices, sized):
+                assert numpy.array_equal(
+                    synaptic_manager._get_block_connections(
+                        synapse_info, Slice(0, 9), post_slice, app_edge),
+                    connections)
+        assert len(synaptic_manager._exact_connections) == 2
+
+    def test_pregenerated_blocks_write_the_same_specification(self):
+        MockSimulator.setup()
+
+        default_config_paths = os.path.join(
+            os.path.dirname(abstract_spinnaker_common.__file__),
+            AbstractSpiNNakerCommon.CONFIG_FILE_NAME)
+
+        config = conf_loader.load_config(
+            AbstractSpiNNakerCommon.CONFIG_FILE_NAME, default_config_paths)
+        config.set("Simulation", "exact_synaptic_memory", "True")
+
+        machine_time_step = 1000.0
+        synaptic_manager = SynapticManager(
+            n_synapse_types=2, ring_buffer_sigma=5.0,
+            spikes_per_second=100.0, config=config)
+        synaptic_manager._ring_buffer_shifts = [0, 0]
+        weight_scales = synaptic_manager._get_weight_scales([0, 0], 1.0)
+
+        graph = MachineGraph("Test")
+        graph_mapper = GraphMapper()
+        pre_app_vertex = SimpleApplicationVertex(20)
+        post_app_vertex = MockPopulationVertex(
+            10, synaptic_manager, graph, graph_mapper, machine_time_step)
+        post_vertex = SimpleMachineVertex(resources=None)
+        post_vertex_slice = Slice(0, 9)
+        graph.add_vertex(post_vertex)
+        graph_mapper.add_vertex_mapping(
+            post_vertex, post_vertex_slice, post_app_vertex)
+
+        # A deterministic connector, and a random one whose connections
+        # are created when the matrix is sized exactly
+        all_to_all_connector = AllToAllConnector(None)
+        all_to_all_connector.set_projection_information(
+            pre_app_vertex, post_app_vertex, None, machine_time_step)
+        all_to_all_connector.set_weights_and_delays(1.5, 1.0)
+        random_connector = FixedProbabilityConnector(0.5)
+        random_connector.set_projection_information(
+            pre_app_vertex, post_app_vertex, None, machine_time_step)
+        random_connector.set_weights_and_delays(2.5, 2.0)
+        app_edge = ProjectionApplicationEdge(
+            pre_app_vertex, post_app_vertex, SynapseInformation(
+                all_to_all_connector, SynapseDynamicsStatic(), 0))
+        app_edge.add_synapse_information(SynapseInformation(
+            random_connector, SynapseDynamicsStatic(), 1))
+
+        partition_name = "TestPartition"
+        routing_info = RoutingInfo()
+        for index, pre_vertex_slice in enumerate((Slice(0, 9), Slice(10, 19))):
+            pre_vertex = SimpleMachineVertex(resources=None)
+            machine_edge = ProjectionMachineEdge(
+                app_edge.synapse_information, pre_vertex, post_vertex)
+            graph.add_vertex(pre_vertex)
+            graph.add_edge(machine_edge, partition_name)
+            graph_mapper.add_vertex_mapping(
+                pre_vertex, pre_vertex_slice, pre_app_vertex)
+            graph_mapper.add_edge_mapping(machine_edge, app_edge)
+            routing_info.add_partition_info(PartitionRoutingInfo(
+                [BaseKeyAndMask(index << 4, 0xFFFFFFF0)],
+                graph.get_outgoing_edge_partition_starting_at_vertex(
+                    pre_vertex, partition_name)))
+
+        # Size the matrix, as when partitioning
+        all_syn_block_sz = synaptic_manager._get_synaptic_blocks_size(
+            post_vertex_slice, [app_edge], machine_time_step)
+
+        def write_specification(pregenerated_blocks):
+            synaptic_manager.pregenerated_blocks = pregenerated_blocks
+            temp_spec = tempfile.mktemp()
+            spec_writer = FileDataWriter(temp_spec)
+            spec = DataSpecificationGenerator(spec_writer, None)
+            spec.reserve_memory_region(0, 1000)
+            spec.reserve_memory_region(1, all_syn_block_sz)
+            synaptic_manager.\
+                _write_synaptic_matrix_and_master_population_table(
+                    spec, [post_vertex_slice], 0, post_vertex,
+                    post_vertex_slice, all_syn_block_sz, weight_scales,
+                    0, 1, 2, routing_info, graph_mapper, graph,
+                    machine_time_step)
+            spec.end_specification()
+            spec_writer.close()
+            with open(temp_spec, "rb") as spec_file:
+                return spec_file.read()
+
+        serial_spec = write_specification(None)
+        pregenerator = _SynapticBlockPregenerator(
+            [(Placement(post_vertex, 0, 0, 1), post_app_vertex)], 2)
+        try:
+            parallel_spec = write_specification(pregenerator)
+
+            # All the blocks were generated by the pool
+            assert pregenerator._blocks == {0: {}}
+        finally:
+            pregenerator.close()
+            synaptic_manager.pregenerated_blocks = None
+        assert parallel_spec == serial_spec
+
 
 if __name__ == "__main__":
     unittest.main()
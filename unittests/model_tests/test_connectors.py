@@ -5,8 +5,10 @@ import pytest
 import functools
 from spynnaker.pyNN.models.neural_projections.connectors \
     import FixedNumberPreConnector, FixedNumberPostConnector, \
-    FixedProbabilityConnector, IndexBasedProbabilityConnector
-from unittests.mocks import MockSimulator, MockPopulation
+    FixedProbabilityConnector, IndexBasedProbabilityConnector, \
+    FromListConnector, DistanceDependentProbabilityConnector, \
+    SmallWorldConnector
+from unittests.mocks import MockSimulator, MockPopulation, MockRNG
 
 
 @pytest.fixture(scope="module", params=[10, 100])
@@ -147,3 +149,257 @@ def test_connectors(
             raise
     print(connector, n_pre, n_post, n_in_slice, max_row_length,
           max_source, max_col_length, max_target)
+
+
+def test_from_list_connector_slices():
+    MockSimulator.setup()
+    n_pre = 100
+    n_post = 50
+    rng = numpy.random.RandomState(0)
+    sources = rng.randint(0, n_pre, 2000)
+    targets = rng.randint(0, n_post, 2000)
+    delays = rng.randint(1, 20, 2000).astype("float64")
+    conn_list = numpy.column_stack((sources, targets))
+    connector = FromListConnector(conn_list)
+    connector.set_projection_information(
+        pre_population=MockPopulation(n_pre, "Pre"),
+        post_population=MockPopulation(n_post, "Post"),
+        rng=None, machine_time_step=1000)
+    connector.set_weights_and_delays(1.0, delays)
+
+    pre_slices = [Slice(i, i + 29) for i in range(0, n_pre, 30)]
+    pre_slices.append(Slice(0, n_pre - 1))
+    post_slices = [Slice(i, i + 19) for i in range(0, n_post, 20)]
+    for post_slice in post_slices:
+        in_post = (targets >= post_slice.lo_atom) & (
+            targets <= post_slice.hi_atom)
+        for min_delay, max_delay in [(None, None), (1, 10), (10.5, 20)]:
+            in_block = in_post
+            if min_delay is not None:
+                in_block = in_post & (delays >= min_delay) & (
+                    delays <= max_delay)
+            expected = numpy.max(numpy.bincount(sources[in_block]))
+            assert connector.get_n_connections_from_pre_vertex_maximum(
+                post_slice, min_delay, max_delay) == expected
+
+        for pre_slice in pre_slices:
+            in_block = in_post & (sources >= pre_slice.lo_atom) & (
+                sources <= pre_slice.hi_atom)
+            block = connector.create_synaptic_block(
+                pre_slices, 0, post_slices, 0, pre_slice, post_slice, 0)
+            assert sorted(zip(block["source"], block["target"],
+                              block["delay"])) == \
+                sorted(zip(sources[in_block], targets[in_block],
+                           delays[in_block]))
+
+
+@pytest.mark.parametrize("connector_class, n_from, with_replacement", [
+    (FixedNumberPreConnector, 99, False),
+    (FixedNumberPreConnector, 5, False),
+    (FixedNumberPreConnector, 5, True),
+    (FixedNumberPostConnector, 99, False),
+    (FixedNumberPostConnector, 5, False),
+    (FixedNumberPostConnector, 5, True)])
+def test_fixed_number_no_self_connections(
+        connector_class, n_from, with_replacement):
+    MockSimulator.setup()
+    numpy.random.seed(0)
+    population = MockPopulation(100, "Pop")
+    connector = connector_class(
+        n_from, allow_self_connections=False,
+        with_replacement=with_replacement)
+    connector.set_projection_information(
+        pre_population=population, post_population=population,
+        rng=None, machine_time_step=1000)
+    connector.set_weights_and_delays(1.0, 1.0)
+    slices = [Slice(i, i + 29) for i in range(0, 90, 30)] + [Slice(90, 99)]
+    connections = numpy.zeros((100, 100), dtype="uint32")
+    for pre_slice in slices:
+        for post_slice in slices:
+            block = connector.create_synaptic_block(
+                slices, 0, slices, 0, pre_slice, post_slice, 0)
+            assert numpy.all(block["source"] >= pre_slice.lo_atom)
+            assert numpy.all(block["source"] <= pre_slice.hi_atom)
+            assert numpy.all(block["target"] >= post_slice.lo_atom)
+            assert numpy.all(block["target"] <= post_slice.hi_atom)
+            numpy.add.at(connections, (block["source"], block["target"]), 1)
+    assert not numpy.any(numpy.diagonal(connections))
+    axis = 0 if connector_class is FixedNumberPreConnector else 1
+    assert numpy.all(numpy.sum(connections, axis=axis) == n_from)
+    if not with_replacement:
+        assert numpy.amax(connections) == 1
+
+
+class _MockSpace(object):
+    """ A 3D space that computes distances as pyNN.space.Space of PyNN 0.8\
+        does, with positions given with a row per axis and a column per\
+        neuron, as generate_positions gives them, and the distances\
+        flattened
+    """
+
+    def __init__(self, axes=(0, 1, 2), scale_factor=1.0, offset=0.0,
+                 periodic_boundaries=(None, None, None)):
+        self.axes = numpy.array(axes)
+        self.scale_factor = scale_factor
+        self.offset = numpy.reshape(
+            numpy.broadcast_to(offset, 3), (3, 1)).astype("float64")
+        self.periodic_boundaries = periodic_boundaries
+
+    def distances(self, A, B, expand=False):
+        B = self.scale_factor * (B + self.offset)
+        d = numpy.zeros((len(self.axes), A.shape[1], B.shape[1]))
+        for i, axis in enumerate(self.axes):
+            diff = A[axis, :, None] - B[axis, :]
+            boundaries = self.periodic_boundaries[axis]
+            if boundaries is not None:
+                size = boundaries[1] - boundaries[0]
+                diff = numpy.minimum(abs(diff), size - abs(diff))
+            d[i] = diff ** 2
+        if not expand:
+            d = numpy.sum(d, 0)
+        return numpy.sqrt(d).flatten()
+
+
+class _MockPositionedPopulation(MockPopulation):
+
+    def __init__(self, positions, label):
+        super(_MockPositionedPopulation, self).__init__(
+            positions.shape[1], label)
+        self.positions = positions
+
+
+def test_distance_dependent_cutoff():
+    MockSimulator.setup()
+    rng = numpy.random.RandomState(0)
+    pre = _MockPositionedPopulation(rng.uniform(0, 10, (3, 200)), "Pre")
+    post = _MockPositionedPopulation(rng.uniform(0, 10, (3, 150)), "Post")
+    blocks = list()
+    for cutoff in (None, 2.0):
+        connector = DistanceDependentProbabilityConnector(
+            "d <= 2", cutoff_distance=cutoff)
+        connector.set_space(_MockSpace())
+        connector.set_projection_information(
+            pre_population=pre, post_population=post, rng=MockRNG(),
+            machine_time_step=1000)
+        connector.set_weights_and_delays(1.0, 1.0)
+        pre_slices = [Slice(i, i + 49) for i in range(0, 200, 50)]
+        post_slices = [Slice(i, i + 49) for i in range(0, 150, 50)]
+        connections = list()
+        for post_slice in post_slices:
+            n_from_pre = connector.get_n_connections_from_pre_vertex_maximum(
+                post_slice)
+            for pre_slice in pre_slices:
+                block = connector.create_synaptic_block(
+                    pre_slices, 0, post_slices, 0, pre_slice, post_slice, 0)
+                if len(block):
+                    assert max(numpy.bincount(block["source"])) <= n_from_pre
+                connections.extend(zip(block["source"], block["target"]))
+        blocks.append(sorted(connections))
+    assert blocks[0] == blocks[1]
+
+
+@pytest.mark.parametrize("space", [
+    _MockSpace(),
+    _MockSpace(axes=(0, 1), scale_factor=1.5, offset=(1.0, -2.0, 0.5)),
+    _MockSpace(periodic_boundaries=((0, 10), None, (0, 10)))])
+def test_distance_dependent_cutoff_matches_distances(space):
+    MockSimulator.setup()
+    rng = numpy.random.RandomState(1)
+    pre = _MockPositionedPopulation(rng.uniform(0, 10, (3, 200)), "Pre")
+    post = _MockPositionedPopulation(rng.uniform(0, 10, (3, 150)), "Post")
+    connector = DistanceDependentProbabilityConnector(
+        "d <= 2", cutoff_distance=2.0)
+    connector.set_space(space)
+    connector.set_projection_information(
+        pre_population=pre, post_population=post, rng=MockRNG(),
+        machine_time_step=1000)
+    connector.set_weights_and_delays(1.0, 1.0)
+    pre_slices = [Slice(i, i + 49) for i in range(0, 200, 50)]
+    post_slices = [Slice(i, i + 49) for i in range(0, 150, 50)]
+    connections = list()
+    for post_slice in post_slices:
+        for pre_slice in pre_slices:
+            block = connector.create_synaptic_block(
+                pre_slices, 0, post_slices, 0, pre_slice, post_slice, 0)
+            connections.extend(zip(block["source"], block["target"]))
+
+    # Every pair within the distance, as found by the space, is connected
+    expected = numpy.argwhere(numpy.reshape(
+        space.distances(pre.positions, post.positions), (200, 150)) <= 2.0)
+    assert len(expected) > 0
+    assert sorted(connections) == [tuple(pair) for pair in expected]
+
+
+@pytest.mark.parametrize("space", [
+    _MockSpace(),
+    _MockSpace(axes=(0, 2), scale_factor=0.5, offset=(2.0, 0.0, -1.0)),
+    _MockSpace(periodic_boundaries=((0, 10), (0, 10), None))])
+def test_small_world_sparse_mask(space):
+    MockSimulator.setup()
+    rng = numpy.random.RandomState(0)
+    pre = _MockPositionedPopulation(rng.uniform(0, 10, (3, 200)), "Pre")
+    post = _MockPositionedPopulation(rng.uniform(0, 10, (3, 150)), "Post")
+    mask = numpy.reshape(
+        space.distances(pre.positions, post.positions), (200, 150)) < 2.5
+    assert numpy.any(mask)
+    connector = SmallWorldConnector(2.5, 0.0)
+    connector.set_space(space)
+    connector.set_projection_information(
+        pre_population=pre, post_population=post, rng=MockRNG(),
+        machine_time_step=1000)
+    connector.set_weights_and_delays(1.0, 1.0)
+    assert connector.get_n_connections_to_post_vertex_maximum() == \
+        numpy.amax(numpy.sum(mask, axis=0))
+    pre_slices = [Slice(i, i + 49) for i in range(0, 200, 50)]
+    post_slices = [Slice(i, i + 49) for i in range(0, 150, 50)]
+    for post_slice in post_slices:
+        assert connector.get_n_connections_from_pre_vertex_maximum(
+            post_slice) == numpy.amax(numpy.sum(
+                mask[:, post_slice.as_slice], axis=1))
+        for pre_slice in pre_slices:
+            block = connector.create_synaptic_block(
+                pre_slices, 0, post_slices, 0, pre_slice, post_slice, 0)
+            sources, targets = numpy.where(
+                mask[pre_slice.as_slice, post_slice.as_slice])
+            assert numpy.array_equal(
+                block["source"], sources + pre_slice.lo_atom)
+            assert numpy.array_equal(
+                block["target"], targets + post_slice.lo_atom)
+
+
+@pytest.mark.parametrize("create_connector, exact", [
+    (lambda: FromListConnector(
+        [(i, (i * 7) % 50) for i in range(0, 200, 3)]), True),
+    (lambda: FixedNumberPreConnector(1), True),
+    (lambda: FixedNumberPostConnector(1), True),
+    (lambda: SmallWorldConnector(1.5, 0.0), True),
+    (lambda: DistanceDependentProbabilityConnector("d < 1.5"), False),
+    (lambda: DistanceDependentProbabilityConnector(
+        "d < 1.5", cutoff_distance=1.5), False)])
+def test_could_connect(create_connector, exact):
+    MockSimulator.setup()
+    numpy.random.seed(0)
+    rng = numpy.random.RandomState(0)
+    pre = _MockPositionedPopulation(rng.uniform(0, 10, (3, 200)), "Pre")
+    post = _MockPositionedPopulation(rng.uniform(0, 10, (3, 50)), "Post")
+    connector = create_connector()
+    connector.set_space(_MockSpace())
+    connector.set_projection_information(
+        pre_population=pre, post_population=post, rng=MockRNG(),
+        machine_time_step=1000)
+    connector.set_weights_and_delays(1.0, 1.0)
+    pre_slices = [Slice(i, i + 9) for i in range(0, 200, 10)]
+    post_slices = [Slice(i, i + 4) for i in range(0, 50, 5)]
+    n_filtered = 0
+    for pre_slice in pre_slices:
+        for post_slice in post_slices:
+            could_connect = connector.could_connect(pre_slice, post_slice)
+            block = connector.create_synaptic_block(
+                pre_slices, 0, post_slices, 0, pre_slice, post_slice, 0)
+            if exact:
+                assert could_connect == (len(block) > 0)
+            elif not could_connect:
+                assert len(block) == 0
+            if not could_connect:
+                n_filtered += 1
+    assert n_filtered > 0
@@ -0,0 +1,196 @@
+import threading
+import time
+import numpy
+from pacman.model.graphs.common import Slice
+from pacman.model.placements import Placement
+from spynnaker.pyNN.models.neural_projections.connectors \
+    import AbstractConnector
+from spynnaker.pyNN.models.pynn_projection_common import PyNNProjectionCommon
+from unittests.mocks import MockSimulator
+
+# The Ethernet chips of the boards, and the number of edges on each
+_ETHERNETS = [(0, 0), (8, 4), (4, 8)]
+_N_EDGES_PER_BOARD = 3
+
+
+class _MockVertex(object):
+    def __init__(self, label):
+        self.label = label
+        self.n_atoms = 10 * len(_ETHERNETS) * _N_EDGES_PER_BOARD
+
+
+class _MockMachineEdge(object):
+    def __init__(self, index, post_vertex):
+        self.index = index
+        self.post_vertex = post_vertex
+
+
+class _MockProjectionEdge(object):
+    def __init__(self):
+        self.pre_vertex = _MockVertex("Pre")
+        self.post_vertex = _MockPostVertex()
+
+
+class _MockPostVertex(_MockVertex):
+    """ A post-vertex that reads the connections of each edge after a delay\
+        that makes the edges of later boards finish first
+    """
+
+    def __init__(self):
+        super(_MockPostVertex, self).__init__("Post")
+        self.timeout_arguments = list()
+        self.thread_names = set()
+        self.lock = threading.Lock()
+
+    def get_connections_from_machine(
+            self, transceiver, placement, machine_edge, graph_mapper,
+            routing_infos, synapse_info, machine_time_step,
+            using_extra_monitor_cores, placements=None, data_receiver=None,
+            sender_extra_monitor_core_placement=None,
+            extra_monitor_cores_for_router_timeout=None,
+            handle_time_out_configuration=True, fixed_routes=None):
+        with self.lock:
+            self.timeout_arguments.append(handle_time_out_configuration)
+            self.thread_names.add(threading.current_thread().name)
+        time.sleep(0.01 * (len(_ETHERNETS) - placement.x // 4))
+        connections = numpy.zeros(
+            10, dtype=AbstractConnector.NUMPY_SYNAPSES_DTYPE)
+        connections["source"] = machine_edge.index
+        connections["target"] = numpy.arange(10) + machine_edge.index * 10
+        return connections
+
+
+class _MockReceiver(object):
+    def __init__(self):
+        self.n_set = 0
+        self.n_unset = 0
+
+    def set_cores_for_data_extraction(
+            self, transceiver, extra_monitor_cores, placements):
+        self.n_set += 1
+
+    def unset_cores_for_data_extraction(
+            self, transceiver, extra_monitor_cores, placements):
+        self.n_unset += 1
+
+
+class _MockControl(object):
+    """ A simulator that has run on several boards with extra monitors
+    """
+
+    def __init__(self, n_readback_threads):
+        self.config = MockSimulator().config
+        self.config.set(
+            "Simulation", "n_readback_threads", str(n_readback_threads))
+        self.has_ran = True
+        self.transceiver = object()
+        self.routing_infos = None
+        self.machine_time_step = 1000
+        self.fixed_routes = None
+
+        # The edges of each board, interleaved between the boards
+        self.edges = list()
+        self.post_placements = dict()
+        self.slices = dict()
+        for i in range(_N_EDGES_PER_BOARD):
+            for ethernet_x, ethernet_y in _ETHERNETS:
+                index = len(self.edges)
+                post_vertex = _MockVertex("Post{}".format(index))
+                self.edges.append(_MockMachineEdge(index, post_vertex))
+                self.post_placements[post_vertex] = Placement(
+                    post_vertex, ethernet_x + i, ethernet_y, 1)
+                self.slices[post_vertex] = Slice(index * 10, index * 10 + 9)
+        self.receivers = {
+            ethernet: _MockReceiver() for ethernet in _ETHERNETS}
+
+    # As the graph mapper
+    def get_machine_edges(self, app_edge):
+        return self.edges
+
+    def get_slice(self, vertex):
+        return self.slices[vertex]
+
+    # As the placements
+    def get_placement_of_vertex(self, vertex):
+        return self.post_placements[vertex]
+
+    # As the machine
+    def get_chip_at(self, x, y):
+        for ethernet_x, ethernet_y in _ETHERNETS:
+            if ethernet_x <= x < ethernet_x + _N_EDGES_PER_BOARD and \
+                    y == ethernet_y:
+                return _MockEthernetChip(ethernet_x, ethernet_y)
+        raise KeyError((x, y))
+
+    @property
+    def graph_mapper(self):
+        return self
+
+    @property
+    def placements(self):
+        return self
+
+    @property
+    def machine(self):
+        return self
+
+    def get_generated_output(self, name):
+        if name == "UsingAdvancedMonitorSupport":
+            return True
+        if name == "MemoryMCGatherVertexToEthernetConnectedChipMapping":
+            return self.receivers
+        if name == "MemoryExtraMonitorToChipMapping":
+            # The extra monitor of each chip is itself placed on the chip
+            return {
+                (placement.x, placement.y): placement.vertex
+                for placement in self.post_placements.values()}
+        return list()
+
+    def _locate_receivers_from_projections(
+            self, projections, gatherers, extra_monitors_per_chip):
+        return [(gatherers[ethernet], frozenset()) for ethernet in _ETHERNETS]
+
+
+class _MockEthernetChip(object):
+    def __init__(self, nearest_ethernet_x, nearest_ethernet_y):
+        self.nearest_ethernet_x = nearest_ethernet_x
+        self.nearest_ethernet_y = nearest_ethernet_y
+
+
+def _read_connections(n_readback_threads):
+    MockSimulator.setup()
+    projection_edge = _MockProjectionEdge()
+    control = _MockControl(n_readback_threads)
+    projection = PyNNProjectionCommon.__new__(PyNNProjectionCommon)
+    projection._spinnaker_control = control
+    projection._projection_edge = projection_edge
+    projection._synapse_information = None
+    projection._virtual_connection_list = None
+    holder = projection._get_synaptic_data(True, ["source", "target"])
+    return control, projection_edge.post_vertex, holder
+
+
+def test_readback_threads():
+    for n_readback_threads in (1, len(_ETHERNETS)):
+        control, post_vertex, holder = _read_connections(n_readback_threads)
+
+        # The router timeouts are set once per board around all the reads,
+        # rather than for each block read
+        for receiver in control.receivers.values():
+            assert receiver.n_set == 1
+            assert receiver.n_unset == 1
+        assert post_vertex.timeout_arguments == [False] * len(control.edges)
+        assert len(post_vertex.thread_names) == n_readback_threads
+
+        # The connections are added board by board, in the order of the
+        # edges on each board, however long each board takes to read
+        order = [edge.index for ethernet in _ETHERNETS
+                 for edge in control.edges
+                 if (control.post_placements[edge.post_vertex].x -
+                     ethernet[0]) in range(_N_EDGES_PER_BOARD) and
+                 control.post_placements[edge.post_vertex].y == ethernet[1]]
+        assert [connections["source"][0]
+                for connections in holder.connections] == order
+        assert [(post_slice.lo_atom, post_slice.hi_atom)
+                for post_slice in holder._post_slices] == [
+            (index * 10, index * 10 + 9) for index in order]
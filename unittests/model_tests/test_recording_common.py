@@ -0,0 +1,217 @@
+import os
+import shutil
+import tempfile
+import numpy
+import pytest
+from spinn_front_end_common.utilities import globals_variables
+from spinn_front_end_common.utilities.exceptions import ConfigurationException
+from spynnaker.pyNN.models.common import (
+    AbstractNeuronRecordable, AbstractSpikeRecordable,
+    AbstractWindowedRecordable)
+from spynnaker.pyNN.models.common.recording_export import \
+    read_exported_matrix
+from spynnaker.pyNN.models.pynn_population_common import \
+    PyNNPopulationCommon
+from spynnaker.pyNN.models.recording_common import RecordingCommon
+from spynnaker.pyNN.utilities.spynnaker_failed_state \
+    import SpynnakerFailedState
+from unittests.mocks import MockSimulator
+
+# The spikes of the population, as (neuron ID, time)
+_SPIKES = numpy.array([
+    [0, 1.0], [3, 2.0], [1, 4.0], [3, 5.0], [2, 7.0], [0, 9.0]])
+
+
+class _MockRecordable(AbstractSpikeRecordable, AbstractNeuronRecordable):
+    """ A vertex that can only read all of its recording at once
+    """
+    n_atoms = 4
+
+    def is_recording_spikes(self):
+        return True
+
+    def set_recording_spikes(
+            self, new_state=True, sampling_interval=None, indexes=None):
+        pass
+
+    def clear_spike_recording(self, buffer_manager, placements, graph_mapper):
+        pass
+
+    def get_spikes(
+            self, placements, graph_mapper, buffer_manager, machine_time_step):
+        return _SPIKES
+
+    def get_spikes_sampling_interval(self):
+        return 1.0
+
+    def get_recordable_variables(self):
+        return ["v"]
+
+    def is_recording(self, variable):
+        return variable in ("spikes", "v")
+
+    def set_recording(self, variable, new_state=True, sampling_interval=None,
+                      indexes=None):
+        pass
+
+    def clear_recording(self, variable, buffer_manager, placements,
+                        graph_mapper):
+        pass
+
+    def get_data(self, variable, n_machine_time_steps, placements,
+                 graph_mapper, buffer_manager, machine_time_step):
+        return (numpy.arange(40.0).reshape(10, 4), [0, 1, 2, 3], 1.0)
+
+    def get_neuron_sampling_interval(self, variable):
+        return 1.0
+
+
+class _MockWindowedRecordable(_MockRecordable, AbstractWindowedRecordable):
+    """ A vertex that reads its recording in windows, and records the reads
+    """
+
+    def __init__(self):
+        self.reads = list()
+
+    def get_spikes_in_window(
+            self, placements, graph_mapper, buffer_manager, machine_time_step,
+            neuron_range=None, time_range=None):
+        self.reads.append(("spikes", neuron_range, time_range))
+        return _SPIKES[:2]
+
+    def get_spike_counts(
+            self, placements, graph_mapper, buffer_manager, machine_time_step,
+            neuron_range=None, time_range=None):
+        self.reads.append(("counts", neuron_range, time_range))
+        return numpy.ones(self.n_atoms, dtype="int64")
+
+    def get_spike_histogram(
+            self, bin_width, n_machine_time_steps, placements, graph_mapper,
+            buffer_manager, machine_time_step, neuron_range=None,
+            time_range=None):
+        self.reads.append(("histogram", neuron_range, time_range))
+        return numpy.zeros(0), numpy.zeros(0)
+
+    def get_data_in_window(
+            self, variable, n_machine_time_steps, placements, graph_mapper,
+            buffer_manager, machine_time_step, neuron_range=None,
+            time_range=None):
+        self.reads.append((variable, neuron_range, time_range))
+        return (numpy.zeros((0, 0)), [], 1.0)
+
+    def export_data(
+            self, variable, filename, n_machine_time_steps, placements,
+            graph_mapper, buffer_manager, machine_time_step,
+            neuron_range=None, time_range=None):
+        self.reads.append(("export", neuron_range, time_range))
+
+    def get_data_statistics(
+            self, variable, window, n_machine_time_steps, placements,
+            graph_mapper, buffer_manager, machine_time_step,
+            neuron_range=None, time_range=None):
+        self.reads.append(("statistics", neuron_range, time_range))
+        return (numpy.zeros((0, 0)), numpy.zeros((0, 0)), [],
+                numpy.zeros(0))
+
+
+class _MockRunSimulator(MockSimulator):
+    """ A simulator that has run for 10 ms
+    """
+    has_ran = True
+    use_virtual_board = False
+    placements = None
+    graph_mapper = None
+    buffer_manager = None
+    machine_time_step = 1000
+    no_machine_time_steps = 10
+
+    def add_extraction_timing(self, timing):
+        pass
+
+
+class _MockPopulation(object):
+    def __init__(self, vertex):
+        self._vertex = vertex
+        self.size = vertex.n_atoms
+
+
+class _MockPyNNPopulation(PyNNPopulationCommon, RecordingCommon):
+    """ A population which is its own recorder
+    """
+
+    def __init__(self, vertex):
+        self._vertex = vertex
+        RecordingCommon.__init__(self, self)
+
+
+def _recording(vertex, has_ran=True):
+    globals_variables.set_failed_state(SpynnakerFailedState())
+    simulator = _MockRunSimulator()
+    simulator.has_ran = has_ran
+    globals_variables.set_simulator(simulator)
+    return RecordingCommon(_MockPopulation(vertex))
+
+
+def test_windowed_vertex_reads_windows():
+    vertex = _MockWindowedRecordable()
+    recording = _recording(vertex)
+    spikes = recording._get_spikes((1, 3), (2.0, 8.0))
+    assert numpy.array_equal(spikes, _SPIKES[:2])
+    recording._get_recorded_matrix("v", (1, 3), (2.0, 8.0))
+    recording._get_spike_counts((1, 3), (2.0, 8.0))
+    assert vertex.reads == [
+        ("spikes", (1, 3), (2.0, 8.0)), ("v", (1, 3), (2.0, 8.0)),
+        ("counts", (1, 3), (2.0, 8.0))]
+
+
+def test_other_vertex_filters_all_spikes():
+    recording = _recording(_MockRecordable())
+    spikes = recording._get_spikes((1, 3), (2.0, 8.0))
+    assert numpy.array_equal(spikes, [[1, 4.0], [2, 7.0]])
+    assert numpy.array_equal(
+        recording._get_spike_counts((1, 3), (2.0, 8.0)), [0, 1, 1, 0])
+
+
+def test_export_of_variable_not_recorded():
+    vertex = _MockWindowedRecordable()
+    recording = _recording(vertex)
+    with pytest.raises(ConfigurationException):
+        recording._export_recorded_data("gsyn_exc", "unused")
+    assert vertex.reads == []
+
+
+def test_export_before_run_starts_at_time_range():
+    vertex = _MockWindowedRecordable()
+    vertex.get_neuron_sampling_interval = lambda variable: 2.0
+    recording = _recording(vertex, has_ran=False)
+    directory = tempfile.mkdtemp()
+    try:
+        filename = os.path.join(directory, "v")
+        recording._export_recorded_data("v", filename, time_range=(5, 9))
+        _, _, sampling_interval, first_time, _ = read_exported_matrix(
+            filename)
+        assert sampling_interval == 2.0
+        assert first_time == 6.0
+    finally:
+        shutil.rmtree(directory)
+    assert vertex.reads == []
+
+
+def test_spike_counts_of_population():
+    vertex = _MockWindowedRecordable()
+    _recording(vertex)
+    population = _MockPyNNPopulation(vertex)
+    assert population.get_spike_counts() == {0: 1, 1: 1, 2: 1, 3: 1}
+    assert vertex.reads == [("counts", None, None)]
+    assert population.get_spike_counts(_SPIKES) == {0: 2, 1: 1, 2: 1, 3: 2}
+
+
+def test_statistics_windows_start_at_time_range():
+    recording = _recording(_MockRecordable())
+    recording._get_recorded_matrix = lambda variable, neuron_range, \
+        time_range: (numpy.arange(8.0).reshape(4, 2), [0, 1], 2.0)
+    means, _, indexes, times = recording._get_recorded_statistics(
+        "v", window=4.0, time_range=(5, 13))
+    assert numpy.array_equal(means, [[1.0, 2.0], [5.0, 6.0]])
+    assert indexes == [0, 1]
+    assert numpy.array_equal(times, [6.0, 10.0])
@@ -0,0 +1,137 @@
+from pacman.model.graphs.common import Slice
+from pacman.model.placements import Placement, Placements
+from spynnaker.pyNN.models.abstract_models \
+    import AbstractMeasuresRecordingUsage
+from spynnaker.pyNN.models.common.recording_usage import RecordingUsage
+from spynnaker.pyNN.models.spike_source.spike_source_poisson_machine_vertex \
+    import SpikeSourcePoissonMachineVertex
+from spynnaker.pyNN.models.spike_source.spike_source_poisson_vertex \
+    import SpikeSourcePoissonVertex
+from spynnaker.pyNN.overridden_pacman_functions.recording_usage_gatherer \
+    import RecordingUsageGatherer
+from unittests.mocks import MockSimulator
+
+
+class _MockApplicationVertex(AbstractMeasuresRecordingUsage):
+    def get_recording_sdram_per_timestep(
+            self, vertex_slice, n_machine_time_steps, machine_time_step):
+        return [vertex_slice.n_atoms * 10]
+
+    def get_recording_usage_key(
+            self, vertex_slice, n_machine_time_steps, machine_time_step):
+        return "test_{}".format(vertex_slice.lo_atom)
+
+
+class _MockGraphMapper(object):
+    def __init__(self, application_vertex, slices):
+        self._application_vertex = application_vertex
+        self._slices = slices
+
+    def get_application_vertex(self, vertex):
+        return self._application_vertex
+
+    def get_slice(self, vertex):
+        return self._slices[vertex]
+
+
+class _MockDataPointer(object):
+    def __init__(self, n_bytes):
+        self._n_bytes = n_bytes
+
+    def read_all(self):
+        return bytearray(self._n_bytes)
+
+
+class _MockBufferManager(object):
+    def __init__(self, n_bytes):
+        self._n_bytes = n_bytes
+
+    def get_data_for_vertex(self, placement, region):
+        return _MockDataPointer(self._n_bytes[placement.p]), False
+
+
+def test_recording_usage(tmpdir):
+    filename = str(tmpdir.join("usage", "usage.json"))
+    usage = RecordingUsage(filename)
+    assert usage.get_bytes_per_timestep("a", 0) is None
+    usage.add_measurement("a", 0, 12.5)
+    usage.add_measurement("a", 0, 10.0)
+    usage.add_measurement("a", 1, 3.0)
+    usage.save()
+
+    # The most measured is kept, and read back
+    usage = RecordingUsage(filename)
+    assert usage.get_bytes_per_timestep("a", 0) == 12.5
+    assert usage.get_bytes_per_timestep("a", 1) == 3.0
+    assert usage.get_bytes_per_timestep("b", 0) is None
+    assert RecordingUsage.open(filename) is RecordingUsage.open(filename)
+
+    assert RecordingUsage.get_size(100, None, 0.25) == 100
+    assert RecordingUsage.get_size(100, 20.0, 0.25) == 25
+
+    # The space is never less than that measured, even if that is more than
+    # the estimate
+    assert RecordingUsage.get_size(100, 90.0, 0.25) == 113
+    assert RecordingUsage.get_size(100, 20.0, -0.5) == 20
+
+
+def test_recording_usage_gatherer(tmpdir):
+    filename = str(tmpdir.join("usage.json"))
+    simulator = MockSimulator.setup()
+    simulator.config.set("Recording", "recording_usage_file", filename)
+    vertices = [
+        SpikeSourcePoissonMachineVertex(
+            None, True, 0, 0, label="v{}".format(i))
+        for i in range(2)]
+    slices = {vertices[0]: Slice(0, 9), vertices[1]: Slice(10, 14)}
+    placements = Placements([
+        Placement(vertex, 0, 0, p + 1) for p, vertex in enumerate(vertices)])
+
+    # Over 100 timesteps, the first uses 40% of the 100 bytes per timestep
+    # reserved, and the second 96% of the 50 reserved
+    items = RecordingUsageGatherer()(
+        placements, _MockGraphMapper(_MockApplicationVertex(), slices),
+        _MockBufferManager({1: 4000, 2: 4800}), 100, 1000, True)
+    fractions = {
+        item.names[0]: item for item in items
+        if item.names[-1] == "Fraction_of_reservation_used"}
+    assert fractions["0_0_1_v0"].value == 0.4
+    assert not fractions["0_0_1_v0"].report
+    assert fractions["0_0_2_v1"].value == 0.96
+    assert fractions["0_0_2_v1"].report
+
+    usage = RecordingUsage(filename)
+    assert usage.get_bytes_per_timestep("test_0", 0) == 40.0
+    assert usage.get_bytes_per_timestep("test_10", 0) == 48.0
+
+
+def test_poisson_recording_sized_from_usage(tmpdir):
+    filename = str(tmpdir.join("usage.json"))
+    simulator = MockSimulator.setup()
+    config = simulator.config
+    config.set("Recording", "recording_usage_file", filename)
+    vertex_slice = Slice(0, 9)
+
+    def poisson():
+        return SpikeSourcePoissonVertex(
+            10, None, "poisson", 100.0, 0.0, 1000.0, None, 256, None)
+
+    # A timestep of 4 bytes of header and 4 bytes per spike of 10 neurons
+    # is measured to use 16 bytes per timestep over 100 timesteps
+    vertex = poisson()
+    RecordingUsage.open(filename).add_measurement(
+        vertex.get_recording_usage_key(vertex_slice, 100, 1000), 0, 16.0)
+    estimate = vertex._estimate_max_spikes_per_ts(vertex_slice, 100, 1000)
+
+    # Without buffered recording, the estimate is used
+    assert vertex._max_spikes_per_ts(vertex_slice, 100, 1000) == estimate
+
+    # With buffered recording, runs of the same length have space for the
+    # spikes measured with the margin, even though more than the estimate
+    config.set("Buffers", "enable_buffered_recording", "True")
+    config.set("Buffers", "spike_buffer_size", "1048576")
+    config.set("Buffers", "buffer_size_before_receive", "16384")
+    vertex = poisson()
+    assert vertex._max_spikes_per_ts(vertex_slice, 100, 1000) == 4
+    assert vertex._max_spikes_per_ts(vertex_slice, 200, 1000) == \
+        vertex._estimate_max_spikes_per_ts(vertex_slice, 200, 1000)
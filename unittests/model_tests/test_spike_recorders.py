@@ -0,0 +1,134 @@
+import struct
+import time
+
+import numpy
+import pytest
+
+from pacman.model.graphs.common.slice import Slice
+from spinnman.messages.eieio import EIEIOType
+from spynnaker.pyNN.models.common import (
+    EIEIOSpikeRecorder, MultiSpikeRecorder, recording_utils)
+
+_BASE_KEY = 0x10000
+_MS_PER_TICK = 0.1
+
+
+def _make_spikes(n_neurons, n_steps, rate, seed=0):
+    """ Make random spikes, as a list of arrays of the neurons spiking in\
+        each timestep; a neuron may spike more than once in a timestep
+    """
+    rng = numpy.random.RandomState(seed)
+    p_spike = rate * _MS_PER_TICK / 1000.0
+    return [rng.randint(0, n_neurons, rng.binomial(n_neurons * 2, p_spike))
+            for _ in range(n_steps)]
+
+
+def _expected(step_spikes, lo_atom):
+    ids = numpy.concatenate(step_spikes) + lo_atom
+    times = numpy.concatenate([
+        numpy.repeat(step * _MS_PER_TICK, len(neurons))
+        for step, neurons in enumerate(step_spikes)])
+    result = numpy.column_stack((ids, times))
+    return result[numpy.lexsort((times, ids))]
+
+
+def _make_multi_spike_data(step_spikes, n_words):
+    """ Write spikes as the multi-spike recording does: for each timestep,\
+        the time and number of blocks, then a bitfield block for each time\
+        that any neuron spikes in the timestep
+    """
+    data = bytearray()
+    for step, neurons in enumerate(step_spikes):
+        blocks = list()
+        for neuron in neurons:
+            for block in blocks:
+                if not block[neuron // 32] & (1 << (neuron % 32)):
+                    break
+            else:
+                block = numpy.zeros(n_words, dtype="<u4")
+                blocks.append(block)
+            block[neuron // 32] |= 1 << (neuron % 32)
+        data += struct.pack("<II", step, len(blocks))
+        for block in blocks:
+            data += block.tobytes()
+    return data
+
+
+def _make_eieio_spike_data(step_spikes):
+    """ Write spikes as the EIEIO recording does: for each timestep, the\
+        length of the packet, the time and the packet of keys
+    """
+    data = bytearray()
+    header_flags = EIEIOType.KEY_32_BIT.value << 2
+    for step, neurons in enumerate(step_spikes):
+        for start in range(0, len(neurons), 63):
+            keys = numpy.array(
+                neurons[start:start + 63] + _BASE_KEY, dtype="<u4")
+            data += struct.pack(
+                "<IIBB", 2 + (len(keys) * 4), step, len(keys), header_flags)
+            data += keys.tobytes()
+    return data
+
+
+def _get_multi_spikes(data, vertex_slice, n_words):
+    spike_ids = list()
+    spike_times = list()
+    MultiSpikeRecorder._process_spike_data(
+        vertex_slice, _MS_PER_TICK, n_words, data, spike_ids, spike_times)
+    if not spike_ids:
+        return numpy.zeros((0, 2))
+    spike_ids = numpy.hstack(spike_ids)
+    spike_times = numpy.hstack(spike_times)
+    result = numpy.dstack((spike_ids, spike_times))[0]
+    return result[numpy.lexsort((spike_times, spike_ids))]
+
+
+def _get_eieio_spikes(data, vertex_slice):
+    results = list()
+    EIEIOSpikeRecorder._process_spike_data(
+        vertex_slice, data, _MS_PER_TICK, _BASE_KEY, results)
+    if not results:
+        return numpy.empty(shape=(0, 2))
+    result = numpy.vstack(results)
+    return result[numpy.lexsort((result[:, 1], result[:, 0]))]
+
+
+@pytest.mark.parametrize("n_neurons,rate", [(1, 100), (40, 0), (100, 500)])
+def test_multi_spike_recorder(n_neurons, rate):
+    vertex_slice = Slice(10, 10 + n_neurons - 1)
+    n_words = (n_neurons + 31) // 32
+    step_spikes = _make_spikes(n_neurons, 200, rate)
+    spikes = _get_multi_spikes(
+        _make_multi_spike_data(step_spikes, n_words), vertex_slice, n_words)
+    assert numpy.array_equal(spikes, _expected(step_spikes, 10))
+
+
+@pytest.mark.parametrize("n_neurons,rate", [(1, 100), (40, 0), (100, 500)])
+def test_eieio_spike_recorder(n_neurons, rate):
+    vertex_slice = Slice(10, 10 + n_neurons - 1)
+    step_spikes = _make_spikes(n_neurons, 200, rate)
+    spikes = _get_eieio_spikes(
+        _make_eieio_spike_data(step_spikes), vertex_slice)
+    assert numpy.array_equal(spikes, _expected(step_spikes, 10))
+
+
+@pytest.mark.parametrize("n_threads", [1, 4])
+def test_decode_in_threads(n_threads):
+    rng = numpy.random.RandomState(0)
+    delays = rng.uniform(0, 0.01, 50)
+    read_order = list()
+
+    def read(item):
+        read_order.append(item)
+        if item % 7 == 0:
+            return None
+        return item, delays[item]
+
+    def decode(item, delay):
+        time.sleep(delay)
+        return item * 2
+
+    results = list(recording_utils.decode_in_threads(
+        range(50), read, decode, n_threads))
+    assert read_order == list(range(50))
+    assert results == [item * 2 for item in range(50) if item % 7 != 0]
@@ -0,0 +1,117 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy
+
+from pacman.model.graphs.common import Slice
+
+from spynnaker.pyNN.models.neural_projections.connectors \
+    import FromFileConnector, FromListConnector
+import spynnaker.pyNN.utilities.connection_file as connection_file
+from unittests.mocks import MockSimulator, MockPopulation
+
+
+class _FromFileConnector(FromFileConnector):
+
+    def get_reader(self, file):  # @ReservedAssignment
+        raise NotImplementedError
+
+
+class TestConnectionFile(unittest.TestCase):
+
+    def setUp(self):
+        self._dir = tempfile.mkdtemp()
+        rng = numpy.random.RandomState(0)
+        n_connections = 5000
+        self._n_pre = 200
+        self._n_post = 100
+        self._conn_list = numpy.column_stack((
+            rng.randint(0, self._n_pre, n_connections),
+            rng.randint(0, self._n_post, n_connections),
+            rng.uniform(-1.0, 1.0, n_connections),
+            rng.randint(1, 16, n_connections)))
+
+    def tearDown(self):
+        shutil.rmtree(self._dir)
+
+    def _write_text_file(self):
+        filename = os.path.join(self._dir, "connections.txt")
+        with open(filename, "w") as f:
+            f.write("# columns = ['i', 'j', 'weight', 'delay']\n")
+            for source, target, weight, delay in self._conn_list:
+                f.write("{:d} {:d} {:.17g} {:g}\n".format(
+                    int(source), int(target), weight, delay))
+        return filename
+
+    def test_convert(self):
+        text_filename = self._write_text_file()
+        binary_filename = os.path.join(self._dir, "connections.bin")
+        saved_chunk_size = connection_file._CHUNK_SIZE
+        connection_file._CHUNK_SIZE = 300
+        try:
+            connection_file.convert_text_connection_file(
+                text_filename, binary_filename)
+        finally:
+            connection_file._CHUNK_SIZE = saved_chunk_size
+        self.assertTrue(
+            connection_file.is_binary_connection_file(binary_filename))
+        self.assertFalse(
+            connection_file.is_binary_connection_file(text_filename))
+        self.assertEqual(
+            sorted(os.listdir(self._dir)),
+            ["connections.bin", "connections.txt"])
+
+        connections, n_sources = \
+            connection_file.read_binary_connection_file(binary_filename)
+        order = numpy.lexsort((self._conn_list[:, 0], self._conn_list[:, 1]))
+        self.assertEqual(n_sources, numpy.max(self._conn_list[:, 0]) + 1)
+        for i, name in enumerate(("source", "target", "weight", "delay")):
+            self.assertTrue(numpy.array_equal(
+                connections[name], self._conn_list[order, i]))
+
+    def test_mapped_connector(self):
+        binary_filename = os.path.join(self._dir, "connections.bin")
+        connection_file.write_binary_connection_file(
+            binary_filename, self._conn_list)
+
+        MockSimulator.setup()
+        file_connector = _FromFileConnector(binary_filename)
+        list_connector = FromListConnector(self._conn_list[:, :2])
+        for connector in (file_connector, list_connector):
+            connector.set_projection_information(
+                pre_population=MockPopulation(self._n_pre, "Pre"),
+                post_population=MockPopulation(self._n_post, "Post"),
+                rng=None, machine_time_step=1000)
+        file_connector.set_weights_and_delays(None, None)
+        list_connector.set_weights_and_delays(
+            self._conn_list[:, 2], self._conn_list[:, 3])
+
+        for name in ("get_delay_maximum", "get_delay_variance",
+                     "get_weight_mean", "get_weight_maximum",
+                     "get_weight_variance",
+                     "get_n_connections_to_post_vertex_maximum"):
+            self.assertAlmostEqual(
+                getattr(file_connector, name)(),
+                getattr(list_connector, name)())
+
+        pre_slices = [Slice(i, i + 63) for i in range(0, self._n_pre, 64)]
+        post_slices = [Slice(i, i + 31) for i in range(0, self._n_post, 32)]
+        for post_slice in post_slices:
+            self.assertEqual(
+                file_connector.get_n_connections_from_pre_vertex_maximum(
+                    post_slice, 1, 8),
+                list_connector.get_n_connections_from_pre_vertex_maximum(
+                    post_slice, 1, 8))
+            for pre_slice in pre_slices:
+                file_block = file_connector.create_synaptic_block(
+                    pre_slices, 0, post_slices, 0, pre_slice, post_slice, 0)
+                list_block = list_connector.create_synaptic_block(
+                    pre_slices, 0, post_slices, 0, pre_slice, post_slice, 0)
+                self.assertTrue(numpy.array_equal(
+                    numpy.sort(file_block), numpy.sort(list_block)))
+
+
+if __name__ == "__main__":
+    unittest.main()